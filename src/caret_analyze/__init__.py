@@ -18,6 +18,7 @@ from pathlib import Path
 from .architecture import Architecture, check_procedure
 from .common import init_logger, Progress
 from .infra.lttng import Lttng, LttngEventFilter
+from .record import RecordsCache
 from .runtime.application import Application
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     'Lttng',
     'LttngEventFilter',
     'Progress',
+    'RecordsCache',
     'check_procedure'
 ]
 
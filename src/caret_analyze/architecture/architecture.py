@@ -14,8 +14,11 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from functools import cached_property
 import logging
-from typing import Callable, Collection, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (Any, Callable, Collection, Dict, Hashable, Iterator, List,
+                    Optional, Sequence, Tuple, TYPE_CHECKING, TypeVar, Union)
 
 from .architecture_exporter import ArchitectureExporter
 from .architecture_loaded import NodeValuesLoaded
@@ -27,55 +30,105 @@ from .struct import (CommunicationStruct, ExecutorStruct,
 from .struct.callback import (
     CallbackStruct, ServiceCallbackStruct, SubscriptionCallbackStruct, TimerCallbackStruct)
 from ..common import Summarizable, Summary, type_check_decorator, Util
-from ..exceptions import InvalidArgumentError, ItemNotFoundError, UnsupportedTypeError
+from ..exceptions import (InvalidArgumentError, ItemNotFoundError, MultipleItemFoundError,
+                          UnsupportedTypeError)
 from ..value_objects import (CallbackGroupStructValue, CallbackStructValue,
                              CommunicationStructValue, ExecutorStructValue,
                              NodePathStructValue, NodeStructValue, PathStructValue,
                              PublisherStructValue, ServiceStructValue, SubscriptionStructValue)
 
+if TYPE_CHECKING:
+    from ..infra.lttng.lttng import Lttng
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class Architecture(Summarizable):
+    # Value tuples and name indexes cached until the architecture is modified.
+    _CACHED_ATTRIBUTES = (
+        '_node_values', '_executor_values', '_communication_values', '_path_values',
+        '_callback_group_values', '_callback_values', '_node_index', '_executor_index',
+        '_callback_group_index', '_callback_index', '_communication_index', '_path_index',
+        '_node_path_index',
+    )
+
+    # When the depth is 15, the process takes only a few seconds.
+    DEFAULT_SEARCH_DEPTH = 15
+
     def __init__(
         self,
         file_type: str,
-        file_path: str,
+        file_path: Union[str, Lttng],
+        max_workers: Optional[int] = None,
+        sidecar: bool = False,
     ) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        file_type : str
+            'yaml', 'yml', 'lttng' or 'ctf'.
+        file_path : Union[str, Lttng]
+            Architecture file path or trace directory.
+            For lttng, an already loaded Lttng can be given instead of the trace directory,
+            so that the trace is not read again.
+        max_workers : Optional[int]
+            The maximum number of worker processes to find node paths of each node.
+            Node paths are found serially if None or 1, or if other threads are running.
+        sidecar : bool
+            For yaml, restore the loaded structures from '<file_path>.pickle'
+            without parsing the yaml, if it was created from the same yaml content.
+            Otherwise, the yaml is loaded and the sidecar is created.
+
+        """
         from .architecture_reader_factory import ArchitectureReaderFactory
         from .architecture_loaded import ArchitectureLoaded
+        from .architecture_sidecar import ArchitectureSidecar
 
         # /parameter events and /rosout measurements are not yet supported.
         ignore_topics: List[str] = IGNORE_TOPICS
 
-        reader = ArchitectureReaderFactory.create_instance(
-            file_type, file_path)
-        loaded = ArchitectureLoaded(reader, ignore_topics)
+        architecture_sidecar: Optional[ArchitectureSidecar] = None
+        loaded: Optional[ArchitectureLoaded] = None
+        if sidecar and file_type in ['yaml', 'yml'] and isinstance(file_path, str):
+            architecture_sidecar = ArchitectureSidecar(file_path)
+            loaded = architecture_sidecar.load()
+
+        restored = loaded is not None
+        if loaded is None:
+            reader = ArchitectureReaderFactory.create_instance(
+                file_type, file_path)
+            loaded = ArchitectureLoaded(reader, ignore_topics, max_workers)
 
         self._nodes: List[NodeStruct] = loaded.nodes
         self._communications: List[CommunicationStruct] = loaded.communications
         self._executors: List[ExecutorStruct] = loaded.executors
         self._paths = loaded.paths
-        self._verify(self._nodes)
+        if not restored:
+            self._verify(self._nodes)
+            if architecture_sidecar is not None:
+                architecture_sidecar.save(loaded)
 
     def get_node(self, node_name: str) -> NodeStructValue:
         try:
-            return Util.find_one(lambda x: x.node_name == node_name, self.nodes)
+            return _find_indexed(self._node_index, node_name)
         except ItemNotFoundError:
             msg = 'Failed to find node. '
             msg += f'node_name: {node_name}'
             raise ItemNotFoundError(msg)
 
     def get_executor(self, executor_name: str) -> ExecutorStructValue:
-        return Util.find_one(lambda x: x.executor_name == executor_name, self.executors)
+        return _find_indexed(self._executor_index, executor_name)
 
     def get_callback_group(self, callback_group_name: str) -> CallbackGroupStructValue:
-        return Util.find_one(lambda x: x.callback_group_name == callback_group_name,
-                             self.callback_groups)
+        return _find_indexed(self._callback_group_index, callback_group_name)
 
     @property
     def callback_groups(self) -> Tuple[CallbackGroupStructValue, ...]:
-        return tuple(Util.flatten(_.callback_groups for _ in self.executors))
+        return self._callback_group_values
 
     @property
     def callback_group_names(self) -> Tuple[str, ...]:
@@ -88,11 +141,11 @@ class Architecture(Summarizable):
         return tuple(sorted(topic_names))
 
     def get_callback(self, callback_name: str) -> CallbackStructValue:
-        return Util.find_one(lambda x: x.callback_name == callback_name, self.callbacks)
+        return _find_indexed(self._callback_index, callback_name)
 
     @property
     def callbacks(self) -> Tuple[CallbackStructValue, ...]:
-        return tuple(Util.flatten(_.callbacks for _ in self.callback_groups))
+        return self._callback_values
 
     def get_communication(
         self,
@@ -100,22 +153,18 @@ class Architecture(Summarizable):
         subscription_node_name: str,
         topic_name: str
     ) -> CommunicationStructValue:
-        def is_target_comm(comm: CommunicationStructValue):
-            return comm.publish_node_name == publisher_node_name and \
-                comm.subscribe_node_name == subscription_node_name and \
-                comm.topic_name == topic_name
-
-        return Util.find_one(is_target_comm, self.communications)
+        return _find_indexed(
+            self._communication_index,
+            (publisher_node_name, subscription_node_name, topic_name))
 
     def get_path(self, path_name: str) -> PathStructValue:
-        if path_name not in self.path_names:
+        if path_name not in self._path_index:
             raise InvalidArgumentError(f'Failed to get named path. {path_name} not exist.')
 
-        named_path: PathStruct = Util.find_one(lambda x: x._path_name == path_name, self._paths)
-        return named_path.to_value()
+        return _find_indexed(self._path_index, path_name)
 
     def add_path(self, path_name: str, path_info: PathStructValue) -> None:
-        if path_name in self.path_names:
+        if path_name in self._path_index:
             raise InvalidArgumentError('Failed to add named path. Duplicate path name.')
 
         child: List[Union[NodePathStruct, CommunicationStruct]] = []
@@ -156,9 +205,10 @@ class Architecture(Summarizable):
 
         named_path_info = PathStruct(path_name, child)
         self._paths.append(named_path_info)
+        self._clear_cache()
 
     def remove_path(self, path_name: str) -> None:
-        if path_name not in self.path_names:
+        if path_name not in self._path_index:
             raise InvalidArgumentError(f'Failed to remove named path. {path_name} not exist.')
 
         idx = None
@@ -168,6 +218,7 @@ class Architecture(Summarizable):
 
         if idx is not None:
             self._paths.pop(idx)
+        self._clear_cache()
 
     def update_path(self, path_name: str, path: PathStructValue) -> None:
         if path.path_name is None:
@@ -178,7 +229,7 @@ class Architecture(Summarizable):
 
     @property
     def nodes(self) -> Tuple[NodeStructValue, ...]:
-        return tuple(v.to_value() for v in self._nodes)
+        return self._node_values
 
     @property
     def node_names(self) -> Tuple[str, ...]:
@@ -186,7 +237,7 @@ class Architecture(Summarizable):
 
     @property
     def executors(self) -> Tuple[ExecutorStructValue, ...]:
-        return tuple(v.to_value() for v in self._executors)
+        return self._executor_values
 
     @property
     def executor_names(self) -> Tuple[str, ...]:
@@ -194,7 +245,7 @@ class Architecture(Summarizable):
 
     @property
     def paths(self) -> Tuple[PathStructValue, ...]:
-        return tuple([v.to_value() for v in self._paths])
+        return self._path_values
 
     @property
     def path_names(self) -> Tuple[str, ...]:
@@ -202,7 +253,7 @@ class Architecture(Summarizable):
 
     @property
     def communications(self) -> Tuple[CommunicationStructValue, ...]:
-        return tuple(v.to_value() for v in self._communications)
+        return self._communication_values
 
     @property
     def publishers(self) -> Tuple[PublisherStructValue, ...]:
@@ -219,6 +270,71 @@ class Architecture(Summarizable):
         services = Util.flatten(_.services for _ in self.nodes)
         return tuple(sorted(services, key=lambda x: x.service_name))
 
+    @cached_property
+    def _node_values(self) -> Tuple[NodeStructValue, ...]:
+        return tuple(v.to_value() for v in self._nodes)
+
+    @cached_property
+    def _executor_values(self) -> Tuple[ExecutorStructValue, ...]:
+        return tuple(v.to_value() for v in self._executors)
+
+    @cached_property
+    def _communication_values(self) -> Tuple[CommunicationStructValue, ...]:
+        return tuple(v.to_value() for v in self._communications)
+
+    @cached_property
+    def _path_values(self) -> Tuple[PathStructValue, ...]:
+        return tuple(v.to_value() for v in self._paths)
+
+    @cached_property
+    def _callback_group_values(self) -> Tuple[CallbackGroupStructValue, ...]:
+        return tuple(Util.flatten(_.callback_groups for _ in self.executors))
+
+    @cached_property
+    def _callback_values(self) -> Tuple[CallbackStructValue, ...]:
+        return tuple(Util.flatten(_.callbacks for _ in self.callback_groups))
+
+    @cached_property
+    def _node_index(self) -> Dict[str, List[NodeStructValue]]:
+        return _create_index(self.nodes, lambda x: x.node_name)
+
+    @cached_property
+    def _executor_index(self) -> Dict[str, List[ExecutorStructValue]]:
+        return _create_index(self.executors, lambda x: x.executor_name)
+
+    @cached_property
+    def _callback_group_index(self) -> Dict[str, List[CallbackGroupStructValue]]:
+        return _create_index(self.callback_groups, lambda x: x.callback_group_name)
+
+    @cached_property
+    def _callback_index(self) -> Dict[str, List[CallbackStructValue]]:
+        return _create_index(self.callbacks, lambda x: x.callback_name)
+
+    @cached_property
+    def _communication_index(
+        self
+    ) -> Dict[Tuple[str, str, str], List[CommunicationStructValue]]:
+        return _create_index(
+            self.communications,
+            lambda x: (x.publish_node_name, x.subscribe_node_name, x.topic_name))
+
+    @cached_property
+    def _node_path_index(
+        self
+    ) -> Dict[Tuple[str, Optional[str], Optional[str]], List[NodePathStructValue]]:
+        return _create_index(
+            (path for node in self.nodes for path in node.paths),
+            lambda x: (x.node_name, x.subscribe_topic_name, x.publish_topic_name))
+
+    @cached_property
+    def _path_index(self) -> Dict[str, List[PathStructValue]]:
+        return _create_index(
+            (v for v in self.paths if v.path_name is not None), lambda x: x.path_name)
+
+    def _clear_cache(self) -> None:
+        for attr in self._CACHED_ATTRIBUTES:
+            self.__dict__.pop(attr, None)
+
     @property
     def summary(self) -> Summary:
         return Summary({
@@ -236,14 +352,17 @@ class Architecture(Summarizable):
         max_node_depth: Optional[int] = None,
         node_filter: Optional[Callable[[str], bool]] = None,
         communication_filter: Optional[Callable[[str], bool]] = None,
+        bidirectional: bool = False,
     ) -> List[PathStructValue]:
-        from .graph_search import NodePathSearcher
-        for node_name in node_names:
-            if node_name not in self.node_names:
-                raise ItemNotFoundError(f'Failed to find node. {node_name}')
-
-        default_depth = 15  # When the depth is 15, the process takes only a few seconds.
+        default_depth = self.DEFAULT_SEARCH_DEPTH
         max_node_depth = max_node_depth or default_depth
+        # Validate arguments before printing messages.
+        paths_iter = self.iter_search_paths(
+            *node_names,
+            max_node_depth=max_node_depth,
+            node_filter=node_filter,
+            communication_filter=communication_filter,
+            bidirectional=bidirectional)
 
         # Print message before search
         msg_detail_page = (
@@ -264,10 +383,7 @@ class Architecture(Summarizable):
             print(msg)
 
         # Search
-        path_searcher = NodePathSearcher(
-            tuple(self._nodes), tuple(self._communications), node_filter, communication_filter)
-        paths = [v.to_value() for v in
-                 path_searcher.search(*node_names, max_node_depth=max_node_depth)]
+        paths = list(paths_iter)
 
         # Print message after search
         msg = f'A search up to depth {max_node_depth} has been completed. '
@@ -281,13 +397,118 @@ class Architecture(Summarizable):
 
         return paths
 
+    def iter_search_paths(
+        self,
+        *node_names: str,
+        max_node_depth: Optional[int] = None,
+        node_filter: Optional[Callable[[str], bool]] = None,
+        communication_filter: Optional[Callable[[str], bool]] = None,
+        bidirectional: bool = False,
+    ) -> Iterator[PathStructValue]:
+        """
+        Search paths lazily.
+
+        Same as search_paths, except that paths are yielded as they are found
+        and no messages are printed.
+
+        Parameters
+        ----------
+        node_names : Tuple[str, ...]
+            node names which the paths pass through in order.
+        max_node_depth : Optional[int]
+            maximum depth of the search. DEFAULT_SEARCH_DEPTH is used if None.
+        node_filter : Optional[Callable[[str], bool]]
+            nodes are searched only if node_filter returns True for the node name.
+        communication_filter : Optional[Callable[[str], bool]]
+            communications are searched only if communication_filter returns True
+            for the topic name.
+        bidirectional : bool
+            If True, paths between each pair of adjacent node_names are searched
+            from both ends and joined (meet-in-the-middle). The same paths are returned
+            in a different order. This is faster for deep searches in large graphs.
+
+        Returns
+        -------
+        Iterator[PathStructValue]
+            searched paths.
+
+        Raises
+        ------
+        ItemNotFoundError
+            Occurs when the given node is not found.
+
+        """
+        from .graph_search import NodePathSearcher
+        existing_node_names = set(self.node_names)
+        for node_name in node_names:
+            if node_name not in existing_node_names:
+                raise ItemNotFoundError(f'Failed to find node. {node_name}')
+
+        max_node_depth = max_node_depth or self.DEFAULT_SEARCH_DEPTH
+
+        path_searcher = NodePathSearcher(
+            tuple(self._nodes), tuple(self._communications), node_filter, communication_filter)
+        # Node paths and communications shared between paths are converted only once.
+        child_values: Dict[Union[NodePathStruct, CommunicationStruct],
+                           Union[NodePathStructValue, CommunicationStructValue]] = {}
+        return (v.to_value(child_values) for v in
+                path_searcher.iter_search(
+                    *node_names, max_node_depth=max_node_depth, bidirectional=bidirectional))
+
     @type_check_decorator
     def combine_path(
         self,
         path_left: PathStructValue,
-        path_right: PathStructValue
+        path_right: PathStructValue,
+        *paths: PathStructValue
     ) -> PathStructValue:
+        """
+        Combine paths.
+
+        Parameters
+        ----------
+        path_left : PathStructValue
+            left path
+        path_right : PathStructValue
+            right path
+        paths : PathStructValue
+            Further paths. All paths are combined from left to right as a chain.
+
+        Returns
+        -------
+        PathStructValue
+            combined path
+
+        """
+        combine_path = self._create_combine_path()
+        combined = combine_path.combine(path_left, path_right)
+        for path in paths:
+            combined = combine_path.combine(combined, path)
+        return combined
+
+    @type_check_decorator
+    def combine_path_pairs(
+        self,
+        path_pairs: Sequence[Tuple[PathStructValue, PathStructValue]]
+    ) -> List[PathStructValue]:
+        """
+        Combine each pair of paths.
+
+        Parameters
+        ----------
+        path_pairs : Sequence[Tuple[PathStructValue, PathStructValue]]
+            pairs of left path and right path
 
+        Returns
+        -------
+        List[PathStructValue]
+            combined paths in the order of the pairs
+
+        """
+        combine_path = self._create_combine_path()
+        return [combine_path.combine(left, right) for left, right in path_pairs]
+
+    def _create_combine_path(self) -> CombinePath:
         def get_node(node_name: str) -> NodeStructValue:
             return self.get_node(node_name)
 
@@ -298,8 +519,16 @@ class Architecture(Summarizable):
         ) -> CommunicationStructValue:
             return self.get_communication(publish_node_name, subscribe_node_name, topic_name)
 
-        combine_path = CombinePath(get_node, get_communication)
-        return combine_path.combine(path_left, path_right)
+        def get_node_path(
+            node_name: str,
+            subscribe_topic_name: Optional[str],
+            publish_topic_name: Optional[str]
+        ) -> Optional[NodePathStructValue]:
+            node_paths = self._node_path_index.get(
+                (node_name, subscribe_topic_name, publish_topic_name))
+            return node_paths[0] if node_paths else None
+
+        return CombinePath(get_node, get_communication, get_node_path)
 
     @staticmethod
     def _verify(nodes: Collection[NodeStruct]) -> None:
@@ -357,6 +586,7 @@ class Architecture(Summarizable):
                                                    'publisher_topic_name': publish_topic_name})
 
             node.update_node_path(NodeValuesLoaded._search_node_paths(node, context_reader))
+            self._clear_cache()
 
     def assign_publisher_and_callback(self, node_name: str,
                                       publish_topic_name: str, callback_name: str):
@@ -366,6 +596,7 @@ class Architecture(Summarizable):
 
         node.update_node_path(NodeValuesLoaded._search_node_paths(node,
                               AssignContextReader(node)))
+        self._clear_cache()
 
     def assign_variable_passings(self, node_name: str,
                                  callback_name_write: str, callback_name_read: str):
@@ -375,6 +606,7 @@ class Architecture(Summarizable):
 
         node.update_node_path(NodeValuesLoaded._search_node_paths(node,
                               AssignContextReader(node)))
+        self._clear_cache()
 
     def rename_callback(self, src: str, dst: str) -> None:
         """
@@ -393,6 +625,7 @@ class Architecture(Summarizable):
                          Util.flatten([e.callback_groups for e in self._executors]))
         c: CallbackStruct = Util.find_similar_one(src, cb_s, lambda x: x.callback_name)
         c.callback_name = dst
+        self._clear_cache()
 
     def rename_node(self, src: str, dst: str) -> None:
         """
@@ -414,6 +647,7 @@ class Architecture(Summarizable):
 
         for c in self._communications:
             c.rename_node(src, dst)
+        self._clear_cache()
 
     def rename_path(self, src: str, dst: str) -> None:
         """
@@ -429,6 +663,7 @@ class Architecture(Summarizable):
         """
         p: PathStruct = Util.find_similar_one(src, self._paths, lambda x: x.path_name)
         p.path_name = dst
+        self._clear_cache()
 
     def rename_executor(self, src: str, dst: str) -> None:
         """
@@ -444,6 +679,7 @@ class Architecture(Summarizable):
         """
         e: ExecutorStruct = Util.find_similar_one(src, self._executors, lambda x: x.executor_name)
         e.executor_name = dst
+        self._clear_cache()
 
     def rename_topic(self, src: str, dst: str) -> None:
         """
@@ -465,6 +701,27 @@ class Architecture(Summarizable):
 
         for c in self._communications:
             c.rename_topic(src, dst)
+        self._clear_cache()
+
+
+def _create_index(
+    items: Any,
+    key: Callable[[T], Hashable]
+) -> Dict[Any, List[T]]:
+    index: Dict[Any, List[T]] = defaultdict(list)
+    for item in items:
+        index[key(item)].append(item)
+    return dict(index)
+
+
+def _find_indexed(index: Dict[Any, List[T]], key: Hashable) -> T:
+    # Same errors as Util.find_one.
+    items = index.get(key)
+    if not items:
+        raise ItemNotFoundError('Failed find item.')
+    if len(items) >= 2:
+        raise MultipleItemFoundError('Failed to identify item.')
+    return items[0]
 
 
 class AssignContextReader(ArchitectureReader):
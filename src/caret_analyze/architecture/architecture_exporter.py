@@ -51,7 +51,11 @@ class ArchitectureExporter():
     def __str__(self) -> str:
         import yaml
         obj = self.to_dict()
-        return yaml.dump(obj, indent=2, default_flow_style=False, sort_keys=False)
+        # libyaml bindings are much faster than the pure-Python implementation.
+        # They represent the same values, but may wrap long or non-ASCII strings differently.
+        dumper = getattr(yaml, 'CDumper', yaml.Dumper)
+        return yaml.dump(obj, Dumper=dumper, indent=2, default_flow_style=False,
+                         sort_keys=False)
 
     def to_dict(self):
         named_path_dicts = NamedPathsDicts(self._named_path_values)
@@ -14,9 +14,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
 from logging import getLogger, WARN
-from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+import multiprocessing
+from threading import active_count, RLock
+from typing import (Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple,
+                    Union)
 
 from caret_analyze.architecture.struct.message_context import CallbackChainStruct
 
@@ -52,6 +57,9 @@ from ..value_objects import (CallbackGroupValue,
 
 logger = getLogger(__name__)
 
+# Indices of subscription, publisher and child (is_callback, index) of a node path.
+NodePathIndices = Tuple[Optional[int], Optional[int], Optional[Tuple[Tuple[bool, int], ...]]]
+
 
 def indexed_name(base_name: str, i: int, num_digit: int):
     index_str = str(i).zfill(num_digit)
@@ -62,13 +70,14 @@ class ArchitectureLoaded():
     def __init__(
         self,
         reader: ArchitectureReader,
-        ignore_topics: List[str]
+        ignore_topics: List[str],
+        max_workers: Optional[int] = None
     ) -> None:
 
         topic_ignored_reader = TopicIgnoredReader(reader, ignore_topics)
 
         self._nodes: List[NodeStruct]
-        nodes_loaded = NodeValuesLoaded(topic_ignored_reader)
+        nodes_loaded = NodeValuesLoaded(topic_ignored_reader, max_workers)
 
         self._nodes = nodes_loaded.data
 
@@ -268,6 +277,7 @@ class NodeValuesLoaded():
     def __init__(
         self,
         reader: ArchitectureReader,
+        max_workers: Optional[int] = None,
     ) -> None:
         self._reader = reader
         nodes_struct: List[NodeStruct] = []
@@ -283,15 +293,21 @@ class NodeValuesLoaded():
 
         nodes = self._remove_duplicated(nodes)
 
+        nodes_loaded: List[Tuple[NodeStruct, CallbacksLoaded, CallbackGroupsLoaded]] = []
         for node in Progress.tqdm(nodes, 'Loading nodes.'):
             try:
-                node, cb_loaded, cbg_loaded = self._create_node(node, reader)
-                nodes_struct.append(node)
-                self._cb_loaded.append(cb_loaded)
-                self._cbg_loaded.append(cbg_loaded)
+                nodes_loaded.append(self._create_node_struct(node, reader))
             except Error as e:
                 logger.warn(f'Failed to load node. node_name = {node.node_name}, {e}')
 
+        # Node paths of each node are independent, so they are found concurrently.
+        NodePathsCache.prefetch([node for node, _, _ in nodes_loaded], max_workers)
+
+        for node_struct, cb_loaded, cbg_loaded in nodes_loaded:
+            nodes_struct.append(self._node_paths_added(node_struct, reader))
+            self._cb_loaded.append(cb_loaded)
+            self._cbg_loaded.append(cbg_loaded)
+
         nodes_struct = sorted(nodes_struct, key=lambda x: x.node_name)
         self._data = nodes_struct
 
@@ -432,6 +448,16 @@ class NodeValuesLoaded():
         node: NodeValue,
         reader: ArchitectureReader,
     ) -> Tuple[NodeStruct, CallbacksLoaded, CallbackGroupsLoaded]:
+        node_struct, callbacks_loaded, cbg_loaded = \
+            NodeValuesLoaded._create_node_struct(node, reader)
+        node_struct = NodeValuesLoaded._node_paths_added(node_struct, reader)
+        return node_struct, callbacks_loaded, cbg_loaded
+
+    @staticmethod
+    def _create_node_struct(
+        node: NodeValue,
+        reader: ArchitectureReader,
+    ) -> Tuple[NodeStruct, CallbacksLoaded, CallbackGroupsLoaded]:
 
         callbacks_loaded = CallbacksLoaded(reader, node)
 
@@ -459,7 +485,13 @@ class NodeValuesLoaded():
             node.node_name, list(publishers), list(subscriptions), list(services),
             list(timers), [], list(callback_groups), list(variable_passings)
         )
+        return node_struct, callbacks_loaded, cbg_loaded
 
+    @staticmethod
+    def _node_paths_added(
+        node_struct: NodeStruct,
+        reader: ArchitectureReader,
+    ) -> NodeStruct:
         try:
             node_paths = NodeValuesLoaded._search_node_paths(node_struct, reader)
             node_path_added = NodeStruct(
@@ -471,17 +503,51 @@ class NodeValuesLoaded():
                 node_struct.variable_passings
             )
 
-            return node_path_added, callbacks_loaded, cbg_loaded
+            return node_path_added
         except Error as e:
             # If the node path registration fails,
             # it returns with empty node path.
             logger.warning(e)
-            return node_struct, callbacks_loaded, cbg_loaded
+            return node_struct
 
     @staticmethod
     def _search_node_paths(
         node: NodeStruct,
-        reader: ArchitectureReader
+        reader: ArchitectureReader,
+        use_cache: bool = True
+    ) -> List[NodePathStruct]:
+
+        if use_cache:
+            node_paths = NodePathsCache.get_or_find(node, NodeValuesLoaded._find_node_paths)
+        else:
+            node_paths = NodeValuesLoaded._find_node_paths(node)
+
+        message_contexts: List[MessageContextStruct] = []
+        message_contexts += list(MessageContextsLoaded(reader, node, node_paths).data)
+
+        # assign message context to each node paths
+        node_paths = NodeValuesLoaded._message_context_assigned(
+            node_paths, message_contexts)
+
+        logger.info(f'\n{len(node_paths)} paths found in {node.node_name}.')
+
+        logger.info('\n-----\n[message context assigned]')
+        for path in node_paths:
+            message_context = None
+            if path.message_context is not None:
+                message_context = path.message_context.type_name
+
+            logger.info(
+                f'subscribe: {path.subscribe_topic_name}, '
+                f'publish: {path.publish_topic_name}, '
+                f'message_context: {message_context}'
+            )
+
+        return node_paths
+
+    @staticmethod
+    def _find_node_paths(
+        node: NodeStruct,
     ) -> List[NodePathStruct]:
 
         node_paths: List[NodePathStruct] = []
@@ -489,6 +555,8 @@ class NodeValuesLoaded():
         # add callback-graph paths
         logger.info('[callback_chain]')
         node_paths += list(CallbackPathSearched(node).data)
+        added_pub_sub_pairs: Set[Tuple[Optional[str], Optional[str]]] = {
+            (n.publish_topic_name, n.subscribe_topic_name) for n in node_paths}
 
         # add pub-sub pair graph paths
         logger.info('\n[pub-sub pair]')
@@ -496,13 +564,12 @@ class NodeValuesLoaded():
         subs = node.subscriptions
         node_path_pub_sub_pairs = NodePathCreated(subs, pubs).data
         for node_path in node_path_pub_sub_pairs:
-            added_pub_sub_pairs = [(n.publish_topic_name, n.subscribe_topic_name)
-                                   for n in node_paths]
             pub_sub_pair = (node_path.publish_topic_name,
                             node_path.subscribe_topic_name)
 
             if pub_sub_pair not in added_pub_sub_pairs:
                 node_paths.append(node_path)
+                added_pub_sub_pairs.add(pub_sub_pair)
 
                 logger.info(
                     'Path Added: '
@@ -513,8 +580,6 @@ class NodeValuesLoaded():
         # add dummy node paths
         logger.info('\n[dummy paths]')
         for pub in node.publishers:
-            added_pub_sub_pairs = [(n.publish_topic_name, n.subscribe_topic_name)
-                                   for n in node_paths]
             node_path = NodePathStruct(
                 node.node_name,
                 None,
@@ -526,6 +591,7 @@ class NodeValuesLoaded():
                             node_path.subscribe_topic_name)
             if pub_sub_pair not in added_pub_sub_pairs:
                 node_paths.append(node_path)
+                added_pub_sub_pairs.add(pub_sub_pair)
                 logger.info(
                     'Path Added: '
                     f'subscribe: {node_path.subscribe_topic_name}, '
@@ -533,8 +599,6 @@ class NodeValuesLoaded():
                 )
 
         for sub in node.subscriptions:
-            added_pub_sub_pairs = [(n.publish_topic_name, n.subscribe_topic_name)
-                                   for n in node_paths]
             node_path = NodePathStruct(
                 node.node_name,
                 sub,
@@ -546,33 +610,13 @@ class NodeValuesLoaded():
                             node_path.subscribe_topic_name)
             if pub_sub_pair not in added_pub_sub_pairs:
                 node_paths.append(node_path)
+                added_pub_sub_pairs.add(pub_sub_pair)
                 logger.info(
                     'Path Added: '
                     f'subscribe: {node_path.subscribe_topic_name}, '
                     f'publish: {node_path.publish_topic_name}'
                 )
 
-        message_contexts: List[MessageContextStruct] = []
-        message_contexts += list(MessageContextsLoaded(reader, node, node_paths).data)
-
-        # assign message context to each node paths
-        node_paths = NodeValuesLoaded._message_context_assigned(
-            node_paths, message_contexts)
-
-        logger.info(f'\n{len(node_paths)} paths found in {node.node_name}.')
-
-        logger.info('\n-----\n[message context assigned]')
-        for path in node_paths:
-            message_context = None
-            if path.message_context is not None:
-                message_context = path.message_context.type_name
-
-            logger.info(
-                f'subscribe: {path.subscribe_topic_name}, '
-                f'publish: {path.publish_topic_name}, '
-                f'message_context: {message_context}'
-            )
-
         return node_paths
 
     @staticmethod
@@ -1543,6 +1587,209 @@ class PathValuesLoaded():
         return self._data
 
 
+class NodePathsCache:
+    """
+    Cache of node paths found in each node, before message contexts are assigned.
+
+    Node paths are stored as indices of the publishers, subscriptions, callbacks
+    and variable passings of the node, keyed by the node contents.
+    They are restored for a node with the same contents,
+    e.g. when the same architecture is read again or other nodes are edited.
+
+    """
+
+    max_entries = 4096
+    min_prefetch_nodes = 8
+
+    _entries: OrderedDict[Hashable, List[NodePathIndices]] = OrderedDict()
+    _lock = RLock()
+
+    @classmethod
+    def get_or_find(
+        cls,
+        node: NodeStruct,
+        find: Callable[[NodeStruct], List[NodePathStruct]],
+    ) -> List[NodePathStruct]:
+        """
+        Get cached node paths, or find and store them.
+
+        Parameters
+        ----------
+        node : NodeStruct
+            Target node.
+        find : Callable[[NodeStruct], List[NodePathStruct]]
+            Function to find node paths when they are not cached.
+
+        Returns
+        -------
+        List[NodePathStruct]
+            Node paths which refer to the structs of the given node.
+
+        """
+        key = cls._key(node)
+        with cls._lock:
+            indices = cls._entries.get(key)
+            if indices is not None:
+                cls._entries.move_to_end(key)
+
+        if indices is not None:
+            return [cls._restore(node, _) for _ in indices]
+
+        node_paths = find(node)
+        try:
+            indices = cls._to_indices(node, node_paths)
+        except KeyError:
+            # Node paths refer to structs which are not owned by the node.
+            return node_paths
+
+        cls._put(key, indices)
+        return node_paths
+
+    @classmethod
+    def prefetch(
+        cls,
+        nodes: Sequence[NodeStruct],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Find node paths of the nodes concurrently and store them.
+
+        Nodes are independent of each other, so forked processes find node paths
+        and send back their indices.
+        Nothing is done if max_workers is not given, there are only a few nodes to find,
+        fork is unavailable or other threads are running, since forking a threaded
+        process may deadlock.
+        If the workers fail, nothing is stored.
+        In these cases, node paths are found serially by get_or_find.
+
+        Parameters
+        ----------
+        nodes : Sequence[NodeStruct]
+            Target nodes.
+        max_workers : Optional[int]
+            The maximum number of worker processes.
+            Node paths are not prefetched if None or 1.
+
+        """
+        global _prefetch_nodes
+
+        if max_workers is None or max_workers <= 1 or len(nodes) < cls.min_prefetch_nodes or \
+                'fork' not in multiprocessing.get_all_start_methods():
+            return
+        if active_count() > 1:
+            logger.info('Other threads are running. Node paths are found serially.')
+            return
+
+        pending: Dict[Hashable, NodeStruct] = {}
+        for node in nodes:
+            key = cls._key(node)
+            with cls._lock:
+                if key in cls._entries:
+                    continue
+            pending.setdefault(key, node)
+        if len(pending) < cls.min_prefetch_nodes:
+            return
+
+        # Forked workers inherit the nodes, so only the found indices are pickled.
+        _prefetch_nodes = list(pending.values())
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers, mp_context=multiprocessing.get_context('fork'))
+            with executor:
+                indices_list = list(
+                    executor.map(_find_prefetch_node_path_indices, range(len(pending))))
+        except Exception as e:
+            # e.g. BrokenProcessPool or a pickling error.
+            logger.warning(f'Failed to prefetch node paths. They are found serially. {e!r}')
+            return
+        finally:
+            _prefetch_nodes = []
+
+        for key, indices in zip(pending, indices_list):
+            if indices is not None:
+                cls._put(key, indices)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Discard all cached node paths."""
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def _put(cls, key: Hashable, indices: List[NodePathIndices]) -> None:
+        with cls._lock:
+            cls._entries[key] = indices
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.max_entries:
+                cls._entries.popitem(last=False)
+
+    @staticmethod
+    def _key(node: NodeStruct) -> Hashable:
+        return (
+            node.node_name,
+            tuple(_.to_value() for _ in node.publishers),
+            tuple(_.to_value() for _ in node.subscriptions),
+            None if node.callback_groups is None
+            else tuple(_.to_value() for _ in node.callback_groups),
+            None if node.variable_passings is None
+            else tuple(_.to_value() for _ in node.variable_passings),
+        )
+
+    @staticmethod
+    def _to_indices(node: NodeStruct, node_paths: List[NodePathStruct]) -> List[NodePathIndices]:
+        def index_map(items: Optional[Sequence]) -> Dict[int, int]:
+            return {id(item): i for i, item in enumerate(items or [])}
+
+        sub_indices = index_map(node.subscriptions)
+        pub_indices = index_map(node.publishers)
+        cb_indices = index_map(node.callbacks)
+        vp_indices = index_map(node.variable_passings)
+
+        def child_index(item: Union[CallbackStruct, VariablePassingStruct]) -> Tuple[bool, int]:
+            if isinstance(item, CallbackStruct):
+                return True, cb_indices[id(item)]
+            return False, vp_indices[id(item)]
+
+        return [
+            (
+                None if path.subscription is None else sub_indices[id(path.subscription)],
+                None if path.publisher is None else pub_indices[id(path.publisher)],
+                None if path.child is None else tuple(child_index(_) for _ in path.child),
+            )
+            for path in node_paths
+        ]
+
+    @staticmethod
+    def _restore(node: NodeStruct, indices: NodePathIndices) -> NodePathStruct:
+        sub_index, pub_index, child_indices = indices
+        child: Optional[List[Union[CallbackStruct, VariablePassingStruct]]] = None
+        if child_indices is not None:
+            callbacks = node.callbacks or []
+            variable_passings = node.variable_passings or []
+            child = [
+                callbacks[i] if is_callback else variable_passings[i]
+                for is_callback, i in child_indices
+            ]
+        return NodePathStruct(
+            node.node_name,
+            None if sub_index is None else node.subscriptions[sub_index],
+            None if pub_index is None else node.publishers[pub_index],
+            child,
+            None)
+
+
+_prefetch_nodes: Sequence[NodeStruct] = []
+
+
+def _find_prefetch_node_path_indices(index: int) -> Optional[List[NodePathIndices]]:
+    node = _prefetch_nodes[index]
+    try:
+        return NodePathsCache._to_indices(node, NodeValuesLoaded._find_node_paths(node))
+    except (Error, KeyError):
+        # Found again serially to report the error in the main process.
+        return None
+
+
 class CallbackPathSearched():
     def __init__(
         self,
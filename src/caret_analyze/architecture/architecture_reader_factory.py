@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Union
+
+from ..exceptions import UnsupportedTypeError
 from ..infra.lttng.architecture_reader_lttng import ArchitectureReaderLttng
+from ..infra.lttng.lttng import Lttng
 from ..infra.yaml.architecture_reader_yaml import ArchitectureReaderYaml
 
 
 class ArchitectureReaderFactory:
 
     @staticmethod
-    def create_instance(file_type: str, file_path: str):
+    def create_instance(file_type: str, file_path: Union[str, Lttng]):
         if file_type in ['yaml', 'yml']:
+            if not isinstance(file_path, str):
+                raise UnsupportedTypeError(
+                    f'unsupported file_path for {file_type}: {type(file_path).__name__}')
             return ArchitectureReaderYaml(file_path)
         elif file_type in ['lttng', 'ctf']:
             return ArchitectureReaderLttng(file_path)
@@ -0,0 +1,132 @@
+# Copyright 2021 Research Institute of Systems Planning, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
+from logging import getLogger
+import os
+import pickle
+from typing import Optional
+
+from . import architecture_loaded, struct
+from .architecture_loaded import ArchitectureLoaded
+from .. import value_objects
+
+logger = getLogger(__name__)
+
+
+class ArchitectureSidecar:
+    """
+    Binary sidecar cache of an architecture file.
+
+    Structures loaded from an architecture file are pickled next to the file,
+    after a plain text header with the hashes of the file content
+    and of the source code of the pickled structures.
+    They are restored without parsing the file again as long as both are unchanged.
+    The header is checked before unpickling,
+    but sidecars are executable pickles, so load only the ones created by yourself.
+
+    """
+
+    # Increment when the pickled structures are changed.
+    FORMAT_VERSION = 1
+    SUFFIX = '.pickle'
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        file_path : str
+            Architecture file path. The sidecar is '<file_path>.pickle'.
+
+        """
+        with open(file_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self._header = (
+            f'{self.__class__.__name__} {self.FORMAT_VERSION} '
+            f'{self._source_digest()} {digest}\n'
+        ).encode()
+        self._sidecar_path = file_path + self.SUFFIX
+
+    @property
+    def sidecar_path(self) -> str:
+        return self._sidecar_path
+
+    @property
+    def header(self) -> bytes:
+        return self._header
+
+    def load(self) -> Optional[ArchitectureLoaded]:
+        """
+        Restore loaded structures.
+
+        Returns
+        -------
+        Optional[ArchitectureLoaded]
+            Restored structures.
+            None if the sidecar is missing, or created from another file content
+            or by another version of the structures.
+
+        """
+        try:
+            with open(self._sidecar_path, 'rb') as f:
+                if f.read(len(self._header)) != self._header:
+                    return None
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f'Failed to load sidecar. {self._sidecar_path}, {e}')
+            return None
+
+    def save(self, loaded: ArchitectureLoaded) -> None:
+        """
+        Store loaded structures.
+
+        Parameters
+        ----------
+        loaded : ArchitectureLoaded
+            Structures loaded from the architecture file.
+
+        """
+        tmp_path = f'{self._sidecar_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(self._header)
+                pickle.dump(loaded, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._sidecar_path)
+        except (OSError, pickle.PicklingError, RecursionError) as e:
+            logger.warning(f'Failed to save sidecar. {self._sidecar_path}, {e}')
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    @lru_cache
+    def _source_digest() -> str:
+        # Sidecars pickled by another version of the structures are not restored.
+        paths = [architecture_loaded.__file__]
+        for package in [struct, value_objects]:
+            package_dir = package.__path__[0]
+            paths += [os.path.join(package_dir, name)
+                      for name in sorted(os.listdir(package_dir)) if name.endswith('.py')]
+
+        sha = hashlib.sha256()
+        for path in paths:
+            with open(path, 'rb') as f:
+                sha.update(f.read())
+        return sha.hexdigest()
@@ -27,7 +27,10 @@ class CombinePath():
     def __init__(
         self,
         get_node: Callable[[str], NodeStructValue],
-        get_communication: Callable[[str, str, str], CommunicationStructValue]
+        get_communication: Callable[[str, str, str], CommunicationStructValue],
+        get_node_path: Optional[
+            Callable[[str, Optional[str], Optional[str]], Optional[NodePathStructValue]]
+        ] = None
     ):
         """
         Construct CombinePath.
@@ -38,10 +41,15 @@ class CombinePath():
             get_node function
         get_communication : Callable[[str, str, str], CommunicationStructValue]
             get_communication function
+        get_node_path : Optional[Callable]
+            get_node_path function, which returns the first node path matching
+            node name, subscribe topic name and publish topic name, or None if not found.
+            Node paths of the node are searched linearly if None.
 
         """
         self._get_node = get_node
         self._get_communication = get_communication
+        self._get_node_path = get_node_path
 
     @staticmethod
     def __can_combine(name1: Optional[str], name2: Optional[str]) -> bool:
@@ -558,11 +566,59 @@ class CombinePath():
 
         """
         node_name: str = self._get_node_name(left_last_child, right_first_child)
-        node_paths: Tuple[NodePathStructValue, ...] = self._get_node(node_name).paths
+        # get_node also validates that the node exists.
+        node: NodeStructValue = self._get_node(node_name)
+        if self._get_node_path is not None:
+            return self._get_indexed_node_path(node_name, left_last_child, right_first_child)
+
+        node_paths: Tuple[NodePathStructValue, ...] = node.paths
         target_node_path: NodePathStructValue = \
             self._find_node_path(left_last_child, right_first_child, node_paths)
         return target_node_path
 
+    def _get_indexed_node_path(
+        self,
+        node_name: str,
+        left_last_child: Union[NodePathStructValue, CommunicationStructValue],
+        right_first_child: Union[NodePathStructValue, CommunicationStructValue],
+    ) -> NodePathStructValue:
+        """
+        Get a middle node path with get_node_path.
+
+        Parameters
+        ----------
+        node_name : str
+            node name
+        left_last_child : Union[NodePathStructValue, CommunicationStructValue]
+            left last child
+        right_first_child : Union[NodePathStructValue, CommunicationStructValue]
+            right first child
+
+        Returns
+        -------
+        NodePathStructValue
+            Middle node path
+
+        Raises
+        ------
+        InvalidArgumentError
+            No node path to combine.
+
+        """
+        assert self._get_node_path is not None
+        subscribe_topic_name: Optional[str] = \
+            left_last_child.subscribe_topic_name \
+            if isinstance(left_last_child, NodePathStructValue) else left_last_child.topic_name
+        publish_topic_name: Optional[str] = \
+            right_first_child.publish_topic_name \
+            if isinstance(right_first_child, NodePathStructValue) else right_first_child.topic_name
+
+        node_path = self._get_node_path(node_name, subscribe_topic_name, publish_topic_name)
+        if node_path is None:
+            msg = 'No node path to combine.'
+            raise InvalidArgumentError(msg)
+        return node_path
+
     @_get_middle_child.register
     def _get_middle_child_comm_comm(
         self,
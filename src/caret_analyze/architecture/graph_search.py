@@ -14,11 +14,11 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, UserList
-from copy import deepcopy
+from collections import defaultdict, deque, UserList
 from itertools import product
 from logging import getLogger
-from typing import Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
+from typing import (Callable, DefaultDict, Dict, Iterator, List, Optional, Sequence, Set,
+                    Tuple, Union)
 
 from .struct import (CallbackStruct, CommunicationStruct,
                      NodePathStruct, NodeStruct,
@@ -32,6 +32,8 @@ from ..value_objects.value_object import ValueObject
 
 logger = getLogger(__name__)
 
+Edge = Tuple[int, int]
+
 
 class GraphEdgeCore(ValueObject):
 
@@ -74,113 +76,273 @@ class GraphCore:
         # default dictionary to store graph
         self._graph: DefaultDict[int, List[GraphEdgeCore]]
         self._graph = defaultdict(list)
+        self._reversed_graph: DefaultDict[int, List[GraphEdgeCore]]
+        self._reversed_graph = defaultdict(list)
+        # Shortest distances [edges] to each goal and from each start, built on demand.
+        self._distances_to: Dict[int, Dict[int, int]] = {}
+        self._distances_from: Dict[int, Dict[int, int]] = {}
 
     def add_edge(self, u: int, v: int, label: Optional[str] = None):
         self._v = max(self._v, u + 1, v + 1)
-        self._graph[u].append(GraphEdgeCore(u, v, label))
-
-    def _search_paths_recursion(
-        self,
-        u: int,
-        d: int,
-        edge: Optional[GraphEdgeCore],
-        visited: Dict[Tuple[int, int], bool],
-        path: GraphPathCore,
-        paths: List[GraphPathCore],
-    ) -> None:
-
-        if edge is not None:
-            path.append(edge)
+        edge = GraphEdgeCore(u, v, label)
+        self._graph[u].append(edge)
+        self._reversed_graph[v].append(edge)
+        self._distances_to.clear()
+        self._distances_from.clear()
+
+    def distances_to(self, goal: int) -> Dict[int, int]:
+        """
+        Get the shortest distances to the goal.
+
+        Parameters
+        ----------
+        goal : int
+            index of the goal node.
+
+        Returns
+        -------
+        Dict[int, int]
+            number of edges to the goal for each node.
+            Nodes which cannot reach the goal are not included.
+
+        """
+        if goal not in self._distances_to:
+            self._distances_to[goal] = self._breadth_first_distances(
+                goal, self._reversed_graph, lambda edge: edge.i_from)
+        return self._distances_to[goal]
+
+    def distances_from(self, start: int) -> Dict[int, int]:
+        """
+        Get the shortest distances from the start.
+
+        Parameters
+        ----------
+        start : int
+            index of the start node.
+
+        Returns
+        -------
+        Dict[int, int]
+            number of edges from the start for each node.
+            Nodes which are not reachable from the start are not included.
+
+        """
+        if start not in self._distances_from:
+            self._distances_from[start] = self._breadth_first_distances(
+                start, self._graph, lambda edge: edge.i_to)
+        return self._distances_from[start]
 
-        if u == d:
-            paths.append(deepcopy(path))
-        else:
-            for edge in self._graph[u]:
-                i = edge.i_to
-
-                if visited[u, i] is False:
-                    visited[u, i] = True
-                    self._search_paths_recursion(
-                        i, d, edge, visited, path, paths)
-                    visited[u, i] = False
-
-        if len(path) > 0:
-            path.pop()
-
-    def _search_paths(
+    @staticmethod
+    def _breadth_first_distances(
+        origin: int,
+        graph: DefaultDict[int, List[GraphEdgeCore]],
+        next_node: Callable[[GraphEdgeCore], int],
+    ) -> Dict[int, int]:
+        distances = {origin: 0}
+        queue = deque([origin])
+        while queue:
+            u = queue.popleft()
+            for edge in graph.get(u, []):
+                v = next_node(edge)
+                if v not in distances:
+                    distances[v] = distances[u] + 1
+                    queue.append(v)
+        return distances
+
+    def iter_paths(
         self,
-        u: int,
-        d: int,
-        edge: Optional[GraphEdgeCore],
-        visited: Dict[Tuple[int, int], bool],
-        path: GraphPathCore,
-        paths: List[GraphPathCore],
+        start: int,
+        goal: int,
         max_depth: int = 0
-    ) -> None:
-
-        edges_cache = []
+    ) -> Iterator[GraphPathCore]:
+        """
+        Enumerate paths from start to goal.
+
+        Each edge appears at most once in a path.
+        Paths are yielded in depth-first order as they are found.
+        Edges from which the goal cannot be reached within max_depth are not explored.
+
+        Parameters
+        ----------
+        start : int
+            index of the start node.
+        goal : int
+            index of the goal node.
+        max_depth : int
+            Paths are not extended beyond max_depth + 1 edges. 0 means unlimited.
+
+        Yields
+        ------
+        GraphPathCore
+            path from start to goal.
+
+        """
+        distances = self.distances_to(goal)
+        max_length = max_depth + 1 if max_depth > 0 else None
+
+        # Visited edges of the current path, keyed by (from, to).
+        visited: Set[Tuple[int, int]] = set()
+        # The current path as an immutable linked list (edge, prefix).
+        # Prefixes are shared instead of copying the path on each step.
+        prefix: Optional[Tuple[GraphEdgeCore, Optional[tuple]]] = None
+        depth = 0
+        # Remaining candidate edges for each node on the current path.
+        candidates: List[Iterator[GraphEdgeCore]] = [reversed(self._graph.get(start, []))]
+        u = start
         forward = True
 
-        def get_next_edge(u, edges_cache) -> Optional[GraphEdgeCore]:
-            last_cache = edges_cache[-1]
-            if 0 < max_depth and max_depth < len(path):
-                return None
-            while len(last_cache) > 0:
-                edge = last_cache.pop()
-                i = edge.i_to
-                if visited[u, i] is False:
-                    return edge
-            return None
-
-        u_start = u
-
-        edges_cache.append(deepcopy(self._graph[u]))
         while True:
-            if u == d and forward and len(path) > 0:
-                paths.append(deepcopy(path))
-
-            if u != d or u == u_start:
-                edge = get_next_edge(u, edges_cache)
-            else:
-                edge = None
+            if u == goal and forward and depth > 0:
+                yield self._to_path_core(prefix)
+
+            edge: Optional[GraphEdgeCore] = None
+            if u != goal or u == start:
+                for candidate in candidates[-1]:
+                    if (u, candidate.i_to) in visited:
+                        continue
+                    # Prune edges which cannot reach the goal within the depth.
+                    distance = distances.get(candidate.i_to)
+                    if distance is None or \
+                            (max_length is not None and depth + 1 + distance > max_length):
+                        continue
+                    edge = candidate
+                    break
 
             if edge is not None:
-                i = edge.i_to
-                visited[u, i] = True
-                u = i
-                path.append(edge)
-                edges_cache.append(deepcopy(self._graph[u]))
+                visited.add((u, edge.i_to))
+                u = edge.i_to
+                prefix = (edge, prefix)
+                depth += 1
+                candidates.append(reversed(self._graph.get(u, [])))
                 forward = True
             else:
                 forward = False
-                edges_cache.pop()
-                if len(path) > 0:
-                    last_edge = path.pop()
+                candidates.pop()
+                if prefix is not None:
+                    last_edge, prefix = prefix
+                    depth -= 1
                     u = last_edge.i_from
-                    i = last_edge.i_to
-                    visited[u, i] = False
+                    visited.discard((u, last_edge.i_to))
 
-                if edges_cache == []:
+                if len(candidates) == 0:
                     return
 
-    def search_paths(
+    @staticmethod
+    def _to_path_core(prefix: Optional[tuple]) -> GraphPathCore:
+        edges: List[GraphEdgeCore] = []
+        while prefix is not None:
+            edge, prefix = prefix
+            edges.append(edge)
+        edges.reverse()
+        return GraphPathCore(edges)
+
+    def iter_paths_bidirectional(
         self,
         start: int,
         goal: int,
         max_depth: int = 0
-    ) -> List[GraphPathCore]:
-
-        visited: Dict[Tuple[int, int], bool] = {}
-        for i, j in product(range(self._v), range(self._v)):
-            visited[i, j] = False
-
-        path: GraphPathCore = GraphPathCore()
-        paths: List[GraphPathCore] = []
+    ) -> Iterator[GraphPathCore]:
+        """
+        Enumerate paths from start to goal by meet-in-the-middle search.
+
+        The same paths as iter_paths are yielded, but in a different order.
+        The first half of each path is searched from the start
+        and the second half from the goal, and both halves are joined.
+        Falls back to iter_paths when max_depth is 0 (unlimited).
+
+        Parameters
+        ----------
+        start : int
+            index of the start node.
+        goal : int
+            index of the goal node.
+        max_depth : int
+            Paths are not extended beyond max_depth + 1 edges. 0 means unlimited.
+
+        Yields
+        ------
+        GraphPathCore
+            path from start to goal.
+
+        """
+        if max_depth <= 0:
+            yield from self.iter_paths(start, goal, max_depth)
+            return
 
-        # self._search_paths_recursion(start, goal, None, visited, path, paths)
-        self._search_paths(start, goal, None, visited, path, paths, max_depth)
+        max_length = max_depth + 1
+        # A path of length k is split into halves of length ceil(k/2) and floor(k/2).
+        head_length = (max_length + 1) // 2
+        tail_length = max_length // 2
+
+        # Second halves indexed by (first node, length). The empty half starts at the goal.
+        tails: DefaultDict[Tuple[int, int], List[Tuple[Tuple[GraphEdgeCore, ...], Set[Edge]]]]
+        tails = defaultdict(list)
+        tails[(goal, 0)].append(((), set()))
+        # Paths do not pass through the goal before reaching it, unless it is the start.
+        terminal = goal if start != goal else None
+        for edges in self._iter_half_paths(
+            goal, tail_length, max_length, self._reversed_graph,
+            lambda edge: edge.i_from, self.distances_from(start), terminal
+        ):
+            tail = tuple(reversed(edges))
+            if tail[0].i_from == terminal:
+                continue
+            tails[(tail[0].i_from, len(tail))].append(
+                (tail, {(edge.i_from, edge.i_to) for edge in tail}))
+
+        for head in self._iter_half_paths(
+            start, head_length, max_length, self._graph,
+            lambda edge: edge.i_to, self.distances_to(goal), terminal
+        ):
+            head_edges = {(edge.i_from, edge.i_to) for edge in head}
+            for length in (len(head) - 1, len(head)):
+                for tail, tail_edges in tails.get((head[-1].i_to, length), []):
+                    if head_edges.isdisjoint(tail_edges):
+                        yield GraphPathCore(list(head + tail))
+
+    def _iter_half_paths(
+        self,
+        origin: int,
+        max_half_length: int,
+        max_length: int,
+        graph: DefaultDict[int, List[GraphEdgeCore]],
+        next_node: Callable[[GraphEdgeCore], int],
+        distances: Dict[int, int],
+        terminal: Optional[int],
+    ) -> Iterator[Tuple[GraphEdgeCore, ...]]:
+        # Enumerate paths up to max_half_length edges which do not extend beyond terminal.
+        # distances are those to the other end of the whole path.
+        visited: Set[Edge] = set()
+        edges: List[GraphEdgeCore] = []
+
+        def extend(u: int) -> Iterator[Tuple[GraphEdgeCore, ...]]:
+            if len(edges) == max_half_length:
+                return
+            if len(edges) > 0 and u == terminal:
+                return
+            for edge in graph.get(u, []):
+                v = next_node(edge)
+                key = (edge.i_from, edge.i_to)
+                distance = distances.get(v)
+                if key in visited or distance is None or \
+                        len(edges) + 1 + distance > max_length:
+                    continue
+                visited.add(key)
+                edges.append(edge)
+                yield tuple(edges)
+                yield from extend(v)
+                edges.pop()
+                visited.discard(key)
+
+        return extend(origin)
 
-        return paths
+    def search_paths(
+        self,
+        start: int,
+        goal: int,
+        max_depth: int = 0
+    ) -> List[GraphPathCore]:
+        return list(self.iter_paths(start, goal, max_depth))
 
 
 class GraphNode(ValueObject):
@@ -283,38 +445,63 @@ class Graph:
                 raise ItemNotFoundError(
                     f'Received an unregistered graph node. Return empty paths. {node}')
 
-    def search_paths(
+    def iter_paths(
         self,
         *nodes: GraphNode,
-        max_depth: Optional[int] = None
-    ) -> List[GraphPath]:
+        max_depth: Optional[int] = None,
+        bidirectional: bool = False
+    ) -> Iterator[GraphPath]:
+        """
+        Enumerate paths passing through the nodes in order.
+
+        Paths are yielded as they are found in the first section.
+        The other sections are searched before the first path is yielded.
+        If bidirectional is True, each section is searched by meet-in-the-middle search,
+        which yields the same paths in a different order.
+
+        """
         if len(nodes) < 2:
             raise InvalidArgumentError('nodes must be at least 2')
 
         self._validate(*nodes)
 
-        path_cores: List[List[GraphPathCore]] = []
-        for start, goal in zip(nodes[:-1], nodes[1:]):
-            path_cores.append(
-                self._graph.search_paths(
-                    self._node_to_idx[start],
-                    self._node_to_idx[goal],
-                    max_depth or 0
-                )
-            )
+        sections = [
+            (self._node_to_idx[start], self._node_to_idx[goal])
+            for start, goal in zip(nodes[:-1], nodes[1:])
+        ]
+        search = self._graph.iter_paths_bidirectional if bidirectional \
+            else self._graph.iter_paths
+        return self._iter_paths(sections, max_depth or 0, search)
 
-        paths: List[GraphPath] = []
-        for path_cores_ in product(*path_cores):
-            path = GraphPath()
+    def _iter_paths(
+        self,
+        sections: Sequence[Tuple[int, int]],
+        max_depth: int,
+        search: Callable[[int, int, int], Iterator[GraphPathCore]]
+    ) -> Iterator[GraphPath]:
+        (head_start, head_goal), *tail_sections = sections
+        tail_path_cores = [
+            list(search(start, goal, max_depth))
+            for start, goal in tail_sections
+        ]
 
-            for path_core in path_cores_:
-                for edge_core in path_core:
-                    node_from = self._idx_to_node[edge_core.i_from]
-                    node_to = self._idx_to_node[edge_core.i_to]
-                    path.append(GraphEdge(node_from, node_to, edge_core.label))
-            paths.append(path)
+        for head_path_core in search(head_start, head_goal, max_depth):
+            for tail_path_cores_ in product(*tail_path_cores):
+                path = GraphPath()
+                for path_core in (head_path_core, *tail_path_cores_):
+                    for edge_core in path_core:
+                        node_from = self._idx_to_node[edge_core.i_from]
+                        node_to = self._idx_to_node[edge_core.i_to]
+                        path.append(GraphEdge(node_from, node_to, edge_core.label))
+                yield path
 
-        return paths
+    def search_paths(
+        self,
+        *nodes: GraphNode,
+        max_depth: Optional[int] = None,
+        bidirectional: bool = False
+    ) -> List[GraphPath]:
+        return list(self.iter_paths(*nodes, max_depth=max_depth, bidirectional=bidirectional))
 
 
 class CallbackPathSearcher:
@@ -325,6 +512,13 @@ class CallbackPathSearcher:
     ) -> None:
         self._node = node
 
+        # Callback or variable passing of each graph edge, and callback name of each point.
+        self._edge_children: Dict[
+            Tuple[str, str], List[Union[CallbackStruct, VariablePassingStruct]]] = {}
+        self._point_callback_names: Dict[str, str] = {}
+        self._subscriptions: Dict[Tuple[str, str], SubscriptionStruct] = {}
+        self._publishers: Dict[str, PublisherStruct] = {}
+
         callbacks = node.callbacks
         var_passes = node.variable_passings
 
@@ -339,6 +533,9 @@ class CallbackPathSearcher:
 
             write_name = self._to_node_point_name(callback.callback_name, 'write')
             read_name = self._to_node_point_name(callback.callback_name, 'read')
+            self._point_callback_names[write_name] = callback.callback_name
+            self._point_callback_names[read_name] = callback.callback_name
+            self._edge_children.setdefault((read_name, write_name), []).append(callback)
 
             self._graph.add_edge(GraphNode(read_name), GraphNode(write_name))
 
@@ -350,6 +547,7 @@ class CallbackPathSearcher:
 
             write_name = self._to_node_point_name(var_pass.callback_name_write, 'write')
             read_name = self._to_node_point_name(var_pass.callback_name_read, 'read')
+            self._edge_children.setdefault((write_name, read_name), []).append(var_pass)
 
             self._graph.add_edge(GraphNode(write_name), GraphNode(read_name))
 
@@ -414,8 +612,8 @@ class CallbackPathSearcher:
 
         if subscribe_topic_name is not None and len(graph_node_names) > 0:
             try:
-                sub_cb_name = self._point_name_to_callback_name(graph_node_names[0])
-                sub = self._node.get_subscription(subscribe_topic_name, sub_cb_name)
+                sub_cb_name = self._point_callback_names[graph_node_names[0]]
+                sub = self._get_subscription(subscribe_topic_name, sub_cb_name)
             except ItemNotFoundError:
                 msg = 'Failed to find subscription. '
                 msg += f'node_name: {self._node.node_name}, '
@@ -429,7 +627,7 @@ class CallbackPathSearcher:
 
         if publish_topic_name is not None:
             try:
-                pub = self._node.get_publisher(publish_topic_name)
+                pub = self._get_publisher(publish_topic_name)
             except ItemNotFoundError:
                 msg = 'Failed to find publisher. '
                 msg += f'node_name: {self._node.node_name}'
@@ -448,74 +646,39 @@ class CallbackPathSearcher:
             child,
             None)
 
-    def _find_cb_or_varpass(
-        self,
-        graph_node_from: str,
-        graph_node_to: str,
-    ) -> Union[CallbackStruct, VariablePassingStruct]:
-        read_write_name_ = self._point_name_to_read_write_name(graph_node_from)
-
-        read_read_name = self._point_name_to_read_write_name(graph_node_to)
-
-        if read_write_name_ == 'write' or read_read_name == 'read':
-            return self._find_varpass(graph_node_from, graph_node_to)
-
-        if read_write_name_ == 'read' or read_read_name == 'write':
-            return self._find_cb(graph_node_from, graph_node_to)
-
-        raise InvalidArgumentError('')
-
-    def _find_varpass(
+    def _get_subscription(
         self,
-        graph_node_from: str,
-        graph_node_to: str,
-    ) -> VariablePassingStruct:
-
-        def is_target(var_pass:  VariablePassingStruct):
-            if graph_node_to is not None:
-                read_cb_name = self._point_name_to_callback_name(graph_node_to)
-                read_cb_match = var_pass.callback_name_read == read_cb_name
-
-            if graph_node_from is not None:
-                write_cb_name = self._point_name_to_callback_name(
-                    graph_node_from)
-                write_cb_match = var_pass.callback_name_write == write_cb_name
-
-            if read_cb_match is None and write_cb_match is None:
-                return False
-
-            return read_cb_match and write_cb_match
-
-        try:
-            return Util.find_one(is_target, self._node.variable_passings)
-        except ItemNotFoundError:
-            pass
-        raise ItemNotFoundError('')
+        subscribe_topic_name: str,
+        callback_name: str,
+    ) -> SubscriptionStruct:
+        key = (subscribe_topic_name, callback_name)
+        if key not in self._subscriptions:
+            self._subscriptions[key] = \
+                self._node.get_subscription(subscribe_topic_name, callback_name)
+        return self._subscriptions[key]
+
+    def _get_publisher(self, publish_topic_name: str) -> PublisherStruct:
+        if publish_topic_name not in self._publishers:
+            self._publishers[publish_topic_name] = \
+                self._node.get_publisher(publish_topic_name)
+        return self._publishers[publish_topic_name]
 
-    def _find_cb(
+    def _find_cb_or_varpass(
         self,
         graph_node_from: str,
         graph_node_to: str,
-    ) -> CallbackStruct:
-        def is_target(callback: CallbackStruct):
-            callback_name = self._point_name_to_callback_name(graph_node_from)
-            return callback.callback_name == callback_name
-
-        callbacks = self._node.callbacks
-        return Util.find_one(is_target, callbacks)
+    ) -> Union[CallbackStruct, VariablePassingStruct]:
+        children = self._edge_children.get((graph_node_from, graph_node_to))
+        if not children:
+            raise ItemNotFoundError('Failed find item.')
+        if len(children) >= 2:
+            raise MultipleItemFoundError('Failed to identify item.')
+        return children[0]
 
     @staticmethod
     def _to_node_point_name(callback_name: str, read_or_write: str) -> str:
         return f'{callback_name}@{read_or_write}'
 
-    @staticmethod
-    def _point_name_to_callback_name(point_name: str) -> str:
-        return point_name.split('@')[0]
-
-    @staticmethod
-    def _point_name_to_read_write_name(point_name: str) -> str:
-        return point_name.split('@')[1]
-
 
 NodePathKey = Tuple[Optional[str], Optional[str], Optional[str]]
 CommKey = Tuple[str, str, str]
@@ -613,21 +776,27 @@ class NodePathSearcher:
     def search(
         self,
         *node_names: str,
-        max_node_depth: Optional[int] = None
+        max_node_depth: Optional[int] = None,
+        bidirectional: bool = False
     ) -> List[PathStruct]:
-        paths: List[PathStruct] = []
+        return list(self.iter_search(
+            *node_names, max_node_depth=max_node_depth, bidirectional=bidirectional))
 
+    def iter_search(
+        self,
+        *node_names: str,
+        max_node_depth: Optional[int] = None,
+        bidirectional: bool = False
+    ) -> Iterator[PathStruct]:
         max_search_depth = max_node_depth or 0
 
         graph_nodes: List[GraphNode] = [GraphNode(node) for node in node_names]
-        graph_paths = self._graph.search_paths(
+        graph_paths = self._graph.iter_paths(
             *graph_nodes,
-            max_depth=max_search_depth)
-
-        for graph_path in graph_paths:
-            paths.append(self._to_path(graph_path))
+            max_depth=max_search_depth,
+            bidirectional=bidirectional)
 
-        return paths
+        return (self._to_path(graph_path) for graph_path in graph_paths)
 
     def _find_node(self, node_name: str) -> NodeStruct:
         try:
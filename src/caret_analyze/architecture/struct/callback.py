@@ -26,6 +26,11 @@ from ...value_objects import (CallbackStructValue, CallbackType,
 class CallbackStruct(metaclass=ABCMeta):
     """Callback value base class."""
 
+    __slots__ = (
+        '_node_name', '_callback_name', '_symbol', '_subscribe_topic_name', '_service_name',
+        '_publish_topic_names', '_construction_order',
+    )
+
     def __init__(
         self,
         node_name: str,
@@ -157,6 +162,8 @@ class CallbackStruct(metaclass=ABCMeta):
 class TimerCallbackStruct(CallbackStruct):
     """Structured timer callback value."""
 
+    __slots__ = ('_period_ns',)
+
     def __init__(
         self,
         node_name: str,
@@ -194,6 +201,8 @@ class TimerCallbackStruct(CallbackStruct):
 class SubscriptionCallbackStruct(CallbackStruct):
     """Structured subscription callback value."""
 
+    __slots__ = ('__subscribe_topic_name',)
+
     def __init__(
         self,
         node_name: str,
@@ -242,6 +251,8 @@ class SubscriptionCallbackStruct(CallbackStruct):
 class ServiceCallbackStruct(CallbackStruct):
     """Structured service callback value."""
 
+    __slots__ = ('__service_name',)
+
     def __init__(
         self,
         node_name: str,
@@ -25,6 +25,8 @@ from ...value_objects.callback_group import CallbackGroupStructValue, CallbackGr
 class CallbackGroupStruct():
     """Callback group value object."""
 
+    __slots__ = ('_callback_group_type', '_node_name', '_callbacks', '_callback_group_name')
+
     def __init__(
         self,
         callback_group_type: CallbackGroupType,
@@ -24,6 +24,11 @@ from ...value_objects import CommunicationStructValue
 
 class CommunicationStruct():
 
+    __slots__ = (
+        '_publisher_value', '_subscription_value', '_topic_name', '_node_pub', '_node_sub',
+        '_subscription_callback_value', '_publish_callbacks_value',
+    )
+
     def __init__(
         self,
         node_publish: NodeStruct,
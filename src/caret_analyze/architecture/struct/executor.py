@@ -27,6 +27,8 @@ from ...value_objects import ExecutorStructValue, ExecutorType
 class ExecutorStruct():
     """Executor info for architecture."""
 
+    __slots__ = ('_executor_type', '_cbg_values', '_executor_name')
+
     def __init__(
         self,
         executor_type: ExecutorType,
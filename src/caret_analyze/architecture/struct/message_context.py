@@ -41,6 +41,8 @@ MessageContextType.TILDE = MessageContextType('tilde')
 class MessageContextStruct():
     """Structured message context value."""
 
+    __slots__ = ('_node_name', '_message_context_dict', '_sub', '_pub', '_callbacks')
+
     def __init__(
         self,
         node_name: str,
@@ -174,6 +176,7 @@ class MessageContextStruct():
 
 class UseLatestMessageStruct(MessageContextStruct):
     TYPE_NAME = 'use_latest_message'
+    __slots__ = ()
 
     """Use message context"""
 
@@ -191,6 +194,7 @@ class UseLatestMessageStruct(MessageContextStruct):
 
 class InheritUniqueStampStruct(MessageContextStruct):
     TYPE_NAME = 'inherit_unique_stamp'
+    __slots__ = ()
 
     """
     Inherit header timestamp.
@@ -213,6 +217,7 @@ class InheritUniqueStampStruct(MessageContextStruct):
 
 class CallbackChainStruct(MessageContextStruct):
     TYPE_NAME = 'callback_chain'
+    __slots__ = ()
 
     """
     Callback chain.
@@ -275,6 +280,7 @@ class CallbackChainStruct(MessageContextStruct):
 
 class TildeStruct(MessageContextStruct):
     TYPE_NAME = 'tilde'
+    __slots__ = ()
 
     """
     tilde.
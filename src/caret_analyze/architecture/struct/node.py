@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 from typing import List, Optional
 
 from .callback import CallbackStruct
@@ -30,6 +31,11 @@ from ...value_objects import NodeStructValue
 class NodeStruct():
     """Executor info for architecture."""
 
+    __slots__ = (
+        '_node_name', '_publishers', '_subscriptions', '_services', '_timers', '_callback_groups',
+        '_node_paths', '_variable_passings_info',
+    )
+
     def __init__(
         self,
         node_name: str,
@@ -41,7 +47,7 @@ class NodeStruct():
         callback_groups: Optional[List[CallbackGroupStruct]],
         variable_passings: Optional[List[VariablePassingStruct]],
     ) -> None:
-        self._node_name = node_name
+        self._node_name = sys.intern(node_name)
         self._publishers = publishers
         self._subscriptions = subscriptions_info
         self._services = services
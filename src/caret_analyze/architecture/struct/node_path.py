@@ -30,6 +30,8 @@ logger = getLogger(__name__)
 
 
 class NodePathStruct():
+    __slots__ = ('_node_name', '_child', '_subscription', '_publisher', '_context')
+
     def __init__(
         self,
         node_name: str,
@@ -16,18 +16,21 @@
 from __future__ import annotations
 
 from logging import getLogger
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from .communication import CommunicationStruct
 from .node_path import NodePathStruct
 from ...common import Util
 from ...exceptions import InvalidArgumentError
-from ...value_objects import PathStructValue
+from ...value_objects import (CommunicationStructValue, NodePathStructValue,
+                              PathStructValue)
 
 logger = getLogger(__name__)
 
 
 class PathStruct():
+    __slots__ = ('_path_name', '_child')
+
     def __init__(
         self,
         path_name: Optional[str],
@@ -100,9 +103,36 @@ class PathStruct():
             msg = 'NodePath and Communication should be alternated.'
             raise InvalidArgumentError(msg)
 
-    def to_value(self) -> PathStructValue:
-        return PathStructValue(None if self.path_name is None else self.path_name,
-                               tuple(v.to_value() for v in self.child))
+    def to_value(
+        self,
+        child_values: Optional[Dict[Union[NodePathStruct, CommunicationStruct],
+                                    Union[NodePathStructValue, CommunicationStructValue]]] = None
+    ) -> PathStructValue:
+        """
+        Convert to value object.
+
+        Parameters
+        ----------
+        child_values : Optional[Dict[Union[NodePathStruct, CommunicationStruct], \
+                Union[NodePathStructValue, CommunicationStructValue]]]
+            Converted child values, updated and shared between paths with the same children.
+
+        Returns
+        -------
+        PathStructValue
+            path value.
+
+        """
+        if child_values is None:
+            return PathStructValue(None if self.path_name is None else self.path_name,
+                                   tuple(v.to_value() for v in self.child))
+
+        child: List[Union[NodePathStructValue, CommunicationStructValue]] = []
+        for v in self.child:
+            if v not in child_values:
+                child_values[v] = v.to_value()
+            child.append(child_values[v])
+        return PathStructValue(None if self.path_name is None else self.path_name, tuple(child))
 
     def rename_node(self, src: str, dst: str) -> None:
         for n in self.node_paths:
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 from typing import List, Optional
 
 from .callback import CallbackStruct
@@ -21,14 +22,16 @@ from ...value_objects import PublisherStructValue
 class PublisherStruct():
     """Structured publisher value."""
 
+    __slots__ = ('_node_name', '_topic_name', '_callbacks')
+
     def __init__(
         self,
         node_name: str,
         topic_name: str,
         callback_values: Optional[List[CallbackStruct]],
     ) -> None:
-        self._node_name = node_name
-        self._topic_name = topic_name
+        self._node_name = sys.intern(node_name)
+        self._topic_name = sys.intern(topic_name)
         self._callbacks = callback_values
 
     def __str__(self) -> str:
@@ -21,6 +21,8 @@ from ...value_objects import ServiceStructValue
 class ServiceStruct():
     """Service info."""
 
+    __slots__ = ('_node_name', '_service_name', '_callback_value')
+
     def __init__(
         self,
         node_name: str,
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 from typing import Optional
 
 from .callback import SubscriptionCallbackStruct
@@ -21,14 +22,16 @@ from ...value_objects import SubscriptionStructValue
 class SubscriptionStruct():
     """Subscription info."""
 
+    __slots__ = ('_node_name', '_topic_name', '_callback_value')
+
     def __init__(
         self,
         node_name: str,
         topic_name: str,
         callback_info: Optional[SubscriptionCallbackStruct],
     ) -> None:
-        self._node_name: str = node_name
-        self._topic_name: str = topic_name
+        self._node_name: str = sys.intern(node_name)
+        self._topic_name: str = sys.intern(topic_name)
         self._callback_value = callback_info
 
     @property
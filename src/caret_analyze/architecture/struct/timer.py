@@ -21,6 +21,8 @@ from ...value_objects import TimerStructValue
 class TimerStruct():
     """Timer info."""
 
+    __slots__ = ('_node_name', '_period_ns', '_callback_value')
+
     def __init__(
         self,
         node_name: str,
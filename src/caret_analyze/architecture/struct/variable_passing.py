@@ -21,6 +21,8 @@ from ...value_objects import VariablePassingStructValue
 class VariablePassingStruct():
     """variable passing info."""
 
+    __slots__ = ('_node_name', '_cb_write', '_cb_read')
+
     def __init__(
         self,
         node_name: str,
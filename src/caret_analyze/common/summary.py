@@ -78,6 +78,8 @@ class Summary(UserDict):
 class Summarizable(metaclass=ABCMeta):
     """Abstract base class that have summary property."""
 
+    __slots__ = ()
+
     @abstractproperty
     def summary(self) -> Summary:
         """
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from functools import wraps
-from inspect import Signature, signature
+from inspect import Parameter, Signature, signature
 from typing import Any, Dict, List, Tuple
 
 from ..exceptions import UnsupportedTypeError
@@ -78,6 +78,9 @@ try:
             (ii) Dict case
                 ('<ARGUMENT_NAME>', '<KEY>')
 
+            (iii) Nested iterable type case
+                ('<ARGUMENT_NAME>', '<INDEX_OR_KEY>', '<INDEX_OR_KEY>', ...)
+
         Returns
         -------
         str
@@ -90,11 +93,13 @@ try:
             (ii) Dict case
                 '<ARGUMENT_NAME>'[KEY]
 
+            (iii) Nested iterable type case
+                '<ARGUMENT_NAME>'[INDEX_OR_KEY][INDEX_OR_KEY]...
+
         """
-        if len(given_arg_loc) == 2:  # Iterable type case
-            loc_str = f"'{given_arg_loc[0]}'[{given_arg_loc[1]}]"
-        else:
-            loc_str = f"'{given_arg_loc[0]}'"
+        loc_str = f"'{given_arg_loc[0]}'"
+        for index_or_key in given_arg_loc[1:]:  # Iterable type case
+            loc_str += f'[{index_or_key}]'
 
         return loc_str
 
@@ -125,6 +130,9 @@ try:
             (ii) Dict case
                 ('<ARGUMENT_NAME>', '<KEY>')
 
+            (iii) Nested iterable type case
+                ('<ARGUMENT_NAME>', '<INDEX_OR_KEY>', '<INDEX_OR_KEY>', ...)
+
         Returns
         -------
         str
@@ -137,6 +145,9 @@ try:
             (ii) Dict case
                 Class name input for argument <ARGUMENT_NAME>[<KEY>]
 
+            (iii) Nested iterable type case
+                Class name input for argument <ARGUMENT_NAME>[<INDEX_OR_KEY>]...
+
         """
         arg_name = given_arg_loc[0]
         given_arg: Any = None
@@ -150,15 +161,18 @@ try:
         if given_arg is None:
             # Check args
             given_arg_idx = list(signature.parameters.keys()).index(arg_name)
-            given_arg = args[given_arg_idx]
+            if signature.parameters[arg_name].kind == Parameter.VAR_POSITIONAL:
+                # Variable positional arguments are validated as a tuple of the rest.
+                given_arg = args[given_arg_idx:]
+            else:
+                given_arg = args[given_arg_idx]
 
-        if len(given_arg_loc) == 2:  # Iterable type case
+        for index_or_key in given_arg_loc[1:]:  # Iterable type case
             if isinstance(given_arg, dict):
-                given_arg_type_str = f"'{given_arg[given_arg_loc[1]].__class__.__name__}'"
+                given_arg = given_arg[index_or_key]
             else:
-                given_arg_type_str = f"'{given_arg[int(given_arg_loc[1])].__class__.__name__}'"
-        else:
-            given_arg_type_str = f"'{given_arg.__class__.__name__}'"
+                given_arg = given_arg[int(index_or_key)]
+        given_arg_type_str = f"'{given_arg.__class__.__name__}'"
 
         return given_arg_type_str
 
@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from .lttng import LttngEventFilter
+from .lttng import Lttng, LttngEventFilter
 from ...architecture.reader_interface import ArchitectureReader
+from ...exceptions import UnsupportedTypeError
 from ...value_objects import (
     CallbackGroupValue,
     ExecutorValue,
@@ -36,12 +37,28 @@ from ...value_objects import (
 class ArchitectureReaderLttng(ArchitectureReader):
     def __init__(
         self,
-        trace_dir: str
+        trace_dir_or_lttng: Union[str, Lttng]
     ) -> None:
-        from .lttng import Lttng
-        self._lttng = Lttng(
-            trace_dir, event_filters=[LttngEventFilter.init_pass_filter()],
-            validate=False)
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        trace_dir_or_lttng : Union[str, Lttng]
+            Trace directory, or Lttng already loaded from it.
+            The given Lttng is shared instead of reading only initialization events again.
+
+        """
+        if isinstance(trace_dir_or_lttng, str):
+            self._lttng = Lttng(
+                trace_dir_or_lttng, event_filters=[LttngEventFilter.init_pass_filter()],
+                validate=False)
+        elif isinstance(trace_dir_or_lttng, Lttng):
+            self._lttng = trace_dir_or_lttng
+        else:
+            raise UnsupportedTypeError(
+                f'Unsupported type: {type(trace_dir_or_lttng).__name__}. '
+                'Give a trace directory or Lttng.')
 
     def get_node_names_and_cb_symbols(
         self,
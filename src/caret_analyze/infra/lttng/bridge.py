@@ -12,15 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Union
+from functools import cached_property
+from typing import Dict, Hashable, List, Tuple, Union
 
 from .lttng import Lttng
 from .value_objects import (PublisherValueLttng,
                             SubscriptionCallbackValueLttng,
                             TimerCallbackValueLttng)
-from ...common import Util
 from ...exceptions import ItemNotFoundError, MultipleItemFoundError
-from ...value_objects import (NodeValue, PublisherStructValue, PublisherValue,
+from ...value_objects import (CallbackType, PublisherStructValue, PublisherValue,
                               SubscriptionCallbackStructValue,
                               SubscriptionCallbackValue,
                               TimerCallbackStructValue, TimerCallbackValue)
@@ -33,6 +33,35 @@ class LttngBridge:
     ) -> None:
         self._lttng = lttng
 
+    @cached_property
+    def _timer_callbacks(self) -> Dict[Hashable, List[TimerCallbackValueLttng]]:
+        index: Dict[Hashable, List[TimerCallbackValueLttng]] = {}
+        for node in self._lttng.get_nodes():
+            for callback in self._lttng.get_timer_callbacks(node):
+                key = TimerCallbackBindCondition.key(callback)
+                index.setdefault(key, []).append(callback)
+        return index
+
+    @cached_property
+    def _subscription_callbacks(
+        self
+    ) -> Dict[Hashable, List[SubscriptionCallbackValueLttng]]:
+        index: Dict[Hashable, List[SubscriptionCallbackValueLttng]] = {}
+        for node in self._lttng.get_nodes():
+            for callback in self._lttng.get_subscription_callbacks(node):
+                key = SubscriptionCallbackBindCondition.key(callback)
+                index.setdefault(key, []).append(callback)
+        return index
+
+    @cached_property
+    def _publishers(self) -> Dict[Hashable, List[PublisherValueLttng]]:
+        index: Dict[Hashable, List[PublisherValueLttng]] = {}
+        for node in self._lttng.get_nodes():
+            for publisher in self._lttng.get_publishers(node):
+                key = PublisherBindCondition.key(publisher)
+                index.setdefault(key, []).append(publisher)
+        return index
+
     def get_timer_callback(
         self,
         callback: TimerCallbackStructValue
@@ -64,21 +93,18 @@ class LttngBridge:
             Multiple pieces of values matching the search condition are found.
 
         """
-        try:
-            condition = TimerCallbackBindCondition(callback)
-            node = NodeValue(callback.node_name, None)
-            timer_callbacks = self._lttng.get_timer_callbacks(node)
-            timer_callback = Util.find_one(condition, timer_callbacks)
-        except ItemNotFoundError:
+        condition = TimerCallbackBindCondition(callback)
+        timer_callbacks = self._timer_callbacks.get(condition.key(callback), [])
+        if len(timer_callbacks) == 0:
             msg = 'No value matching the search condition is found. {condition}'
             msg += str(condition)
             raise ItemNotFoundError(msg)
-        except MultipleItemFoundError:
+        if len(timer_callbacks) >= 2:
             msg = 'Multiple pieces of values matching the search condition are found.'
             msg += str(condition)
             raise MultipleItemFoundError(msg)
 
-        return timer_callback
+        return timer_callbacks[0]
 
     def get_subscription_callback(
         self,
@@ -111,21 +137,18 @@ class LttngBridge:
             Multiple pieces of values matching the search condition are found.
 
         """
-        try:
-            node = NodeValue(callback.node_name, None)
-            sub_callbacks = self._lttng.get_subscription_callbacks(node)
-            condition = SubscriptionCallbackBindCondition(callback)
-            sub_callback = Util.find_one(condition, sub_callbacks)
-        except ItemNotFoundError:
+        condition = SubscriptionCallbackBindCondition(callback)
+        sub_callbacks = self._subscription_callbacks.get(condition.key(callback), [])
+        if len(sub_callbacks) == 0:
             msg = 'No value matching the search condition is found. '
             msg += str(condition)
             raise ItemNotFoundError(msg)
-        except MultipleItemFoundError:
+        if len(sub_callbacks) >= 2:
             msg = 'Multiple pieces of values matching the search condition are found. '
             msg += str(condition)
             raise MultipleItemFoundError(msg)
 
-        return sub_callback
+        return sub_callbacks[0]
 
     def get_publishers(
         self,
@@ -145,17 +168,8 @@ class LttngBridge:
             publisher values that match the condition
 
         """
-        try:
-            condition = PublisherBindCondition(publisher_value)
-            node = NodeValue(publisher_value.node_name, None)
-            pubs = self._lttng.get_publishers(node)
-            pubs_filtered = Util.filter_items(condition, pubs)
-        except ItemNotFoundError:
-            msg = 'Failed to find publisher instance. '
-            msg += str(condition)
-            raise ItemNotFoundError(msg)
-
-        return pubs_filtered
+        key = PublisherBindCondition.key(publisher_value)
+        return list(self._publishers.get(key, []))
 
 
 class TimerCallbackBindCondition:
@@ -201,6 +215,14 @@ class TimerCallbackBindCondition:
             value.symbol == struct_value.symbol and \
             value.construction_order == struct_value.construction_order
 
+    @staticmethod
+    def key(
+        callback: Union[TimerCallbackValue, TimerCallbackStructValue]
+    ) -> Tuple[str, CallbackType, int, str, int]:
+        """Get the hash key which is equal for callbacks matching the conditions."""
+        return (callback.node_name, callback.callback_type, callback.period_ns,
+                callback.symbol, callback.construction_order)
+
     def __str__(self):
         return str(self._target)
 
@@ -254,6 +276,14 @@ class SubscriptionCallbackBindCondition:
             value.subscribe_topic_name == struct_value.subscribe_topic_name and \
             value.symbol == struct_value.symbol
 
+    @staticmethod
+    def key(
+        callback: Union[SubscriptionCallbackValue, SubscriptionCallbackStructValue]
+    ) -> Tuple[str, CallbackType, str, str]:
+        """Get the hash key which is equal for callbacks matching the conditions."""
+        return (callback.node_name, callback.callback_type,
+                callback.subscribe_topic_name, callback.symbol)
+
     def __str__(self):
         return str(self._target)
 
@@ -296,5 +326,12 @@ class PublisherBindCondition:
         return value.node_name == struct_value.node_name and \
             value.topic_name == struct_value.topic_name
 
+    @staticmethod
+    def key(
+        publisher: Union[PublisherValue, PublisherStructValue]
+    ) -> Tuple[str, str]:
+        """Get the hash key which is equal for publishers matching the conditions."""
+        return (publisher.node_name, publisher.topic_name)
+
     def __str__(self):
         return self._target
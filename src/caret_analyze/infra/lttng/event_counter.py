@@ -14,25 +14,48 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from logging import getLogger
-from typing import Dict, List
+from typing import Dict, List, Tuple, TypeVar, Union
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_integer_dtype
 
 from .ros2_tracing.data_model import Ros2DataModel
+from ...record import RecordsInterface
 from ...exceptions import InvalidArgumentError, InvalidTraceFormatError
 
 logger = getLogger(__name__)
 
+PandasObject = TypeVar('PandasObject', pd.DataFrame, pd.Series)
+
 
 class EventCounter:
 
     def __init__(self, data: Ros2DataModel, *, validate=True):
+        """
+        Construct an instance.
+
+        Events are counted at the first get_count or validation.
+
+        Parameters
+        ----------
+        data : Ros2DataModel
+            Finalized trace data.
+        validate : bool
+            Validate that the trace was recorded with CARET, by default True.
+
+        """
         self._allowed_keys = {'trace_point', 'node_name', 'topic_name'}
-        self._count_df = self._build_count_df(data)
+        self._data = data
         if validate:
             self._validate()
 
+    @cached_property
+    def _count_df(self) -> pd.DataFrame:
+        return self._build_count_df(self._data)
+
     def get_count(self, groupby: List[str]) -> pd.DataFrame:
         if len(set(groupby) - self._allowed_keys) > 0:
             raise InvalidArgumentError(
@@ -99,8 +122,56 @@ class EventCounter:
 
     @staticmethod
     def _build_count_df(data: Ros2DataModel) -> pd.DataFrame:
+        """
+        Count events for each trace point, node, and topic.
+
+        Only the key columns are read from each trace point data.
+        Events are counted for each unique key,
+        and then the keys are mapped to node and topic names.
+
+        """
+        rules = EventCounter._build_name_rules(data)
+
+        counts = []
+        for trace_point, table in EventCounter._get_trace_point_tables(data).items():
+            if len(table) == 0:
+                counts.append(pd.DataFrame({
+                    'node_name': ['-'],
+                    'topic_name': ['-'],
+                    'size': [0],
+                    'trace_point': [trace_point],
+                }))
+                continue
+
+            keys = EventCounter._get_keys(trace_point, table)
+            if len(keys.columns) == 0:
+                groups = pd.DataFrame({'size': [len(table)]})
+            else:
+                groups = EventCounter._count_keys(keys)
+
+            names = pd.DataFrame(
+                '-', index=groups.index, columns=['node_name', 'topic_name'], dtype=object)
+            resolved = np.zeros(len(groups), dtype=bool)
+            for key, name_df in rules:
+                if key not in groups.columns:
+                    continue
+                hit = ~resolved & groups[key].isin(name_df.index).to_numpy(dtype=bool)
+                if hit.any():
+                    names.loc[hit] = name_df.loc[groups.loc[hit, key]].to_numpy()
+                    resolved |= hit
+
+            names['size'] = groups['size'].to_numpy()
+            names['trace_point'] = trace_point
+            counts.append(names)
+
+        return pd.concat(counts, ignore_index=True)
+
+    @staticmethod
+    def _get_trace_point_tables(
+        data: Ros2DataModel
+    ) -> Dict[str, Union[pd.DataFrame, RecordsInterface]]:
         # TODO(hsgwa): Definitions on tracepoint types are scattered. Refactor required.
-        trace_point_and_df = {
+        return {
             'ros2:rcl_init': data.contexts.df,
             'ros2:rcl_node_init': data.nodes.df,
             'ros2:rcl_publisher_init': data.publishers.df,
@@ -129,156 +200,137 @@ class EventCounter:
             'ros2:rcl_lifecycle_transition': data.lifecycle_transitions.df,
             'ros2_caret:rmw_implementation': data.rmw_impl.df,
 
-            'ros2:callback_start': data.callback_start_instances.to_dataframe(),
-            'ros2:callback_end': data.callback_end_instances.to_dataframe(),
-            'ros2:rclcpp_publish': data.rclcpp_publish_instances.to_dataframe(),
-            'ros2:rclcpp_intra_publish': data.rclcpp_intra_publish_instances.to_dataframe(),
-            'ros2:message_construct': data.message_construct_instances.to_dataframe(),
+            'ros2:callback_start': data.callback_start_instances,
+            'ros2:callback_end': data.callback_end_instances,
+            'ros2:rclcpp_publish': data.rclcpp_publish_instances,
+            'ros2:rclcpp_intra_publish': data.rclcpp_intra_publish_instances,
+            'ros2:message_construct': data.message_construct_instances,
             'ros2:dispatch_subscription_callback':
-                data.dispatch_subscription_callback_instances.to_dataframe(),
+                data.dispatch_subscription_callback_instances,
             'ros2:dispatch_intra_process_subscription_callback':
-                data.dispatch_intra_process_subscription_callback_instances.to_dataframe(),
-            'ros2:rcl_publish': data.rcl_publish_instances.to_dataframe(),
-            'ros2_caret:dds_write': data.dds_write_instances.to_dataframe(),
-            'ros2_caret:dds_bind_addr_to_stamp': data.dds_bind_addr_to_stamp.to_dataframe(),
-            'ros2_caret:dds_bind_addr_to_addr': data.dds_bind_addr_to_addr.to_dataframe(),
-            'ros2_caret:tilde_publish': data.tilde_publish.to_dataframe(),
-            'ros2_caret:tilde_subscribe': data.tilde_subscribe.to_dataframe(),
-            'ros2_caret:sim_time': data.sim_time.to_dataframe(),
-            'ros2_caret:on_data_available': data.on_data_available_instances.to_dataframe(),
+                data.dispatch_intra_process_subscription_callback_instances,
+            'ros2:rcl_publish': data.rcl_publish_instances,
+            'ros2_caret:dds_write': data.dds_write_instances,
+            'ros2_caret:dds_bind_addr_to_stamp': data.dds_bind_addr_to_stamp,
+            'ros2_caret:dds_bind_addr_to_addr': data.dds_bind_addr_to_addr,
+            'ros2_caret:tilde_publish': data.tilde_publish,
+            'ros2_caret:tilde_subscribe': data.tilde_subscribe,
+            'ros2_caret:sim_time': data.sim_time,
+            'ros2_caret:on_data_available': data.on_data_available_instances,
             'ros2_caret:caret_init': data.caret_init.df,
         }
         #  'ros2_caret:rmw_implementation': ,
 
-        sub_handle_to_topic_name: Dict[int, str] = {}
-        sub_handle_to_node_name: Dict[int, str] = {}
-        pub_handle_to_topic_name: Dict[int, str] = {}
-        pub_handle_to_node_name: Dict[int, str] = {}
-        node_handle_to_node_name: Dict[int, str] = {}
-        timer_handle_to_node_name: Dict[int, str] = {}
-        sub_cb_to_node_name: Dict[int, str] = {}
-        timer_cb_to_node_name: Dict[int, str] = {}
-        sub_cb_to_topic_name: Dict[int, str] = {}
-        sub_to_topic_name: Dict[int, str] = {}
-        sub_to_node_name: Dict[int, str] = {}
-
-        def ns_and_node_name(ns: str, name: str) -> str:
-            if ns[-1] == '/':
-                return ns + name
-            else:
-                return ns + '/' + name
-
-        for handler, row in data.nodes.df.iterrows():
-            node_handle_to_node_name[handler] = ns_and_node_name(row['namespace'], row['name'])
-
-        for handler, row in data.publishers.df.iterrows():
-            pub_handle_to_node_name[handler] = \
-                node_handle_to_node_name.get(row['node_handle'], '-')
-            pub_handle_to_topic_name[handler] = row['topic_name']
-
-        for handler, row in data.subscriptions.df.iterrows():
-            sub_handle_to_node_name[handler] = \
-                node_handle_to_node_name.get(row['node_handle'], '-')
-            sub_handle_to_topic_name[handler] = row['topic_name']
-
-        for handler, row in data.timer_node_links.df.iterrows():
-            timer_handle_to_node_name[handler] = \
-                node_handle_to_node_name.get(row['node_handle'], '-')
-
-        for sub, row in data.subscription_objects.df.iterrows():
-            sub_handle = row['subscription_handle']
-            sub_to_topic_name[sub] = sub_handle_to_topic_name.get(sub_handle, '-')
-            sub_to_node_name[sub] = sub_handle_to_node_name.get(sub_handle, '-')
-
-        for handler, row in data.callback_objects.df.iterrows():
-            if handler in sub_to_topic_name:
-                sub_cb_to_node_name[row['callback_object']] = sub_to_node_name.get(handler, '-')
-                sub_cb_to_topic_name[row['callback_object']] = sub_to_topic_name.get(handler, '-')
-            elif handler in timer_handle_to_node_name:
-                timer_cb_to_node_name[row['callback_object']] = \
-                    timer_handle_to_node_name.get(handler, '-')
-
-        tilde_pub_to_topic_name: Dict[int, str] = {}
-        tilde_pub_to_node_name: Dict[int, str] = {}
-        for handler, row in data.tilde_publishers.df.iterrows():
-            tilde_pub_to_node_name[handler] = row['node_name']
-            tilde_pub_to_topic_name[handler] = row['topic_name']
-
-        tilde_sub_to_topic_name: Dict[int, str] = {}
-        tilde_sub_to_node_name: Dict[int, str] = {}
-        for handler, row in data.tilde_subscriptions.df.iterrows():
-            tilde_sub_to_node_name[handler] = row['node_name']
-            tilde_sub_to_topic_name[handler] = row['topic_name']
-
-        count_dict = []
-        group_keys = [
-            'callback_object', 'publisher_handle', 'subscription_handle',
-            'tilde_publisher', 'tilde_subscription'
-            ]
-        for trace_point, df in trace_point_and_df.items():
-            df = df.reset_index()
-
-            if len(df) == 0:
-                count_dict.append(
-                    {
-                        'node_name': '-',
-                        'topic_name': '-',
-                        'size': 0,
-                        'trace_point': trace_point
-                    }
-                )
-                continue
-            if 'callback_object' not in df.columns:
-                df['callback_object'] = '-'
-            if 'publisher_handle' not in df.columns:
-                df['publisher_handle'] = '-'
-            if 'subscription_handle' not in df.columns:
-                df['subscription_handle'] = '-'
-
-            if trace_point in ['ros2_caret:tilde_publish', 'ros2_caret:tilde_publisher_init']:
-                df['tilde_publisher'] = df['publisher']
-            else:
-                df['tilde_publisher'] = '-'
+    @staticmethod
+    def _get_keys(
+        trace_point: str,
+        table: Union[pd.DataFrame, RecordsInterface]
+    ) -> pd.DataFrame:
+        # key name -> column name
+        key_columns = {
+            'callback_object': 'callback_object',
+            'publisher_handle': 'publisher_handle',
+            'subscription_handle': 'subscription_handle',
+        }
+        if trace_point in ['ros2_caret:tilde_publish', 'ros2_caret:tilde_publisher_init']:
+            key_columns['tilde_publisher'] = 'publisher'
+        if trace_point in ['ros2_caret:tilde_subscribe', 'ros2_caret:tilde_subscription_init']:
+            key_columns['tilde_subscription'] = 'subscription'
+
+        if isinstance(table, pd.DataFrame):
+            df = table.reset_index()
+            return pd.DataFrame({
+                key: df[column].to_numpy()
+                for key, column in key_columns.items()
+                if column in df.columns
+            })
+
+        return pd.DataFrame({
+            key: pd.array(table.get_column_series(column), dtype='Int64')
+            for key, column in key_columns.items()
+            if column in table.columns
+        })
 
-            if trace_point in ['ros2_caret:tilde_subscribe', 'ros2_caret:tilde_subscription_init']:
-                df['tilde_subscription'] = df['subscription']
-            else:
-                df['tilde_subscription'] = '-'
-
-            for key, group in df.groupby(group_keys):
-                node_name = '-'
-                topic_name = '-'
-
-                if key[0] in timer_cb_to_node_name:
-                    node_name = timer_cb_to_node_name.get(key[0], '-')
-                elif key[0] in sub_cb_to_node_name or key[0] \
-                        in sub_cb_to_topic_name:
-                    node_name = sub_cb_to_node_name.get(key[0], '-')
-                    topic_name = sub_cb_to_topic_name.get(key[0], '-')
-                elif key[1] in pub_handle_to_topic_name or \
-                        key[1] in pub_handle_to_node_name:
-                    topic_name = pub_handle_to_topic_name.get(key[1], '-')
-                    node_name = pub_handle_to_node_name.get(key[1], '-')
-                elif key[2] in sub_handle_to_node_name or \
-                        key[2] in sub_handle_to_topic_name:
-                    topic_name = sub_handle_to_topic_name.get(key[2], '-')
-                    node_name = sub_handle_to_node_name.get(key[2], '-')
-                elif key[3] in tilde_pub_to_node_name or \
-                        key[3] in tilde_pub_to_topic_name:
-                    topic_name = tilde_pub_to_topic_name.get(key[3], '-')
-                    node_name = tilde_pub_to_node_name.get(key[3], '-')
-                elif key[4] in tilde_sub_to_node_name or \
-                        key[4] in tilde_sub_to_topic_name:
-                    topic_name = tilde_sub_to_topic_name.get(key[4], '-')
-                    node_name = tilde_sub_to_node_name.get(key[4], '-')
-
-                count_dict.append(
-                    {
-                        'node_name': node_name,
-                        'topic_name': topic_name,
-                        'size': len(group),
-                        'trace_point': trace_point
-                    }
-                )
-
-        return pd.DataFrame.from_dict(count_dict)
+    @staticmethod
+    def _count_keys(keys: pd.DataFrame) -> pd.DataFrame:
+        # Events with missing keys are not counted, as with DataFrame.groupby.
+        keys = keys.dropna()
+        if len(keys.columns) == 1 and is_integer_dtype(keys.dtypes.iloc[0]):
+            key = keys.columns[0]
+            values, sizes = np.unique(keys[key].to_numpy(dtype=np.int64), return_counts=True)
+            return pd.DataFrame({key: values, 'size': sizes})
+        return keys.groupby(list(keys.columns)).size().reset_index(name='size')
+
+    @staticmethod
+    def _build_name_rules(data: Ros2DataModel) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Build node and topic name tables for each key.
+
+        Returns
+        -------
+        List[Tuple[str, pd.DataFrame]]
+            Pairs of the key and the table which has node_name and topic_name columns
+            indexed by the key value, in order of priority.
+
+        """
+        def unique(df: PandasObject) -> PandasObject:
+            # Same as a dict built row by row, the last row is used.
+            return df[~df.index.duplicated(keep='last')]
+
+        def names(df: pd.DataFrame, node_name: pd.Series, topic_name: pd.Series) -> pd.DataFrame:
+            names_df = pd.DataFrame(
+                {'node_name': node_name.to_numpy(), 'topic_name': topic_name.to_numpy()},
+                index=df.index, dtype=object)
+            return unique(names_df)
+
+        def names_of(handles: pd.Series, names_by_handle: pd.Series) -> pd.Series:
+            return handles.map(names_by_handle).fillna('-')
+
+        nodes = data.nodes.df
+        ns = nodes['namespace'].astype(str)
+        node_handle_to_node_name = pd.Series(
+            np.where(ns.str.endswith('/'), ns + nodes['name'], ns + '/' + nodes['name']),
+            index=nodes.index, dtype=object)
+        node_handle_to_node_name = unique(node_handle_to_node_name)
+
+        pubs = data.publishers.df
+        pub_names = names(
+            pubs, names_of(pubs['node_handle'], node_handle_to_node_name), pubs['topic_name'])
+
+        subs = data.subscriptions.df
+        sub_names = names(
+            subs, names_of(subs['node_handle'], node_handle_to_node_name), subs['topic_name'])
+
+        timers = data.timer_node_links.df
+        timer_names = names(
+            timers, names_of(timers['node_handle'], node_handle_to_node_name),
+            pd.Series('-', index=timers.index, dtype=object))
+
+        sub_objects = data.subscription_objects.df
+        sub_object_names = names(
+            sub_objects,
+            names_of(sub_objects['subscription_handle'], sub_names['node_name']),
+            names_of(sub_objects['subscription_handle'], sub_names['topic_name']))
+
+        callbacks = data.callback_objects.df
+        is_sub_cb = callbacks.index.isin(sub_object_names.index)
+        is_timer_cb = ~is_sub_cb & callbacks.index.isin(timer_names.index)
+        sub_cb_names = sub_object_names.loc[callbacks.index[is_sub_cb]] \
+            .set_axis(callbacks['callback_object'][is_sub_cb].to_numpy())
+        timer_cb_names = timer_names.loc[callbacks.index[is_timer_cb]] \
+            .set_axis(callbacks['callback_object'][is_timer_cb].to_numpy())
+
+        tilde_pubs = data.tilde_publishers.df
+        tilde_pub_names = names(tilde_pubs, tilde_pubs['node_name'], tilde_pubs['topic_name'])
+
+        tilde_subs = data.tilde_subscriptions.df
+        tilde_sub_names = names(tilde_subs, tilde_subs['node_name'], tilde_subs['topic_name'])
+
+        return [
+            ('callback_object', unique(timer_cb_names)),
+            ('callback_object', unique(sub_cb_names)),
+            ('publisher_handle', pub_names),
+            ('subscription_handle', sub_names),
+            ('tilde_publisher', tilde_pub_names),
+            ('tilde_subscription', tilde_sub_names),
+        ]
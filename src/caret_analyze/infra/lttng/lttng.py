@@ -263,6 +263,8 @@ class Lttng(InfraBase):
 
     This class is a singleton in order to retain information.
     The main processing is done by LttngInfo and RecordsSource.
+    If on_demand_records is True, records are composed only for the requested handles
+    instead of the whole trace.
 
     """
 
@@ -274,7 +276,8 @@ class Lttng(InfraBase):
         event_filters: Optional[List[LttngEventFilter]] = None,
         store_events: bool = False,
         # TODO(hsgwa): change validate function to public "verify".
-        validate: bool = True
+        validate: bool = True,
+        on_demand_records: bool = False
     ) -> None:
         from .lttng_info import LttngInfo
         from .records_source import RecordsSource
@@ -288,7 +291,8 @@ class Lttng(InfraBase):
         )
         self.data = data
         self._info = LttngInfo(data)
-        self._source: RecordsSource = RecordsSource(data, self._info)
+        self._source: RecordsSource = RecordsSource(
+            data, self._info, on_demand=on_demand_records)
         self._counter = EventCounter(data, validate=validate)
         self.events = events
         self._begin = begin
@@ -696,16 +700,95 @@ class Lttng(InfraBase):
         """
         return self._source.callback_records.clone()
 
+    def compose_callback_records_by_object(
+        self,
+        callback_object: int,
+    ) -> RecordsInterface:
+        """
+        Compose callback records of a single callback object.
+
+        Parameters
+        ----------
+        callback_object : int
+            target callback object.
+
+        Returns
+        -------
+        RecordsInterface
+            Columns
+
+            - callback_start_timestamp
+            - callback_end_timestamp
+            - callback_object
+
+        """
+        return self._source.get_callback_records(callback_object)
+
     def compose_publish_records(
         self,
     ) -> RecordsInterface:
         return self._source.publish_records.clone()
 
+    def compose_publish_records_by_handles(
+        self,
+        publisher_handles: Sequence[int],
+    ) -> RecordsInterface:
+        """
+        Compose publish records of the given publishers.
+
+        Parameters
+        ----------
+        publisher_handles : Sequence[int]
+            target publisher handles.
+
+        Returns
+        -------
+        RecordsInterface
+            Columns
+
+            - publisher_handle
+            - rclcpp_publish_timestamp
+            - rcl_publish_timestamp (Optional)
+            - dds_write_timestamp (Optional)
+            - message_timestamp
+            - source_timestamp
+
+        """
+        return self._source.get_publish_records(publisher_handles)
+
     def compose_subscribe_records(
         self,
     ) -> RecordsInterface:
         return self._source.subscribe_records.clone()
 
+    def compose_subscribe_records_by_objects(
+        self,
+        callback_objects: Sequence[int],
+    ) -> RecordsInterface:
+        """
+        Compose subscribe records of the given callback objects.
+
+        Parameters
+        ----------
+        callback_objects : Sequence[int]
+            target callback objects.
+
+        Returns
+        -------
+        RecordsInterface
+            Columns
+
+            - dispatch_subscription_callback_timestamp
+            - callback_object
+            - message
+            - source_timestamp
+            - message_timestamp
+            - callback_start_timestamp
+            - is_intra_process
+
+        """
+        return self._source.get_subscribe_records(callback_objects)
+
     def create_timer_events_factory(
         self,
         timer_callback: TimerCallbackValueLttng
@@ -717,7 +800,56 @@ class Lttng(InfraBase):
     ) -> RecordsInterface:
         return self._source.tilde_publish_records.clone()
 
+    def compose_tilde_publish_records_by_publishers(
+        self,
+        tilde_publishers: Sequence[int],
+    ) -> RecordsInterface:
+        """
+        Compose tilde publish records of the given TILDE publishers.
+
+        Parameters
+        ----------
+        tilde_publishers : Sequence[int]
+            target TILDE publishers.
+
+        Returns
+        -------
+        RecordsInterface
+            Columns
+
+            - tilde_publish_timestamp
+            - tilde_publisher
+            - tilde_message_id
+            - tilde_subscription
+
+        """
+        return self._source.get_tilde_publish_records(tilde_publishers)
+
     def compose_tilde_subscribe_records(
         self,
     ) -> RecordsInterface:
         return self._source.tilde_subscribe_records.clone()
+
+    def compose_tilde_subscribe_records_by_subscriptions(
+        self,
+        tilde_subscriptions: Sequence[int],
+    ) -> RecordsInterface:
+        """
+        Compose tilde subscribe records of the given TILDE subscriptions.
+
+        Parameters
+        ----------
+        tilde_subscriptions : Sequence[int]
+            target TILDE subscriptions.
+
+        Returns
+        -------
+        RecordsInterface
+            Columns
+
+            - tilde_subscribe_timestamp
+            - tilde_subscription
+            - tilde_message_id
+
+        """
+        return self._source.get_tilde_subscribe_records(tilde_subscriptions)
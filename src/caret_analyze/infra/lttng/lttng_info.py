@@ -17,7 +17,7 @@ from __future__ import annotations
 from collections import defaultdict
 from functools import cached_property, lru_cache
 from logging import getLogger, WARN
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from caret_analyze.infra.lttng.value_objects.timer_control import TimerInit
 from caret_analyze.value_objects.timer import TimerValue
@@ -101,7 +101,7 @@ class LttngInfo:
         nodes = self._formatted.nodes.clone()
         merge(timer_callbacks, nodes, 'node_handle')
 
-        for _, row in timer_callbacks.df.iterrows():
+        for row in iter_rows(timer_callbacks.df):
             node_name = row['node_name']
             node_id = row['node_id']
             timer_cbs_info[node_id].append(
@@ -170,7 +170,7 @@ class LttngInfo:
         added_nodes = set()
         duplicate_nodes = set()
 
-        for _, row in nodes_data.df.iterrows():
+        for row in iter_rows(nodes_data.df):
             node_name = row['node_name']
             node_id = row['node_id']
             if node_name in added_nodes:
@@ -200,7 +200,7 @@ class LttngInfo:
         tilde_sub = self._formatted.tilde_subscriptions.clone()
         sub.merge(tilde_sub, ['node_name', 'topic_name'], how='left')
 
-        for _, row in sub.df.iterrows():
+        for row in iter_rows(sub.df):
             node_name = row['node_name']
             node_id = row['node_id']
             tilde_subscription = row['tilde_subscription']
@@ -288,7 +288,7 @@ class LttngInfo:
         nodes = self._formatted.nodes.clone()
         merge(srv, nodes, 'node_handle')
 
-        for _, row in srv.df.iterrows():
+        for row in iter_rows(srv.df):
             node_name = row['node_name']
             node_id = row['node_id']
 
@@ -398,6 +398,15 @@ class LttngInfo:
         List[PublisherInfo]
 
         """
+        pubs_info = self._load_pubs_without_cb_bind()
+
+        if node_id not in pubs_info:
+            return []
+
+        return list(pubs_info[node_id])
+
+    @lru_cache
+    def _load_pubs_without_cb_bind(self) -> Dict[str, List[PublisherValueLttng]]:
         pub = self._formatted.publishers.clone()
         nodes = self._formatted.nodes.clone()
         merge(pub, nodes, 'node_handle')
@@ -405,15 +414,13 @@ class LttngInfo:
 
         pub.merge(tilde_pub, ['node_name', 'topic_name'], how='left')
         # pub = pub.astype({'tilde_publisher': 'Int64'})
-        pubs_info = []
-        for _, row in pub.df.iterrows():
-            if row['node_id'] != node_id:
-                continue
+        pubs_info: Dict[str, List[PublisherValueLttng]] = defaultdict(list)
+        for row in iter_rows(pub.df):
             tilde_publisher = row['tilde_publisher']
             if tilde_publisher is pd.NA:
                 tilde_publisher = None
 
-            pubs_info.append(
+            pubs_info[row['node_id']].append(
                 PublisherValueLttng(
                     node_name=row['node_name'],
                     topic_name=row['topic_name'],
@@ -585,7 +592,7 @@ class LttngInfo:
     def get_timer_controls(self) -> Sequence[TimerControl]:
         timer_controls = self._formatted.timer_controls.clone()
         controls: List[TimerControl] = []
-        for _, row in timer_controls.df.iterrows():
+        for row in iter_rows(timer_controls.df):
             if row['type'] == 'init':
                 params = row['params']
                 control = TimerInit(
@@ -616,10 +623,9 @@ class DataFrameFormatted:
 
     @cached_property
     def tilde_sub_id_map(self) -> Dict[int, int]:
-        d: Dict[int, int] = {}
-        for _, row in self._tilde_sub_id_to_sub.df.iterrows():
-            d[row['subscription_id']] = row['tilde_subscription']
-        return d
+        df = self._tilde_sub_id_to_sub.df
+        return dict(zip(df['subscription_id'].to_numpy(dtype=object),
+                        df['tilde_subscription'].to_numpy(dtype=object)))
 
     @property
     def timer_callbacks(self) -> TracePointData:
@@ -806,11 +812,10 @@ class DataFrameFormatted:
         publishers = data.publishers.clone()
         publishers.reset_index()
 
-        def to_publisher_id(row: pd.Series):
-            publisher_handle = row['publisher_handle']
-            return f'publisher_{publisher_handle}'
+        def to_publisher_id(df: pd.DataFrame) -> pd.Series:
+            return 'publisher_' + df['publisher_handle'].astype(str)
 
-        publishers.add_column('publisher_id', to_publisher_id)
+        publishers.add_column_from_columns('publisher_id', to_publisher_id)
         publishers.set_columns(columns)
         publishers.drop_duplicate()
 
@@ -823,12 +828,12 @@ class DataFrameFormatted:
         columns = ['timestamp', 'timer_handle', 'type', 'params']
         timers = data.timers.clone()
         timers.reset_index()
-        timers.add_column('type', lambda _: 'init')
+        timers.add_column_from_columns('type', lambda df: ['init'] * len(df))
 
-        def to_params(row: pd.Series):
-            return {'period': row['period']}
+        def to_params(df: pd.DataFrame) -> List[Dict[str, int]]:
+            return [{'period': period} for period in df['period'].to_numpy(dtype=object)]
 
-        timers.add_column('params', to_params)
+        timers.add_column_from_columns('params', to_params)
         timers.set_columns(columns)
         return timers
 
@@ -848,11 +853,10 @@ class DataFrameFormatted:
             executors = TracePointData.concat(
                 [executors, executors_static], columns_)
 
-        def to_executor_id(row: pd.Series) -> str:
-            addr = row['executor_addr']
-            return f'executor_{addr}'
+        def to_executor_id(df: pd.DataFrame) -> pd.Series:
+            return 'executor_' + df['executor_addr'].astype(str)
 
-        executors.add_column('executor_id', to_executor_id)
+        executors.add_column_from_columns('executor_id', to_executor_id)
         executors.set_columns(columns)
 
         # data.callback_groups returns duplicate results that differ only in timestamp.
@@ -881,11 +885,10 @@ class DataFrameFormatted:
             callback_groups = TracePointData.concat(
                 [callback_groups, callback_groups_static], columns_)
 
-        def to_callback_group_id(row: pd.Series) -> str:
-            addr = row['callback_group_addr']
-            return CallbackGroupAddr(addr).group_id
+        def to_callback_group_id(df: pd.DataFrame) -> List[str]:
+            return [CallbackGroupAddr.to_id(addr) for addr in df['callback_group_addr'].to_list()]
 
-        callback_groups.add_column('callback_group_id', to_callback_group_id)
+        callback_groups.add_column_from_columns('callback_group_id', to_callback_group_id)
         callback_groups.set_columns(columns)
 
         # data.callback_groups returns duplicate results that differ only in timestamp.
@@ -928,9 +931,8 @@ class DataFrameFormatted:
             'period_ns', 'symbol', 'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'timer_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'timer_callback_' + df['callback_object'].astype(str)
         timers = data.timers.clone()
         timers.reset_index()
         timers.rename_column('period', 'period_ns')
@@ -959,7 +961,7 @@ class DataFrameFormatted:
         callback_group_timer.reset_index()
         merge(timers, callback_group_timer, 'timer_handle')
 
-        timers.add_column('callback_id', callback_id)
+        timers.add_column_from_columns('callback_id', callback_id)
 
         timers.set_columns(columns)
 
@@ -980,9 +982,8 @@ class DataFrameFormatted:
             'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'subscription_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'subscription_callback_' + df['callback_object'].astype(str)
 
         merge_drop_columns = ['tid', 'rmw_handle']
 
@@ -1008,15 +1009,13 @@ class DataFrameFormatted:
         callback_group_subscription.reset_index()
         merge(subscriptions, callback_group_subscription, 'subscription_handle')
 
-        subscriptions.add_column('callback_id', callback_id)
+        subscriptions.add_column_from_columns('callback_id', callback_id)
 
         subscriptions.set_columns(columns)
         subscriptions.drop_duplicate()
 
         return subscriptions
 
-    KeyType = Tuple[Union[int, str], Union[int, str], Union[str, int]]
-
     @staticmethod
     def _add_construction_order(
         data: TracePointData,
@@ -1028,18 +1027,13 @@ class DataFrameFormatted:
     ) -> None:
 
         data.sort(timestamp_column)
-        order: defaultdict[DataFrameFormatted.KeyType, int] = defaultdict(int)
 
-        def construct_order(row: pd.Series) -> int:
-            node = row[node_handle_column]
-            callback_param = row[callback_parameter_column]
-            symbol = row[symbol_column]
-            key: DataFrameFormatted.KeyType = node, callback_param, symbol
-            order_ = int(order[key])
-            order[key] += 1
-            return order_
+        def construct_order(df: pd.DataFrame) -> pd.Series:
+            # Number the rows with the same key in order of the timestamp.
+            keys = [node_handle_column, callback_parameter_column, symbol_column]
+            return df.groupby(keys, dropna=False, sort=False).cumcount()
 
-        data.add_column(column_name, construct_order)
+        data.add_column_from_columns(column_name, construct_order)
 
     @staticmethod
     def _build_srv_callbacks(
@@ -1050,9 +1044,8 @@ class DataFrameFormatted:
             'service_handle', 'callback_group_addr', 'service_name', 'symbol', 'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'service_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'service_callback_' + df['callback_object'].astype(str)
 
         merge_drop_columns = ['tid', 'rmw_handle']
 
@@ -1078,7 +1071,7 @@ class DataFrameFormatted:
         callback_group_service.reset_index()
         merge(services, callback_group_service, 'service_handle')
 
-        services.add_column('callback_id', callback_id)
+        services.add_column_from_columns('callback_id', callback_id)
 
         services.set_columns(columns)
         services.drop_duplicate()
@@ -1135,9 +1128,8 @@ class DataFrameFormatted:
             'subscription_handle', 'callback_group_addr', 'topic_name', 'symbol', 'depth'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'subscription_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'subscription_callback_' + df['callback_object'].astype(str)
 
         subscriptions = data.subscriptions.clone()
         subscriptions.reset_index()
@@ -1153,7 +1145,7 @@ class DataFrameFormatted:
         cbg.reset_index()
         merge(subscriptions, cbg, 'subscription_handle')
 
-        subscriptions.add_column('callback_id', callback_id)
+        subscriptions.add_column_from_columns('callback_id', callback_id)
 
         subscriptions.set_columns(columns)
         subscriptions.drop_duplicate()
@@ -1269,23 +1261,17 @@ class DataFrameFormatted:
         node = data.nodes.clone()
         node.reset_index()
 
-        def ns_and_node_name(row: pd.Series) -> str:
-            ns: str = row['namespace']
-            name: str = row['name']
-
-            if ns[-1] == '/':
-                return ns + name
-            else:
-                return ns + '/' + name
+        def ns_and_node_name(df: pd.DataFrame) -> pd.Series:
+            ns = df['namespace'].astype(str)
+            name = df['name'].astype(str)
+            return ns.where(ns.str.endswith('/'), ns + '/') + name
 
-        node.add_column('node_name', ns_and_node_name)
+        node.add_column_from_columns('node_name', ns_and_node_name)
 
-        def to_node_id(row: pd.Series) -> str:
-            node_name = row['node_name']
-            node_handle = row['node_handle']
-            return f'{node_name}_{node_handle}'
+        def to_node_id(df: pd.DataFrame) -> pd.Series:
+            return df['node_name'].astype(str) + '_' + df['node_handle'].astype(str)
 
-        node.add_column('node_id', to_node_id)
+        node.add_column_from_columns('node_id', to_node_id)
         node.set_columns(columns)
         node.drop_duplicate()
 
@@ -1302,3 +1288,27 @@ def merge(
     how = how or 'inner'
     merge_drop_columns = merge_drop_columns or ['timestamp', 'tid', 'rmw_handle']
     left_data.merge(right_data, on, how=how, drop_columns=merge_drop_columns)
+
+
+def iter_rows(df: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate rows as dictionaries.
+
+    Unlike DataFrame.iterrows, values are taken from the column arrays,
+    without constructing a Series for each row.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        data frame to iterate.
+
+    Yields
+    ------
+    Dict[str, Any]
+        column name and value of each row.
+
+    """
+    columns = list(df.columns)
+    # Nullable columns give numpy scalars by to_list(), so get them as Python objects.
+    for values in zip(*[df[column].to_numpy(dtype=object) for column in columns]):
+        yield dict(zip(columns, values))
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import cached_property
 from logging import getLogger
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 
@@ -30,6 +29,7 @@ from ...infra.interface import RuntimeDataProvider
 from ...infra.lttng.column_names import COLUMN_NAME
 from ...record import (merge, merge_sequential, RecordsFactory, RecordsInterface)
 from ...record.column import Columns, ColumnValue
+from ...record.records_cache import cached_records_property
 from ...value_objects import (CallbackChain,
                               CallbackStructValue,
                               CommunicationStructValue,
@@ -1322,23 +1322,9 @@ class FilteredRecordsSource:
             records.drop_columns(['tilde_subscription])
 
         """
-        grouped_records = self._grouped_tilde_sub_records
-        if len(grouped_records) == 0:
-            return RecordsFactory.create_instance(
-                None,
-                [
-                    ColumnValue(COLUMN_NAME.TILDE_SUBSCRIBE_TIMESTAMP),
-                    ColumnValue(COLUMN_NAME.TILDE_SUBSCRIPTION),
-                    ColumnValue(COLUMN_NAME.TILDE_MESSAGE_ID),
-                ]
-            )
-        sample_records = list(grouped_records.values())[0]
-        column_values = Columns.from_str(sample_records.columns).to_value()
-        sub_records = RecordsFactory.create_instance(None, column_values)
-
-        if tilde_subscription is not None and tilde_subscription in grouped_records:
-            sub_records_ = grouped_records[tilde_subscription].clone()
-            sub_records.concat(sub_records_)
+        tilde_subscriptions = [] if tilde_subscription is None else [tilde_subscription]
+        sub_records = self._lttng.compose_tilde_subscribe_records_by_subscriptions(
+            tilde_subscriptions)
 
         sub_records.drop_columns([COLUMN_NAME.TILDE_SUBSCRIPTION])
         return sub_records
@@ -1370,28 +1356,14 @@ class FilteredRecordsSource:
             )
 
         """
-        grouped_records = self._grouped_sub_records
-        if len(grouped_records) == 0:
-            return RecordsFactory.create_instance(
-                None,
-                [
-                    ColumnValue(COLUMN_NAME.CALLBACK_OBJECT),
-                    ColumnValue(COLUMN_NAME.CALLBACK_START_TIMESTAMP),
-                    ColumnValue(COLUMN_NAME.MESSAGE_TIMESTAMP),
-                    ColumnValue(COLUMN_NAME.SOURCE_TIMESTAMP),
-                ]
-            )
-        sample_records = list(grouped_records.values())[0]
-        column_values = Columns.from_str(sample_records.columns).to_value()
-        sub_records = RecordsFactory.create_instance(None, column_values)
-
-        if inter_callback_object in grouped_records:
-            sub_records.concat(grouped_records[inter_callback_object].clone())
+        sub_records = self._lttng.compose_subscribe_records_by_objects([inter_callback_object])
 
-        if intra_callback_object is not None and intra_callback_object in grouped_records:
-            intra_sub_records = grouped_records[intra_callback_object].clone()
-            sub_records.concat(intra_sub_records)
-            sub_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
+        if intra_callback_object is not None:
+            intra_sub_records = self._lttng.compose_subscribe_records_by_objects(
+                [intra_callback_object])
+            if len(intra_sub_records) > 0:
+                sub_records.concat(intra_sub_records)
+                sub_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
         return sub_records
 
@@ -1539,26 +1511,7 @@ class FilteredRecordsSource:
         - tilde_message_id (Optional)
 
         """
-        grouped_records = self._grouped_publish_records
-        if len(grouped_records) == 0:
-            return RecordsFactory.create_instance(
-                None,
-                [
-                    ColumnValue(COLUMN_NAME.PUBLISHER_HANDLE),
-                    ColumnValue(COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP),
-                    ColumnValue(COLUMN_NAME.MESSAGE_TIMESTAMP),
-                    ColumnValue(COLUMN_NAME.SOURCE_TIMESTAMP),
-                ]
-            )
-        sample_records = list(grouped_records.values())[0]
-        column_values = Columns.from_str(sample_records.columns).to_value()
-        pub_records = RecordsFactory.create_instance(None, column_values)
-
-        for publisher_handle in publisher_handles:
-            if publisher_handle in grouped_records:
-                inter_pub_records = grouped_records[publisher_handle].clone()
-                pub_records.concat(inter_pub_records)
-
+        pub_records = self._lttng.compose_publish_records_by_handles(publisher_handles)
         pub_records.sort(COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP)
 
         return pub_records
@@ -1585,39 +1538,12 @@ class FilteredRecordsSource:
             )
 
         """
-        grouped_records = self._grouped_tilde_pub_records
-        if len(grouped_records) == 0:
-            return RecordsFactory.create_instance(
-                None,
-                [
-                    ColumnValue(COLUMN_NAME.TILDE_PUBLISH_TIMESTAMP),
-                    ColumnValue(COLUMN_NAME.TILDE_PUBLISHER),
-                    ColumnValue(COLUMN_NAME.TILDE_MESSAGE_ID),
-                    ColumnValue(COLUMN_NAME.TILDE_SUBSCRIPTION),
-                ]
-            )
-        sample_records = list(grouped_records.values())[0]
-        column_values = Columns.from_str(sample_records.columns).to_value()
-        tilde_records = RecordsFactory.create_instance(None, column_values)
-
-        for tilde_publisher in tilde_publishers:
-            if tilde_publisher in grouped_records:
-                tilde_records_ = grouped_records[tilde_publisher].clone()
-                tilde_records.concat(tilde_records_)
+        tilde_records = self._lttng.compose_tilde_publish_records_by_publishers(
+            tilde_publishers)
 
         tilde_records.drop_columns([COLUMN_NAME.TILDE_PUBLISHER])
         return tilde_records
 
-    def _expand_key_tuple(
-        self,
-        group: Dict[Tuple[int, ...], RecordsInterface]
-    ) -> Dict[int, RecordsInterface]:
-        group_: Dict[int, RecordsInterface] = {}
-        for key in group.keys():
-            assert len(key) == 1
-            group_[key[0]] = group[key]
-        return group_
-
     def callback_records(
         self,
         inter_callback_object: int,
@@ -1643,63 +1569,23 @@ class FilteredRecordsSource:
             )
 
         """
-        records = self._grouped_callback_records
-        callback_records = RecordsFactory.create_instance(
-            None,
-            [
-                ColumnValue(COLUMN_NAME.CALLBACK_START_TIMESTAMP),
-                ColumnValue(COLUMN_NAME.CALLBACK_END_TIMESTAMP),
-                ColumnValue(COLUMN_NAME.CALLBACK_OBJECT),
-            ]
-        )
-
-        if inter_callback_object in records:
-            inter_callback_records = records[inter_callback_object].clone()
-            callback_records.concat(inter_callback_records)
+        callback_records = self._lttng.compose_callback_records_by_object(inter_callback_object)
 
-        if intra_callback_object is not None and intra_callback_object in records:
-            intra_callback_records = records[intra_callback_object].clone()
-            callback_records.concat(intra_callback_records)
-            callback_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
+        if intra_callback_object is not None:
+            intra_callback_records = self._lttng.compose_callback_records_by_object(
+                intra_callback_object)
+            if len(intra_callback_records) > 0:
+                callback_records.concat(intra_callback_records)
+                callback_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
         return callback_records
 
-    @cached_property
-    def _grouped_callback_records(self) -> Dict[int, RecordsInterface]:
-        records = self._lttng.compose_callback_records()
-        group = records.groupby([COLUMN_NAME.CALLBACK_OBJECT])
-        return self._expand_key_tuple(group)
-
-    @cached_property
+    @cached_records_property
     def _grouped_inter_comm_records(self) -> Dict[Tuple[int, ...], RecordsInterface]:
         records = self._lttng.compose_inter_proc_comm_records()
         return records.groupby([COLUMN_NAME.CALLBACK_OBJECT, COLUMN_NAME.PUBLISHER_HANDLE])
 
-    @cached_property
+    @cached_records_property
     def _grouped_intra_comm_records(self) -> Dict[Tuple[int, ...], RecordsInterface]:
         records = self._lttng.compose_intra_proc_comm_records()
         return records.groupby([COLUMN_NAME.CALLBACK_OBJECT, COLUMN_NAME.PUBLISHER_HANDLE])
-
-    @cached_property
-    def _grouped_publish_records(self) -> Dict[int, RecordsInterface]:
-        records = self._lttng.compose_publish_records()
-        group = records.groupby([COLUMN_NAME.PUBLISHER_HANDLE])
-        return self._expand_key_tuple(group)
-
-    @cached_property
-    def _grouped_sub_records(self) -> Dict[int, RecordsInterface]:
-        records = self._lttng.compose_subscribe_records()
-        group = records.groupby([COLUMN_NAME.CALLBACK_OBJECT])
-        return self._expand_key_tuple(group)
-
-    @cached_property
-    def _grouped_tilde_pub_records(self) -> Dict[int, RecordsInterface]:
-        records = self._lttng.compose_tilde_publish_records()
-        group = records.groupby([COLUMN_NAME.TILDE_PUBLISHER])
-        return self._expand_key_tuple(group)
-
-    @cached_property
-    def _grouped_tilde_sub_records(self) -> Dict[int, RecordsInterface]:
-        records = self._lttng.compose_tilde_subscribe_records()
-        group = records.groupby([COLUMN_NAME.TILDE_SUBSCRIPTION])
-        return self._expand_key_tuple(group)
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
 from functools import cached_property
 
-from typing import Dict, List, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from .column_names import COLUMN_NAME
 from .events_factory import EventsFactory
@@ -27,6 +30,84 @@ from ...record import (merge, merge_sequential,
                        RecordsFactory,
                        RecordsInterface)
 from ...record.column import Columns, ColumnValue
+from ...record.records_cache import (cached_records_property, RecordsCache,
+                                     records_cache_owner_id)
+
+
+class KeyedRecords:
+    """
+    Records memoized per key.
+
+    By default, records of the whole trace are composed once and grouped by the key column.
+    In on-demand mode, records are composed and memoized individually per key
+    only when the key is requested.
+    Memoized records are held in RecordsCache and may be composed again after eviction.
+
+    """
+
+    def __init__(
+        self,
+        whole_records: Callable[[], RecordsInterface],
+        compose: Callable[[Set[int]], RecordsInterface],
+        key_column: str,
+        on_demand: bool
+    ) -> None:
+        self._whole_records = whole_records
+        self._compose = compose
+        self._key_column = key_column
+        self._on_demand = on_demand
+        self._columns: Optional[Sequence[ColumnValue]] = None
+
+    def get(self, keys: Sequence[int]) -> RecordsInterface:
+        """
+        Get records of the keys.
+
+        Parameters
+        ----------
+        keys : Sequence[int]
+            target keys.
+
+        Returns
+        -------
+        RecordsInterface
+            Records of the keys concatenated in the order of keys.
+            The returned records can be modified without affecting the memoized records.
+
+        """
+        if self._on_demand:
+            grouped = self._compose_on_demand(keys)
+        else:
+            grouped = RecordsCache.get_or_compose(
+                records_cache_owner_id(self), 'grouped', self._group_whole_records)
+
+        assert self._columns is not None
+        records = RecordsFactory.create_instance(None, self._columns)
+        for key in keys:
+            if key in grouped and len(grouped[key]) > 0:
+                records.concat(grouped[key].clone())
+        return records
+
+    def _group_whole_records(self) -> Dict[int, RecordsInterface]:
+        whole_records = self._whole_records()
+        self._columns = Columns.from_str(whole_records.columns).to_value()
+        grouped: Dict[int, RecordsInterface] = {}
+        for k, v in whole_records.groupby([self._key_column]).items():
+            assert len(k) == 1
+            grouped[k[0]] = v
+        return grouped
+
+    def _compose_on_demand(self, keys: Sequence[int]) -> Dict[int, RecordsInterface]:
+        owner_id = records_cache_owner_id(self)
+        grouped: Dict[int, RecordsInterface] = {}
+        for key in keys:
+            grouped[key] = RecordsCache.get_or_compose(
+                owner_id, key, lambda: self._compose({key}))
+            if self._columns is None:
+                self._columns = Columns.from_str(grouped[key].columns).to_value()
+
+        if self._columns is None:
+            self._columns = Columns.from_str(self._compose(set()).columns).to_value()
+        return grouped
 
 
 class RecordsSource():
@@ -34,11 +115,29 @@ class RecordsSource():
     def __init__(
         self,
         data: Ros2DataModel,
-        info: LttngInfo
+        info: LttngInfo,
+        *,
+        on_demand: bool = False
     ) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        data : Ros2DataModel
+            trace data.
+        info : LttngInfo
+            trace information.
+        on_demand : bool
+            If True, publish, subscribe and TILDE records are composed per handle
+            when they are requested, instead of composing them for the whole trace.
+            Intended for analyses which touch only a part of a large system.
+
+        """
         self._data = data
         self._preprocess(self._data)
         self._info = info
+        self._on_demand = on_demand
 
     @staticmethod
     def _preprocess(data: Ros2DataModel):
@@ -46,7 +145,33 @@ class RecordsSource():
             {COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP: COLUMN_NAME.RCLCPP_INTER_PUBLISH_TIMESTAMP}
         )
 
-    @cached_property
+    def _select(
+        self,
+        records: RecordsInterface,
+        column: str,
+        keys: Set[int]
+    ) -> RecordsInterface:
+        """
+        Copy records whose value of the column is contained in keys.
+
+        Row positions are indexed at the first selection for each records and column,
+        so that subsequent selections cost only the number of selected records.
+
+        """
+        positions = RecordsCache.get_or_compose(
+            records_cache_owner_id(self), ('row_positions', id(records), column),
+            lambda: self._group_positions(records.get_column_series(column)))
+
+        selected = sorted(
+            position for key in keys for position in positions.get(key, [])
+        )
+        data = records.data
+        return RecordsFactory.create_instance(
+            [dict(data[position].data) for position in selected],
+            Columns.from_str(records.columns).to_value()
+        )
+
+    @cached_records_property
     def _grouped_callback_start(self) -> Dict[int, RecordsInterface]:
         records = self._data.callback_start_instances.clone()
         group: Dict[int, RecordsInterface] = {}
@@ -55,7 +180,7 @@ class RecordsSource():
             group[k[0]] = v
         return group
 
-    @cached_property
+    @cached_records_property
     def inter_proc_comm_records(self) -> RecordsInterface:
         """
         Compose inter process communication records.
@@ -225,7 +350,7 @@ class RecordsSource():
 
         return communication
 
-    @cached_property
+    @cached_records_property
     def publish_records(self) -> RecordsInterface:
         """
         Compose publish records.
@@ -242,11 +367,73 @@ class RecordsSource():
             - source_timestamp
 
         """
-        inter_proc_publish = self._data.rclcpp_publish_instances
+        return self._compose_publish_records()
+
+    def get_publish_records(
+        self,
+        publisher_handles: Sequence[int]
+    ) -> RecordsInterface:
+        """
+        Compose publish records of the given publishers.
+
+        Parameters
+        ----------
+        publisher_handles : Sequence[int]
+            target publisher handles.
 
+        Returns
+        -------
+        RecordsInterface
+            Equivalent to publish_records filtered by publisher_handle.
+            Records are concatenated in the order of publisher_handles.
+
+        """
+        return self._keyed_publish_records.get(publisher_handles)
+
+    @cached_property
+    def _keyed_publish_records(self) -> KeyedRecords:
+        return KeyedRecords(
+            lambda: self.publish_records,
+            self._compose_publish_records,
+            COLUMN_NAME.PUBLISHER_HANDLE,
+            self._on_demand,
+        )
+
+    def _compose_publish_records(
+        self,
+        publisher_handles: Optional[Set[int]] = None
+    ) -> RecordsInterface:
+        inter_proc_publish = self._data.rclcpp_publish_instances
         rcl_publish_records = self._data.rcl_publish_instances
+        dds_write = self._data.dds_write_instances
+        dds_bind_addr_to_stamp = self._data.dds_bind_addr_to_stamp
+        intra_proc_publish = self._data.rclcpp_intra_publish_instances
+
+        # Optional tracepoints are judged by the whole trace
+        # so that the columns do not depend on the target publishers.
+        has_rcl_publish = len(rcl_publish_records) > 0
+        has_dds_write = len(dds_write) > 0
+
+        if publisher_handles is None:
+            intra_proc_publish = intra_proc_publish.clone()
+        else:
+            # Inter-process publish records are bound per thread,
+            # so all records of the threads which publish the target messages are used.
+            tids = {
+                record.get('tid')
+                for record
+                in self._select(inter_proc_publish, COLUMN_NAME.PUBLISHER_HANDLE,
+                                publisher_handles).data
+            }
+            inter_proc_publish = self._select(inter_proc_publish, 'tid', tids)
+            rcl_publish_records = self._select(rcl_publish_records, 'tid', tids)
+            dds_write = self._select(dds_write, 'tid', tids)
+            dds_bind_addr_to_stamp = self._select(dds_bind_addr_to_stamp, 'tid', tids)
+            intra_proc_publish = self._select(
+                intra_proc_publish, COLUMN_NAME.PUBLISHER_HANDLE, publisher_handles)
+
         rcl_publish_records.drop_columns([COLUMN_NAME.PUBLISHER_HANDLE])
-        if len(rcl_publish_records) > 0:
+        if has_rcl_publish:
             inter_proc_publish = merge_sequential(
                 left_records=inter_proc_publish,
                 right_records=rcl_publish_records,
@@ -266,8 +453,7 @@ class RecordsSource():
                 progress_label='binding: rclcpp_publish and rcl_publish',
             )
 
-        dds_write = self._data.dds_write_instances
-        if len(dds_write) > 0:
+        if has_dds_write:
             inter_proc_publish = merge_sequential(
                 left_records=inter_proc_publish,
                 right_records=dds_write,
@@ -284,13 +470,13 @@ class RecordsSource():
 
         inter_proc_publish = merge_sequential(
             left_records=inter_proc_publish,
-            right_records=self._data.dds_bind_addr_to_stamp,
+            right_records=dds_bind_addr_to_stamp,
             left_stamp_key=COLUMN_NAME.RCLCPP_INTER_PUBLISH_TIMESTAMP,
             right_stamp_key=COLUMN_NAME.DDS_BIND_ADDR_TO_STAMP_TIMESTAMP,
             join_left_key='tid',
             join_right_key='tid',
             columns=Columns.from_str(
-                inter_proc_publish.columns + self._data.dds_bind_addr_to_stamp.columns
+                inter_proc_publish.columns + dds_bind_addr_to_stamp.columns
             ).column_names,
             how='left',
             progress_label='binding: rclcpp_publish and source_timestamp',
@@ -306,7 +492,11 @@ class RecordsSource():
             ],
         )
 
-        intra_proc_publish = self._data.rclcpp_intra_publish_instances.clone()
+        if publisher_handles is not None:
+            inter_proc_publish.filter_if(
+                lambda x: x.get(COLUMN_NAME.PUBLISHER_HANDLE) in publisher_handles
+            )
+
         intra_proc_publish.drop_columns([COLUMN_NAME.MESSAGE])
         # intra_proc_publish.drop_columns([COLUMN_NAME.MESSAGE])
 
@@ -378,28 +568,38 @@ class RecordsSource():
         class TimerEventsFactory(EventsFactory):
 
             def __init__(self, controls: Sequence[TimerControl]) -> None:
-                self._controls = controls
+                self._controls = sorted(controls, key=lambda x: x.timestamp)
 
             def create(self, until_ns: int) -> RecordsInterface:
+                """
+                Create expected timer events.
 
+                Each TimerInit control generates events with its period
+                until the next control of the timer, which changes the period,
+                or until until_ns.
+
+                """
                 columns = [
                     ColumnValue(COLUMN_NAME.TIMER_EVENT_TIMESTAMP),
                 ]
 
-                records = RecordsFactory.create_instance(None, columns)
-                for control in self._controls:
-
-                    if isinstance(control, TimerInit):
-                        control.timestamp
-                        timer_timestamp = control.timestamp
-                        while timer_timestamp < until_ns:
-                            record = {
-                                COLUMN_NAME.TIMER_EVENT_TIMESTAMP: timer_timestamp,
-                            }
-                            records.append(record)
-                            timer_timestamp = timer_timestamp+control.period_ns
+                ends = [control.timestamp for control in self._controls[1:]] + [until_ns]
+                timestamps = [
+                    np.arange(
+                        control.timestamp, min(end, until_ns), control.period_ns, dtype=np.int64)
+                    for control, end in zip(self._controls, ends)
+                    if isinstance(control, TimerInit) and control.period_ns > 0
+                ]
+                if len(timestamps) == 0:
+                    return RecordsFactory.create_instance(None, columns)
 
-                return records
+                return RecordsFactory.create_instance(
+                    [
+                        {COLUMN_NAME.TIMER_EVENT_TIMESTAMP: timestamp}
+                        for timestamp in np.concatenate(timestamps).tolist()
+                    ],
+                    columns
+                )
 
         timer_controls = self._info.get_timer_controls()
 
@@ -408,7 +608,7 @@ class RecordsSource():
 
         return TimerEventsFactory(filtered_timer_controls)
 
-    @cached_property
+    @cached_records_property
     def tilde_publish_records(self) -> RecordsInterface:
         """
         Compose tilde publish records.
@@ -423,7 +623,46 @@ class RecordsSource():
             - tilde_subscription
 
         """
+        return self._compose_tilde_publish_records()
+
+    def get_tilde_publish_records(
+        self,
+        tilde_publishers: Sequence[int]
+    ) -> RecordsInterface:
+        """
+        Compose tilde publish records of the given TILDE publishers.
+
+        Parameters
+        ----------
+        tilde_publishers : Sequence[int]
+            target TILDE publishers.
+
+        Returns
+        -------
+        RecordsInterface
+            Equivalent to tilde_publish_records filtered by tilde_publisher.
+
+        """
+        return self._keyed_tilde_publish_records.get(tilde_publishers)
+
+    @cached_property
+    def _keyed_tilde_publish_records(self) -> KeyedRecords:
+        return KeyedRecords(
+            lambda: self.tilde_publish_records,
+            self._compose_tilde_publish_records,
+            COLUMN_NAME.TILDE_PUBLISHER,
+            self._on_demand,
+        )
+
+    def _compose_tilde_publish_records(
+        self,
+        tilde_publishers: Optional[Set[int]] = None
+    ) -> RecordsInterface:
         records = self._data.tilde_publish
+        if tilde_publishers is None:
+            records = records.clone()
+        else:
+            records = self._select(records, 'publisher', tilde_publishers)
         records.rename_columns({'publisher': 'tilde_publisher'})
 
         subscription: List[int] = []
@@ -435,7 +674,7 @@ class RecordsSource():
         records.drop_columns(['subscription_id'])
         return records
 
-    @cached_property
+    @cached_records_property
     def tilde_subscribe_records(self) -> RecordsInterface:
         """
         Compose tilde subscribe records.
@@ -449,11 +688,50 @@ class RecordsSource():
             - tilde_message_id
 
         """
+        return self._compose_tilde_subscribe_records()
+
+    def get_tilde_subscribe_records(
+        self,
+        tilde_subscriptions: Sequence[int]
+    ) -> RecordsInterface:
+        """
+        Compose tilde subscribe records of the given TILDE subscriptions.
+
+        Parameters
+        ----------
+        tilde_subscriptions : Sequence[int]
+            target TILDE subscriptions.
+
+        Returns
+        -------
+        RecordsInterface
+            Equivalent to tilde_subscribe_records filtered by tilde_subscription.
+
+        """
+        return self._keyed_tilde_subscribe_records.get(tilde_subscriptions)
+
+    @cached_property
+    def _keyed_tilde_subscribe_records(self) -> KeyedRecords:
+        return KeyedRecords(
+            lambda: self.tilde_subscribe_records,
+            self._compose_tilde_subscribe_records,
+            COLUMN_NAME.TILDE_SUBSCRIPTION,
+            self._on_demand,
+        )
+
+    def _compose_tilde_subscribe_records(
+        self,
+        tilde_subscriptions: Optional[Set[int]] = None
+    ) -> RecordsInterface:
         records = self._data.tilde_subscribe
+        if tilde_subscriptions is None:
+            records = records.clone()
+        else:
+            records = self._select(records, 'subscription', tilde_subscriptions)
         records.rename_columns({'subscription': 'tilde_subscription'})
         return records
 
-    @cached_property
+    @cached_records_property
     def intra_callback_records(self) -> RecordsInterface:
         intra_proc_subscribe = RecordsFactory.create_instance(
             None,
@@ -468,7 +746,7 @@ class RecordsSource():
             intra_proc_subscribe.concat(intra_callback_start)
         return intra_proc_subscribe
 
-    @cached_property
+    @cached_records_property
     def inter_callback_records(self) -> RecordsInterface:
         intra_proc_subscribe = RecordsFactory.create_instance(
             None,
@@ -483,10 +761,76 @@ class RecordsSource():
             intra_proc_subscribe.concat(intra_callback_start)
         return intra_proc_subscribe
 
-    @cached_property
+    @cached_records_property
     def subscribe_records(self) -> RecordsInterface:
-        callback_start_instances = self.inter_callback_records
+        """
+        Compose subscribe records.
+
+        Returns
+        -------
+        RecordsInterface
+            columns:
+            - dispatch_subscription_callback_timestamp
+            - callback_object
+            - message
+            - source_timestamp
+            - message_timestamp
+            - callback_start_timestamp
+            - is_intra_process
+
+        """
+        return self._compose_subscribe_records()
+
+    def get_subscribe_records(
+        self,
+        callback_objects: Sequence[int]
+    ) -> RecordsInterface:
+        """
+        Compose subscribe records of the given callback objects.
+
+        Parameters
+        ----------
+        callback_objects : Sequence[int]
+            target callback objects.
+
+        Returns
+        -------
+        RecordsInterface
+            Equivalent to subscribe_records filtered by callback_object.
+            Records are concatenated in the order of callback_objects.
+
+        """
+        return self._keyed_subscribe_records.get(callback_objects)
+
+    @cached_property
+    def _keyed_subscribe_records(self) -> KeyedRecords:
+        return KeyedRecords(
+            lambda: self.subscribe_records,
+            self._compose_subscribe_records,
+            COLUMN_NAME.CALLBACK_OBJECT,
+            self._on_demand,
+        )
+
+    def _compose_subscribe_records(
+        self,
+        callback_objects: Optional[Set[int]] = None
+    ) -> RecordsInterface:
         inter_proc_subscribe = self._data.dispatch_subscription_callback_instances
+        if callback_objects is None:
+            callback_start_instances = self.inter_callback_records
+            intra_proc_subscribe = self.intra_callback_records
+        else:
+            # All of the following bindings are joined by callback_object.
+            inter_proc_subscribe = self._select(
+                inter_proc_subscribe, COLUMN_NAME.CALLBACK_OBJECT, callback_objects)
+            callback_start_instances = self._select(
+                self._data.callback_start_instances, COLUMN_NAME.CALLBACK_OBJECT,
+                callback_objects)
+            intra_proc_subscribe = callback_start_instances.clone()
+            callback_start_instances.filter_if(
+                lambda x: x.get(COLUMN_NAME.IS_INTRA_PROCESS) == 0)
+            intra_proc_subscribe.filter_if(
+                lambda x: x.get(COLUMN_NAME.IS_INTRA_PROCESS) == 1)
 
         inter_proc_subscribe = merge_sequential(
             left_records=inter_proc_subscribe,
@@ -502,8 +846,6 @@ class RecordsSource():
             progress_label='binding: dispatch_subscription_callback and callback_start',
         )
 
-        intra_proc_subscribe = self.intra_callback_records
-
         subscribe = merge_sequential(
             left_records=inter_proc_subscribe,
             right_records=intra_proc_subscribe,
@@ -520,7 +862,7 @@ class RecordsSource():
 
         return subscribe
 
-    @cached_property
+    @cached_records_property
     def intra_proc_comm_records(self) -> RecordsInterface:
         """
         Compose intra process communication records.
@@ -620,7 +962,130 @@ class RecordsSource():
 
         return intra_records
 
-    @cached_property
+    @cached_records_property
+    def _callback_pair_index(self) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Build an index of callback_start and callback_end pairs.
+
+        Each callback_start is paired with the first callback_end of the same callback object
+        which occurs before the next callback_start of the callback object.
+        This is equivalent to merge_sequential with how='inner'.
+
+        Returns
+        -------
+        Dict[int, Tuple[np.ndarray, np.ndarray]]
+            callback_object -> (callback_start positions, callback_end positions)
+            Positions are row indices of callback_start_instances and callback_end_instances.
+            Pairs are sorted by callback_start_timestamp.
+
+        """
+        start_stamps = self._callback_start_stamps
+        end_stamps = self._callback_end_stamps
+
+        start_positions = self._group_positions(
+            self._data.callback_start_instances.get_column_series(COLUMN_NAME.CALLBACK_OBJECT))
+        end_positions = self._group_positions(
+            self._data.callback_end_instances.get_column_series(COLUMN_NAME.CALLBACK_OBJECT))
+
+        stamp_max = np.iinfo(np.int64).max
+        index: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        for callback_object, start_pos_list in start_positions.items():
+            if callback_object not in end_positions:
+                continue
+            start_pos = np.array(start_pos_list, dtype=np.int64)
+            start_pos = start_pos[np.argsort(start_stamps[start_pos], kind='stable')]
+            end_pos = np.array(end_positions[callback_object], dtype=np.int64)
+            end_pos = end_pos[np.argsort(end_stamps[end_pos], kind='stable')]
+
+            starts = start_stamps[start_pos]
+            ends = end_stamps[end_pos]
+            next_starts = np.append(starts[1:], stamp_max)
+
+            end_idx = np.searchsorted(ends, starts, side='left')
+            has_end = end_idx < len(ends)
+            end_idx = np.minimum(end_idx, len(ends) - 1)
+            is_paired = has_end & (ends[end_idx] < next_starts)
+
+            index[callback_object] = (start_pos[is_paired], end_pos[end_idx[is_paired]])
+
+        return index
+
+    @staticmethod
+    def _group_positions(keys: Sequence[Optional[int]]) -> Dict[int, List[int]]:
+        positions: Dict[int, List[int]] = defaultdict(list)
+        for i, key in enumerate(keys):
+            if key is None:
+                continue
+            positions[key].append(i)
+        return positions
+
+    @cached_records_property
+    def _callback_start_stamps(self) -> np.ndarray:
+        return np.array(
+            self._data.callback_start_instances.get_column_series(
+                COLUMN_NAME.CALLBACK_START_TIMESTAMP),
+            dtype=np.int64)
+
+    @cached_records_property
+    def _callback_end_stamps(self) -> np.ndarray:
+        return np.array(
+            self._data.callback_end_instances.get_column_series(
+                COLUMN_NAME.CALLBACK_END_TIMESTAMP),
+            dtype=np.int64)
+
+    def _to_callback_records(
+        self,
+        callback_objects: Sequence[int],
+        start_pos: np.ndarray,
+        end_pos: np.ndarray,
+    ) -> RecordsInterface:
+        start_stamps = self._callback_start_stamps[start_pos].tolist()
+        end_stamps = self._callback_end_stamps[end_pos].tolist()
+        return RecordsFactory.create_instance(
+            [
+                {
+                    COLUMN_NAME.CALLBACK_START_TIMESTAMP: start_stamp,
+                    COLUMN_NAME.CALLBACK_END_TIMESTAMP: end_stamp,
+                    COLUMN_NAME.CALLBACK_OBJECT: callback_object,
+                }
+                for start_stamp, end_stamp, callback_object
+                in zip(start_stamps, end_stamps, callback_objects)
+            ],
+            [
+                ColumnValue(COLUMN_NAME.CALLBACK_START_TIMESTAMP),
+                ColumnValue(COLUMN_NAME.CALLBACK_END_TIMESTAMP),
+                ColumnValue(COLUMN_NAME.CALLBACK_OBJECT),
+            ]
+        )
+
+    def get_callback_records(
+        self,
+        callback_object: int
+    ) -> RecordsInterface:
+        """
+        Compose callback records of a single callback object.
+
+        Parameters
+        ----------
+        callback_object : int
+            target callback object.
+
+        Returns
+        -------
+        RecordsInterface
+            Equivalent to callback_records filtered by callback_object.
+            columns:
+            - callback_start_timestamp
+            - callback_end_timestamp
+            - callback_object
+
+        """
+        empty = np.array([], dtype=np.int64)
+        start_pos, end_pos = self._callback_pair_index.get(callback_object, (empty, empty))
+        return self._to_callback_records(
+            [callback_object] * len(start_pos), start_pos, end_pos)
+
+    @cached_records_property
     def callback_records(self) -> RecordsInterface:
         """
         Compose callback records.
@@ -638,33 +1103,18 @@ class RecordsSource():
             - callback_object
 
         """
-        records: RecordsInterface
-
-        records = merge_sequential(
-            left_records=self._data.callback_start_instances,
-            right_records=self._data.callback_end_instances,
-            left_stamp_key=COLUMN_NAME.CALLBACK_START_TIMESTAMP,
-            right_stamp_key=COLUMN_NAME.CALLBACK_END_TIMESTAMP,
-            join_left_key=COLUMN_NAME.CALLBACK_OBJECT,
-            join_right_key=COLUMN_NAME.CALLBACK_OBJECT,
-            columns=[
-                COLUMN_NAME.CALLBACK_START_TIMESTAMP,
-                COLUMN_NAME.CALLBACK_END_TIMESTAMP,
-                COLUMN_NAME.CALLBACK_OBJECT,
-                COLUMN_NAME.IS_INTRA_PROCESS,
-            ],
-            how='inner',
-            progress_label='binding: callback_start and callback_end'
-        )
-
-        records.drop_columns(
-            [
-                COLUMN_NAME.IS_INTRA_PROCESS
-            ]
-        )
-
-        return records
-
-    @cached_property
+        index = self._callback_pair_index
+        callback_objects: List[int] = []
+        for callback_object, (start_pos, _) in index.items():
+            callback_objects += [callback_object] * len(start_pos)
+        empty = np.array([], dtype=np.int64)
+        start_pos = np.concatenate([empty] + [v[0] for v in index.values()])
+        end_pos = np.concatenate([empty] + [v[1] for v in index.values()])
+
+        order = np.lexsort((start_pos, self._callback_start_stamps[start_pos]))
+        return self._to_callback_records(
+            [callback_objects[i] for i in order], start_pos[order], end_pos[order])
+
+    @cached_records_property
     def system_and_sim_times(self) -> RecordsInterface:
         return self._data.sim_time
@@ -252,6 +252,32 @@ class TracePointData:
 
         self._df = df
 
+    def add_column_from_columns(
+        self,
+        column: str,
+        f: Callable[[pd.DataFrame], Union[pd.Series, Sequence[Any]]]
+    ) -> None:
+        """
+        Add column computed from whole columns at once.
+
+        Parameters
+        ----------
+        column : str
+            column name to be added.
+        f : Callable[[pd.DataFrame], Union[pd.Series, Sequence[Any]]]
+            column values computed from the data frame.
+            The length must be the same as the number of rows.
+
+        """
+        df = self._df.copy()
+        values = f(df)
+        # Assign as a list, in the same way as add_column, to get the same dtype.
+        if isinstance(values, pd.Series):
+            values = values.to_list()
+        df[column] = values
+
+        self._df = df
+
     def remove_column(self, column: str) -> None:
         """
         Remove column.
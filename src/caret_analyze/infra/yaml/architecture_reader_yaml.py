@@ -29,13 +29,16 @@ from ...value_objects import (CallbackGroupValue, CallbackType, ExecutorValue,
 
 logger = getLogger(__name__)
 
+# libyaml bindings are much faster than the pure-Python implementation.
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class ArchitectureReaderYaml(ArchitectureReader):
 
     def __init__(self, file_path: str):
         with open(file_path, 'r') as f:
             yaml_str = f.read()
-        self._arch = yaml.safe_load(yaml_str)
+        self._arch = yaml.load(yaml_str, Loader=SafeLoader)
 
         if self._arch is None:
             raise InvalidYamlFormatError('Failed to parse yaml.')
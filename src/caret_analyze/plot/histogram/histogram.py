@@ -53,7 +53,7 @@ class ResponseTimePlot(HistPlot):
                    y_axis_label='Probability')
         color_selector = PlotColorSelector()
         for _, path in enumerate(self._target):
-            records = path.to_records()
+            records = path.to_records(copy=False)
             response = ResponseTime(records)
 
             if self._case == 'best-to-worst':
@@ -94,7 +94,7 @@ class FrequencyTimeSeries(MetricsBase):
         min_time, max_time = self._get_timestamp_range(self._target_objects)
         timeseries_records_list: List[RecordsInterface] = []
         for target_object in self._target_objects:
-            frequency = Frequency(target_object.to_records())
+            frequency = Frequency(target_object.to_records(copy=False))
             timeseries_records_list.append(frequency.to_records(
                 base_timestamp=min_time, until_timestamp=max_time
             ))
@@ -112,7 +112,7 @@ class FrequencyTimeSeries(MetricsBase):
         first_timestamps = []
         last_timestamps = []
         for to in target_objects:
-            records = to.to_records()
+            records = to.to_records(copy=False)
             if len(records) == 0:
                 continue
             first_timestamp = records.get_column_series(records.columns[0])[0]
@@ -92,7 +92,7 @@ class LatencyTimeSeries(MetricsBase):
         """
         timeseries_records_list: List[RecordsInterface] = []
         for target_object in self._target_objects:
-            latency = Latency(target_object.to_records())
+            latency = Latency(target_object.to_records(copy=False))
             timeseries_records_list.append(latency.to_records())
 
         if xaxis_type == 'sim_time':
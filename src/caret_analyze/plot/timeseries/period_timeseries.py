@@ -99,7 +99,7 @@ class PeriodTimeSeries(MetricsBase):
         """
         timeseries_records_list: List[RecordsInterface] = []
         for target_object in self._target_objects:
-            period = Period(target_object.to_records())
+            period = Period(target_object.to_records(copy=False))
             timeseries_records_list.append(period.to_records())
 
         if xaxis_type == 'sim_time':
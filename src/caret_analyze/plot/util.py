@@ -119,7 +119,7 @@ def get_range(
         The timestamp of measurement start and measurement end
 
     """
-    po_valid = [po for po in plot_objects if len(po.to_records()) > 0]
+    po_valid = [po for po in plot_objects if len(po.to_records(copy=False)) > 0]
     if len(po_valid) == 0:
         logger.warning('Failed to found measurement results.')
         return 0, 1
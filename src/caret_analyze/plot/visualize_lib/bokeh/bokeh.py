@@ -107,7 +107,7 @@ class Bokeh(VisualizeLibInterface):
         # Apply xaxis offset
         callbacks: List[CallbackBase] = Util.flatten(
             cbg.callbacks for cbg in callback_groups if len(cbg.callbacks) > 0)
-        records_range = Range([cb.to_records() for cb in callbacks])
+        records_range = Range([cb.to_records(copy=False) for cb in callbacks])
         range_min, range_max = records_range.get_range()
         clip_min = int(range_min + lstrip_s*1.0e9)
         clip_max = int(range_max - rstrip_s*1.0e9)
@@ -267,7 +267,7 @@ class Bokeh(VisualizeLibInterface):
         p = figure(**fig_args)
 
         # Apply xaxis offset
-        records_range = Range([to.to_records() for to in target_objects])
+        records_range = Range([to.to_records(copy=False) for to in target_objects])
         frame_min, frame_max = records_range.get_range()
         if xaxis_type == 'system_time':
             self._apply_x_axis_offset(p, 'x_axis_plot', frame_min, frame_max)
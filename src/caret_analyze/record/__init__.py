@@ -22,6 +22,7 @@ from .record import (merge,
                      Records,
                      RecordsInterface)
 from .record_factory import RecordFactory, RecordsFactory
+from .records_cache import RecordsCache, RecordsCacheStatistics
 from .records_service import Frequency, Latency, Period, Range, ResponseTime
 
 __all__ = [
@@ -38,6 +39,8 @@ __all__ = [
     'RecordInterface',
     'Records',
     'Range',
+    'RecordsCache',
+    'RecordsCacheStatistics',
     'RecordsFactory',
     'RecordsInterface',
     'ResponseTime',
@@ -66,6 +66,14 @@ class Strip(DataFrameShaper):
         clip = self.to_clip(df)
         return clip.execute(df)
 
+    @property
+    def lstrip_ns(self) -> float:
+        return self._lstrip_ns
+
+    @property
+    def rstrip_ns(self) -> float:
+        return self._rstrip_ns
+
     def to_clip(self, df: pd.DataFrame) -> Clip:
         if len(df.columns) == 0 or len(df) == 0:
             return Clip(0, 1)
@@ -318,13 +318,7 @@ class Records(RecordsInterface):
     def _get_column_series_core(records: RecordsInterface, column_name: str):
         if column_name not in records.columns:
             raise InvalidArgumentError(f'Unknown column_name: {column_name}')
-        l: List[Optional[int]] = []
-        for datum in records.data:
-            if column_name in datum.columns:
-                l.append(datum.get(column_name))
-            else:
-                l.append(None)
-        return l
+        return [datum.data.get(column_name) for datum in records.data]
 
     @staticmethod
     def _to_dataframe(
@@ -0,0 +1,442 @@
+# Copyright 2021 Research Institute of Systems Planning, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from itertools import count
+import os
+import sys
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import weakref
+
+import numpy as np
+
+from .interface import RecordsInterface
+from ..value_objects import ValueObject
+
+CacheKey = Tuple[int, Hashable]
+
+
+def _default_max_bytes() -> Optional[int]:
+    # A quarter of the physical memory. None if it is unknown.
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 4
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class RecordsCacheStatistics(ValueObject):
+    """Statistics of RecordsCache."""
+
+    def __init__(
+        self,
+        hits: int,
+        misses: int,
+        evictions: int,
+        entries: int,
+        size_bytes: int,
+        max_bytes: Optional[int],
+    ) -> None:
+        self._hits = hits
+        self._misses = misses
+        self._evictions = evictions
+        self._entries = entries
+        self._size_bytes = size_bytes
+        self._max_bytes = max_bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def entries(self) -> int:
+        return self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def hit_ratio(self) -> float:
+        requests = self._hits + self._misses
+        if requests == 0:
+            return 0.0
+        return self._hits / requests
+
+
+class RecordsCache:
+    """
+    Memory-bounded LRU cache shared by records sources and runtime objects.
+
+    Composed records are stored with an estimated size.
+    When the total size exceeds RecordsCache.max_bytes,
+    the least recently used entries are evicted and composed again when requested.
+    The default budget is a quarter of the physical memory.
+    Set RecordsCache.max_bytes = None to disable eviction.
+    Sizes are estimated only while the memory budget is set or statistics are requested.
+    Each entry is composed once even if it is requested by several threads at the same time.
+
+    Examples
+    --------
+    >>> from caret_analyze import RecordsCache
+    >>> RecordsCache.set_max_bytes(4 * 1024**3)
+    >>> RecordsCache.statistics().hit_ratio
+
+    """
+
+    DEFAULT_MAX_BYTES: Optional[int] = _default_max_bytes()
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES
+
+    # Estimated sizes of a record for each implementation.
+    ROW_BYTES = 240
+    VALUE_BYTES = 80
+
+    _entries: OrderedDict[CacheKey, Any] = OrderedDict()
+    _sizes: Dict[CacheKey, int] = {}
+    _size_bytes = 0
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+    _owner_ids = count()
+    _lock = RLock()
+    # Locks of the entries being composed, and the number of threads using them.
+    _composing: Dict[CacheKey, Tuple[RLock, int]] = {}
+
+    @classmethod
+    def set_max_bytes(cls, max_bytes: Optional[int]) -> None:
+        """
+        Set memory budget.
+
+        Parameters
+        ----------
+        max_bytes : Optional[int]
+            Upper limit of the estimated cache size [byte]. None means unlimited.
+
+        """
+        with cls._lock:
+            cls.max_bytes = max_bytes
+            if max_bytes is not None:
+                cls._estimate_all()
+            cls._evict()
+
+    @classmethod
+    def register(cls, owner: Any) -> int:
+        """
+        Register an owner of cache entries.
+
+        Parameters
+        ----------
+        owner : Any
+            Object which owns cache entries.
+            Entries are discarded when the owner is garbage-collected.
+
+        Returns
+        -------
+        int
+            Owner id used as a part of the cache keys.
+
+        """
+        with cls._lock:
+            owner_id = next(cls._owner_ids)
+        weakref.finalize(owner, cls.discard, owner_id)
+        return owner_id
+
+    @classmethod
+    def get_or_compose(
+        cls,
+        owner_id: int,
+        name: Hashable,
+        compose: Callable[[], Any],
+    ) -> Any:
+        """
+        Get a cached value, or compose and store it.
+
+        Parameters
+        ----------
+        owner_id : int
+            Owner id returned by register.
+        name : Hashable
+            Entry name unique within the owner.
+        compose : Callable[[], Any]
+            Function to compose the value when it is not cached.
+
+        Returns
+        -------
+        Any
+            Cached or composed value.
+
+        """
+        key = (owner_id, name)
+        with cls._lock:
+            if key in cls._entries:
+                cls._hits += 1
+                cls._entries.move_to_end(key)
+                return cls._entries[key]
+            key_lock, users = cls._composing.get(key, (RLock(), 0))
+            cls._composing[key] = (key_lock, users + 1)
+
+        try:
+            # Wait for the other thread composing the same entry.
+            with key_lock:
+                with cls._lock:
+                    if key in cls._entries:
+                        cls._hits += 1
+                        cls._entries.move_to_end(key)
+                        return cls._entries[key]
+                    cls._misses += 1
+
+                value = compose()
+                cls.put(owner_id, name, value)
+                return value
+        finally:
+            with cls._lock:
+                key_lock, users = cls._composing[key]
+                if users == 1:
+                    del cls._composing[key]
+                else:
+                    cls._composing[key] = (key_lock, users - 1)
+
+    @classmethod
+    def get(cls, owner_id: int, name: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Parameters
+        ----------
+        owner_id : int
+            Owner id returned by register.
+        name : Hashable
+            Entry name unique within the owner.
+
+        Returns
+        -------
+        Optional[Any]
+            Cached value. None if not cached.
+
+        """
+        key = (owner_id, name)
+        with cls._lock:
+            if key not in cls._entries:
+                cls._misses += 1
+                return None
+            cls._hits += 1
+            cls._entries.move_to_end(key)
+            return cls._entries[key]
+
+    @classmethod
+    def contains(cls, owner_id: int, name: Hashable) -> bool:
+        """
+        Check whether a value is cached, without updating statistics.
+
+        Parameters
+        ----------
+        owner_id : int
+            Owner id returned by register.
+        name : Hashable
+            Entry name unique within the owner.
+
+        Returns
+        -------
+        bool
+            True if the value is cached.
+
+        """
+        with cls._lock:
+            return (owner_id, name) in cls._entries
+
+    @classmethod
+    def put(cls, owner_id: int, name: Hashable, value: Any) -> None:
+        """
+        Store a value.
+
+        Parameters
+        ----------
+        owner_id : int
+            Owner id returned by register.
+        name : Hashable
+            Entry name unique within the owner.
+        value : Any
+            Value to store.
+
+        """
+        key = (owner_id, name)
+        with cls._lock:
+            cls._pop(key)
+            cls._entries[key] = value
+            if cls.max_bytes is not None:
+                cls._estimate(key)
+            cls._evict()
+
+    @classmethod
+    def discard(cls, owner_id: int, name: Optional[Hashable] = None) -> None:
+        """
+        Discard cached values.
+
+        Parameters
+        ----------
+        owner_id : int
+            Owner id returned by register.
+        name : Optional[Hashable]
+            Entry name to discard. All entries of the owner are discarded if None.
+
+        """
+        with cls._lock:
+            if name is not None:
+                keys = [(owner_id, name)]
+            else:
+                keys = [key for key in cls._entries if key[0] == owner_id]
+            for key in keys:
+                cls._pop(key)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Discard all cached values and reset statistics."""
+        with cls._lock:
+            cls._entries.clear()
+            cls._sizes.clear()
+            cls._size_bytes = 0
+            cls._hits = 0
+            cls._misses = 0
+            cls._evictions = 0
+
+    @classmethod
+    def statistics(cls) -> RecordsCacheStatistics:
+        """
+        Get cache statistics.
+
+        Returns
+        -------
+        RecordsCacheStatistics
+            hits, misses, evictions and the estimated size.
+
+        """
+        with cls._lock:
+            cls._estimate_all()
+            return RecordsCacheStatistics(
+                cls._hits, cls._misses, cls._evictions,
+                len(cls._entries), cls._size_bytes, cls.max_bytes)
+
+    @classmethod
+    def estimate_size(cls, value: Any) -> int:
+        """
+        Estimate memory size of a cached value.
+
+        Parameters
+        ----------
+        value : Any
+            Records, numpy array, or containers of them.
+
+        Returns
+        -------
+        int
+            Estimated size [byte].
+
+        """
+        if isinstance(value, RecordsInterface):
+            return len(value) * (cls.ROW_BYTES + len(value.columns) * cls.VALUE_BYTES)
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, dict):
+            return sum(cls.estimate_size(v) for v in value.values())
+        if isinstance(value, (list, tuple)):
+            return sum(cls.estimate_size(v) for v in value)
+        if hasattr(value, 'cache_size'):
+            return value.cache_size
+        return sys.getsizeof(value)
+
+    @classmethod
+    def _estimate(cls, key: CacheKey) -> None:
+        if key not in cls._sizes:
+            cls._sizes[key] = cls.estimate_size(cls._entries[key])
+            cls._size_bytes += cls._sizes[key]
+
+    @classmethod
+    def _estimate_all(cls) -> None:
+        for key in cls._entries:
+            cls._estimate(key)
+
+    @classmethod
+    def _pop(cls, key: CacheKey) -> None:
+        cls._entries.pop(key, None)
+        cls._size_bytes -= cls._sizes.pop(key, 0)
+
+    @classmethod
+    def _evict(cls) -> None:
+        if cls.max_bytes is None:
+            return
+        while cls._size_bytes > cls.max_bytes and len(cls._entries) > 0:
+            key = next(iter(cls._entries))
+            cls._pop(key)
+            cls._evictions += 1
+
+
+class cached_records_property:
+    """
+    Property cached in RecordsCache.
+
+    Used in the same way as functools.cached_property,
+    except that the value may be evicted and composed again.
+
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self._func = func
+        self.__doc__ = func.__doc__
+        self._name = func.__name__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return RecordsCache.get_or_compose(
+            records_cache_owner_id(instance), self._name, lambda: self._func(instance))
+
+
+def records_cache_owner_id(instance: Any) -> int:
+    """
+    Get owner id of the instance, registering it at the first call.
+
+    Parameters
+    ----------
+    instance : Any
+        Object which owns cache entries.
+
+    Returns
+    -------
+    int
+        Owner id.
+
+    """
+    attrs: Dict[str, Any] = instance.__dict__
+    if '_records_cache_owner_id' not in attrs:
+        with RecordsCache._lock:
+            if '_records_cache_owner_id' not in attrs:
+                attrs['_records_cache_owner_id'] = RecordsCache.register(instance)
+    return attrs['_records_cache_owner_id']
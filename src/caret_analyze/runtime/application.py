@@ -15,10 +15,10 @@
 from __future__ import annotations, unicode_literals
 
 import fnmatch
-
+from functools import cached_property
 from logging import getLogger
-
-from typing import List, Optional, Union
+import re
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar, Union
 
 from .callback import CallbackBase
 from .callback_group import CallbackGroup
@@ -26,6 +26,7 @@ from .communication import Communication
 from .executor import Executor
 from .node import Node
 from .path import Path
+from .path_base import PathBase, prefetch_records
 from .publisher import Publisher
 from .subscription import Subscription
 from ..architecture import Architecture
@@ -39,6 +40,8 @@ from ..value_objects import NodePathStructValue
 
 logger = getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class Application(Summarizable):
     """A class that represents the entire application to be measured."""
@@ -73,12 +76,8 @@ class Application(Summarizable):
         else:
             raise UnsupportedTypeError('')
 
-        loaded = RuntimeLoaded(architecture, provider)
-
-        self._nodes: List[Node] = loaded.nodes
-        self._executors: List[Executor] = loaded.executors
-        self._communications: List[Communication] = loaded.communications
-        self._paths: List[Path] = loaded.paths
+        # Runtime objects are constructed on first access.
+        self._runtime = RuntimeLoaded(architecture, provider)
 
     @property
     def executors(self) -> List[Executor]:
@@ -91,7 +90,7 @@ class Application(Summarizable):
             All executors defined in the architecture.
 
         """
-        return sorted(self._executors, key=lambda x: x.executor_name)
+        return sorted(self._runtime.executors, key=lambda x: x.executor_name)
 
     @property
     def nodes(self) -> List[Node]:
@@ -104,7 +103,7 @@ class Application(Summarizable):
             All nodes defined in the architecture.
 
         """
-        return sorted(self._nodes, key=lambda x: x.node_name)
+        return sorted(self._runtime.nodes, key=lambda x: x.node_name)
 
     @property
     def communications(self) -> List[Communication]:
@@ -117,7 +116,7 @@ class Application(Summarizable):
             All communications defined in the architecture.
 
         """
-        return sorted(self._communications, key=lambda x: x.topic_name)
+        return sorted(self._runtime.communications, key=lambda x: x.topic_name)
 
     @property
     def publishers(self) -> List[Publisher]:
@@ -158,7 +157,7 @@ class Application(Summarizable):
             All paths defined in the architecture.
 
         """
-        return sorted(self._paths, key=lambda x: x.path_name or '')
+        return sorted(self._runtime.paths, key=lambda x: x.path_name or '')
 
     @property
     def callbacks(self) -> List[CallbackBase]:
@@ -208,10 +207,58 @@ class Application(Summarizable):
         def get_name(x):
             return x.path_name
 
+        paths = self._runtime.get_paths(path_name)
+        if len(paths) > 0:
+            return paths[0]
+
         return Util.find_similar_one(path_name,
                                      self.paths,
                                      get_name)
 
+    def prefetch_path_records(
+        self,
+        path_names: Optional[Sequence[str]] = None,
+        max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Build records of paths with concurrent workers.
+
+        Records of node paths and communications are independent until they are merged,
+        so they are built concurrently and then merged per path.
+        Subsequent to_records/to_dataframe calls of the paths use the built records.
+
+        Parameters
+        ----------
+        path_names : Optional[Sequence[str]]
+            path names to build. All paths are built if None.
+        max_workers : Optional[int]
+            The maximum number of workers.
+            Records are built serially if None or 1,
+            or if processes would be forked while other threads are running.
+
+        Raises
+        ------
+        InvalidArgumentError
+            Occurs when the given argument type is invalid.
+        ItemNotFoundError
+            Occurs when no items were found.
+        MultipleItemFoundError
+            Occurs when several items were found.
+
+        """
+        if path_names is None:
+            paths = self.paths
+        else:
+            paths = [self.get_path(path_name) for path_name in path_names]
+
+        elements: Dict[int, PathBase] = {}
+        for path in paths:
+            for child in path.child:
+                elements[id(child)] = child
+
+        prefetch_records(list(elements.values()), max_workers)
+        prefetch_records(paths, 1)
+
     def get_executor(
         self,
         executor_name: str
@@ -246,6 +293,10 @@ class Application(Summarizable):
         def get_name(x):
             return x.executor_name
 
+        executor = self._executor_index.get(executor_name)
+        if executor is not None:
+            return executor
+
         return Util.find_similar_one(executor_name,
                                      self.executors,
                                      get_name)
@@ -303,6 +354,10 @@ class Application(Summarizable):
         def get_name(x):
             return x.callback_group_name
 
+        callback_group = self._callback_group_index.get(callback_group_name)
+        if callback_group is not None:
+            return callback_group
+
         return Util.find_similar_one(callback_group_name,
                                      self.callback_groups,
                                      get_name)
@@ -345,6 +400,11 @@ class Application(Summarizable):
                 not isinstance(topic_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
+        comms = self._runtime.get_communications(
+            publisher_node_name, subscription_node_name, topic_name)
+        if len(comms) > 0:
+            return comms[0]
+
         target_names = {'publisher_node_name': publisher_node_name,
                         'subscription_node_name': subscription_node_name,
                         'topic_name': topic_name}
@@ -463,6 +523,13 @@ class Application(Summarizable):
                 not isinstance(publish_topic_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
+        node_paths = Util.flatten([_.paths for _ in self._runtime.get_nodes(node_name)])
+        for node_path in node_paths:
+            if node_path.node_name == node_name and \
+                    node_path.subscribe_topic_name == subscribe_topic_name and \
+                    node_path.publish_topic_name == publish_topic_name:
+                return node_path
+
         target_name = {'node_name': node_name,
                        'subscribe_topic_name': subscribe_topic_name,
                        'publish_topic_name': publish_topic_name}
@@ -504,10 +571,7 @@ class Application(Summarizable):
         if not isinstance(topic_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
-        comms = Util.filter_items(
-            lambda x: x.topic_name == topic_name,
-            self.communications
-        )
+        comms = list(self._topic_communications_index.get(topic_name, []))
         if (len(comms) == 0):
             Util.find_similar_one(topic_name,
                                   self.communications,
@@ -609,7 +673,7 @@ class Application(Summarizable):
 
         node_paths = Util.filter_items(
             lambda x: x.node_name == node_name,
-            self.node_paths
+            Util.flatten([_.paths for _ in self._runtime.get_nodes(node_name)])
         )
         if (len(node_paths) == 0):
             Util.find_similar_one(node_name,
@@ -661,6 +725,10 @@ class Application(Summarizable):
         def get_name(x):
             return x.node_name
 
+        nodes = self._runtime.get_nodes(node_name)
+        if len(nodes) > 0:
+            return nodes[0]
+
         return Util.find_similar_one(node_name,
                                      self.nodes,
                                      get_name)
@@ -695,6 +763,10 @@ class Application(Summarizable):
         def get_name(x):
             return x.callback_name
 
+        callbacks = self._runtime.get_callbacks(callback_name)
+        if len(callbacks) > 0:
+            return callbacks[0]
+
         return Util.find_similar_one(callback_name,
                                      self.callbacks,
                                      get_name)
@@ -723,16 +795,26 @@ class Application(Summarizable):
             Occurs when several items were found.
 
         """
-        def is_match_regex(callback: CallbackBase):
-            return fnmatch.fnmatch(callback.callback_name, callback_name)
+        # Match all wildcard patterns in a single pass over the callback names.
+        patterns = {
+            i: re.compile(fnmatch.translate(callback_name))
+            for i, callback_name in enumerate(callback_names)
+            if '*' in callback_name or '?' in callback_name
+        }
+        matched: Dict[int, List[CallbackBase]] = {i: [] for i in patterns}
+        if len(patterns) > 0:
+            for name, callback in zip(self._callback_names, self._callbacks):
+                for i, pattern in patterns.items():
+                    if pattern.match(name):
+                        matched[i].append(callback)
 
         callbacks = []
-        for callback_name in callback_names:
+        for i, callback_name in enumerate(callback_names):
+            if i in matched:
+                callbacks += matched[i]
+                continue
             try:
-                if '*' in callback_name or '?' in callback_name:
-                    callbacks += Util.filter_items(is_match_regex, self.callbacks)
-                else:
-                    callbacks.append(self.get_callback(callback_name))
+                callbacks.append(self.get_callback(callback_name))
             except Error:
                 msg = 'Failed to identify callback. Skip loading.'
                 msg += f'callback_name: {callback_name}'
@@ -753,6 +835,29 @@ class Application(Summarizable):
         """
         return sorted(c.node_name for c in self.nodes)
 
+    @cached_property
+    def _callbacks(self) -> Tuple[CallbackBase, ...]:
+        return tuple(self.callbacks)
+
+    @cached_property
+    def _callback_names(self) -> Tuple[str, ...]:
+        return tuple(_.callback_name for _ in self._callbacks)
+
+    @cached_property
+    def _executor_index(self) -> Dict[str, Executor]:
+        return _create_exact_index(self.executors, lambda x: x.executor_name)
+
+    @cached_property
+    def _callback_group_index(self) -> Dict[str, CallbackGroup]:
+        return _create_exact_index(self.callback_groups, lambda x: x.callback_group_name)
+
+    @cached_property
+    def _topic_communications_index(self) -> Dict[str, List[Communication]]:
+        index: Dict[str, List[Communication]] = {}
+        for comm in self.communications:
+            index.setdefault(comm.topic_name, []).append(comm)
+        return index
+
     @property
     def summary(self) -> Summary:
         """
@@ -767,3 +872,14 @@ class Application(Summarizable):
         return Summary({
             'nodes': self.node_names
         })
+
+
+def _create_exact_index(
+    items: Sequence[T],
+    key: Callable[[T], Hashable]
+) -> Dict:
+    # Util.find_similar_one returns the first item among exact matches.
+    index: Dict = {}
+    for item in items:
+        index.setdefault(key(item), item)
+    return index
@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Hashable, List, Optional, Union
 
 from .callback import CallbackBase
 from .node import Node
@@ -120,6 +120,10 @@ class Communication(PathBase, Summarizable):
         """
         return self._is_intra_process
 
+    @property
+    def _prefetch_group(self) -> Hashable:
+        return type(self), self._is_intra_process
+
     @property
     def callback_publish(self) -> Optional[List[CallbackBase]]:
         """
@@ -237,11 +241,6 @@ class Communication(PathBase, Summarizable):
         """
         return self._val.topic_name
 
-    @property
-    def column_names(self) -> List[str]:
-        records = self.to_records()
-        return records.columns
-
     @property
     def value(self) -> CommunicationStructValue:
         """
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
 from .callback import CallbackBase
 from .path_base import PathBase
@@ -106,6 +106,10 @@ class NodePath(PathBase, Summarizable):
         """
         return self._val.message_context
 
+    @property
+    def _prefetch_group(self) -> Hashable:
+        return type(self), type(self.message_context)
+
     @property
     def value(self) -> NodePathStructValue:
         """
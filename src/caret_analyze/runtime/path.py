@@ -14,8 +14,10 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from logging import getLogger
-from typing import Dict, List, Optional, Sequence, Union
+from typing import DefaultDict, Dict, List, Optional, Sequence, Tuple, Union
+import weakref
 
 from .callback import CallbackBase
 from .communication import Communication
@@ -23,8 +25,9 @@ from .node_path import NodePath
 from .path_base import PathBase
 from ..common import Summarizable, Summary, Util
 from ..exceptions import InvalidArgumentError, InvalidRecordsError
-from ..record import Columns
+from ..record import Columns, RecordsFactory
 from ..record.record import merge, merge_sequential, RecordsInterface
+from ..record.records_cache import RecordsCache, records_cache_owner_id
 from ..value_objects import CallbackChain, PathStructValue
 
 logger = getLogger(__name__)
@@ -79,6 +82,12 @@ class ColumnMerger():
     ) -> List[str]:
         return self._column_names
 
+    def clone(self) -> ColumnMerger:
+        merger = ColumnMerger()
+        merger._count = dict(self._count)
+        merger._column_names = list(self._column_names)
+        return merger
+
     @staticmethod
     def _to_column_name(
         count: int,
@@ -98,6 +107,60 @@ class ColumnMerger():
         }
 
 
+class SharedPrefixes:
+    """
+    Registry of path prefixes shared by several paths.
+
+    Prefixes are tuples of owner ids of the path elements in RecordsCache.
+    RecordsMerged memoizes merged records at the prefixes where shared paths branch.
+
+    """
+
+    _counts: DefaultDict[Tuple[int, ...], int] = defaultdict(int)
+
+    @classmethod
+    def register(cls, path: Path, child: Sequence[Union[NodePath, Communication]]) -> None:
+        owner_ids = tuple(records_cache_owner_id(elem) for elem in child)
+        for length in range(1, len(owner_ids) + 1):
+            cls._counts[owner_ids[:length]] += 1
+        weakref.finalize(path, cls._unregister, owner_ids)
+
+    @classmethod
+    def _unregister(cls, owner_ids: Tuple[int, ...]) -> None:
+        for length in range(1, len(owner_ids) + 1):
+            prefix = owner_ids[:length]
+            cls._counts[prefix] -= 1
+            if cls._counts[prefix] <= 0:
+                del cls._counts[prefix]
+
+    @classmethod
+    def is_branch(cls, owner_ids: Tuple[int, ...], length: int) -> bool:
+        """Check whether the prefix is shared and longer prefixes are shared by fewer paths."""
+        count = cls._counts.get(owner_ids[:length], 0)
+        if count < 2:
+            return False
+        return length == len(owner_ids) or cls._counts.get(owner_ids[:length+1], 0) < count
+
+
+class MergedPrefix:
+
+    def __init__(
+        self,
+        records: RecordsInterface,
+        column_merger: ColumnMerger,
+        first_column: str,
+        terminated: bool,
+    ) -> None:
+        self.records = records
+        self.column_merger = column_merger
+        self.first_column = first_column
+        self.terminated = terminated
+
+    @property
+    def cache_size(self) -> int:
+        return RecordsCache.estimate_size(self.records)
+
+
 class RecordsMerged:
 
     def __init__(
@@ -118,70 +181,167 @@ class RecordsMerged:
     ) -> RecordsInterface:
         logger.info('Started merging path records.')
 
-        column_merger = ColumnMerger()
-        if len(targets[0].to_records().data) == 0:
-            targets = targets[1:]
+        owner_ids = tuple(records_cache_owner_id(target) for target in targets)
+        prefix = RecordsMerged._find_merged_prefix(owner_ids)
 
-        first_element = targets[0].to_records()
-        left_records = first_element
+        if prefix is None:
+            column_merger = ColumnMerger()
+            begin = 0
+            first_element = targets[0].to_records()
+            if len(first_element.data) == 0:
+                begin = 1
+                first_element = targets[1].to_records()
+            left_records = first_element
 
-        rename_rule = column_merger.append_columns_and_return_rename_rule(
-            left_records)
+            rename_rule = column_merger.append_columns_and_return_rename_rule(
+                left_records)
+
+            left_records.rename_columns(rename_rule)
+            first_column = first_element.columns[0]
+            terminated = False
+            merged_length = begin + 1
+            RecordsMerged._store_merged_prefix(
+                owner_ids, merged_length,
+                MergedPrefix(left_records, column_merger, first_column, terminated))
+        else:
+            merged_length = len(prefix[0])
+            left_records = prefix[1].records
+            column_merger = prefix[1].column_merger.clone()
+            first_column = prefix[1].first_column
+            terminated = prefix[1].terminated
+
+        i = merged_length
+        while i < len(targets) and not terminated:
+            end = RecordsMerged._segment_end(targets, owner_ids, i)
+            segment: List[RecordsInterface] = []
+            for target in targets[i:end]:
+                right_records: RecordsInterface = target.to_records()
+
+                is_dummy_records = len(right_records.columns) == 0
+
+                if is_dummy_records:
+                    if target == targets[-1]:
+                        msg = 'Detected dummy_records. merge terminated.'
+                        logger.info(msg)
+                    else:
+                        msg = 'Detected dummy_records before merging end_records. ' \
+                            'merge terminated.'
+                        logger.warn(msg)
+                    terminated = True
+                    break
+
+                prev_records = segment[-1] if len(segment) > 0 else left_records
+                RecordsMerged._prepare_right(
+                    prev_records, right_records, first_column, column_merger)
+                segment.append(right_records)
+
+            if len(segment) > 0:
+                left_records = RecordsMerged._merge_step(
+                    left_records, RecordsMerged._merge_balanced(segment),
+                    targets[i-1], targets[i])
+
+            i += len(segment) + int(terminated)
+            RecordsMerged._store_merged_prefix(
+                owner_ids, i,
+                MergedPrefix(left_records, column_merger.clone(), first_column, terminated))
 
-        left_records.rename_columns(rename_rule)
-        first_column = first_element.columns[0]
+        logger.info('Finished merging path records.')
 
-        for target_, target in zip(targets[:-1], targets[1:]):
-            right_records: RecordsInterface = target.to_records()
+        # Merged prefixes may be shared with other paths, so the sorted records are a copy.
+        merged = RecordsFactory.create_instance(
+            None, Columns.from_str(left_records.columns).to_value())
+        merged.concat(left_records)
+        merged.sort(first_column)
 
-            is_dummy_records = len(right_records.columns) == 0
+        return merged
 
-            if is_dummy_records:
-                if target == targets[-1]:
-                    msg = 'Detected dummy_records. merge terminated.'
-                    logger.info(msg)
-                else:
-                    msg = 'Detected dummy_records before merging end_records. merge terminated.'
-                    logger.warn(msg)
-                break
-            rename_rule = column_merger.append_columns_and_return_rename_rule(
-                right_records)
-            right_records.rename_columns(rename_rule)
+    @staticmethod
+    def _find_merged_prefix(
+        owner_ids: Tuple[int, ...]
+    ) -> Optional[Tuple[Tuple[int, ...], MergedPrefix]]:
+        for length in range(len(owner_ids), 0, -1):
+            if not SharedPrefixes.is_branch(owner_ids, length):
+                continue
+            key = ('merged_prefix', owner_ids[:length])
+            if not RecordsCache.contains(owner_ids[0], key):
+                continue
+            prefix = RecordsCache.get(owner_ids[0], key)
+            if prefix is not None:
+                return owner_ids[:length], prefix
+        return None
 
-            if left_records.columns[-1] != right_records.columns[0]:
-                raise InvalidRecordsError('left columns[-1] != right columns[0]')
-            left_stamp_key = left_records.columns[-1]
-            right_stamp_key = right_records.columns[0]
+    @staticmethod
+    def _store_merged_prefix(
+        owner_ids: Tuple[int, ...],
+        length: int,
+        prefix: MergedPrefix
+    ) -> None:
+        if SharedPrefixes.is_branch(owner_ids, length):
+            RecordsCache.put(owner_ids[0], ('merged_prefix', owner_ids[:length]), prefix)
 
-            right_records.drop_columns([left_records.columns[0]])
-            right_stamp_key = right_records.columns[0]
+    @staticmethod
+    def _is_sequential(
+        target_: Union[NodePath, Communication],
+        target: Union[NodePath, Communication],
+    ) -> bool:
+        return isinstance(target_, NodePath) and \
+            isinstance(target, Communication) and \
+            isinstance(target_.message_context, CallbackChain)
 
-            logger.info(
-                '\n[merge_sequential] \n'
-                f'- left_column: {left_stamp_key} \n'
-                f'- right_column: {right_stamp_key} \n'
-            )
+    @staticmethod
+    def _segment_end(
+        targets: List[Union[NodePath, Communication]],
+        owner_ids: Tuple[int, ...],
+        begin: int,
+    ) -> int:
+        """
+        Get the end of the segment which can be merged independently of the left records.
 
-            is_sequential = isinstance(target_, NodePath) and \
-                isinstance(target, Communication) and \
-                isinstance(target_.message_context, CallbackChain)
+        Left joins of adjacent elements are associative,
+        so a segment continues while the elements are joined by merge.
+        A segment also ends at a branch of shared prefixes to memoize the merged prefix.
 
-            if is_sequential:
-                left_records = merge_sequential(
-                    left_records=left_records,
-                    right_records=right_records,
-                    join_left_key=None,
-                    join_right_key=None,
-                    left_stamp_key=left_stamp_key,
-                    right_stamp_key=right_stamp_key,
-                    columns=Columns.from_str(
-                        left_records.columns + right_records.columns
-                    ).column_names,
-                    how='left_use_latest',
-                    progress_label='binding: node records'
-                )
-            else:
-                left_records = merge(
+        """
+        end = begin + 1
+        while end < len(targets) and \
+                not SharedPrefixes.is_branch(owner_ids, end) and \
+                not RecordsMerged._is_sequential(targets[end-1], targets[end]):
+            end += 1
+        return end
+
+    @staticmethod
+    def _prepare_right(
+        left_records: RecordsInterface,
+        right_records: RecordsInterface,
+        first_column: str,
+        column_merger: ColumnMerger,
+    ) -> None:
+        rename_rule = column_merger.append_columns_and_return_rename_rule(
+            right_records)
+        right_records.rename_columns(rename_rule)
+
+        if left_records.columns[-1] != right_records.columns[0]:
+            raise InvalidRecordsError('left columns[-1] != right columns[0]')
+        left_stamp_key = left_records.columns[-1]
+
+        right_records.drop_columns([first_column])
+        right_stamp_key = right_records.columns[0]
+
+        logger.info(
+            '\n[merge_sequential] \n'
+            f'- left_column: {left_stamp_key} \n'
+            f'- right_column: {right_stamp_key} \n'
+        )
+
+    @staticmethod
+    def _merge_balanced(
+        segment: List[RecordsInterface]
+    ) -> RecordsInterface:
+        # Adjacent records are merged pairwise so that the records grow in a tree shape.
+        while len(segment) > 1:
+            merged: List[RecordsInterface] = []
+            for left_records, right_records in zip(segment[0::2], segment[1::2]):
+                merged.append(merge(
                     left_records=left_records,
                     right_records=right_records,
                     join_left_key=left_records.columns[-1],
@@ -190,12 +350,44 @@ class RecordsMerged:
                         left_records.columns + right_records.columns
                     ).column_names,
                     how='left'
-                )
+                ))
+            if len(segment) % 2 == 1:
+                merged.append(segment[-1])
+            segment = merged
+        return segment[0]
 
-        logger.info('Finished merging path records.')
-        left_records.sort(first_column)
+    @staticmethod
+    def _merge_step(
+        left_records: RecordsInterface,
+        right_records: RecordsInterface,
+        target_: Union[NodePath, Communication],
+        target: Union[NodePath, Communication],
+    ) -> RecordsInterface:
+        if RecordsMerged._is_sequential(target_, target):
+            return merge_sequential(
+                left_records=left_records,
+                right_records=right_records,
+                join_left_key=None,
+                join_right_key=None,
+                left_stamp_key=left_records.columns[-1],
+                right_stamp_key=right_records.columns[0],
+                columns=Columns.from_str(
+                    left_records.columns + right_records.columns
+                ).column_names,
+                how='left_use_latest',
+                progress_label='binding: node records'
+            )
 
-        return left_records
+        return merge(
+            left_records=left_records,
+            right_records=right_records,
+            join_left_key=left_records.columns[-1],
+            join_right_key=right_records.columns[0],
+            columns=Columns.from_str(
+                left_records.columns + right_records.columns
+            ).column_names,
+            how='left'
+        )
 
 
 class Path(PathBase, Summarizable):
@@ -230,6 +422,7 @@ class Path(PathBase, Summarizable):
         self._value = path
         self._validate(child)
         self._child = child
+        SharedPrefixes.register(self, child)
         self._columns_cache: Optional[List[str]] = None
         self._callbacks = callbacks
         return None
@@ -13,16 +13,19 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
-from copy import deepcopy
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from logging import getLogger
-from typing import List, Optional, Tuple
+import multiprocessing
+from threading import active_count, Lock
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
 from ..exceptions import Error, InvalidRecordsError
 from ..record import RecordsFactory, RecordsInterface
-from ..record.data_frame_shaper import DataFrameShaper, Strip
+from ..record.data_frame_shaper import Clip, DataFrameShaper, Strip
+from ..record.records_cache import RecordsCache, records_cache_owner_id
 
 logger = getLogger(__name__)
 
@@ -31,19 +34,28 @@ class PathBase(metaclass=ABCMeta):
     """Base class for Latency."""
 
     def __init__(self) -> None:
-        self.__records_cache: Optional[RecordsInterface] = None
+        records_cache_owner_id(self)
 
-    def to_records(self) -> RecordsInterface:
+    def to_records(self, *, copy: bool = True) -> RecordsInterface:
         """
         Calculate records.
 
+        Parameters
+        ----------
+        copy : bool
+            If False, the cached records are returned without copying.
+            The returned records are shared with the cache and must not be modified.
+            default: True.
+
         Returns
         -------
         RecordsInterface
             Execution time of each operation.
 
         """
-        return self.__records.clone()
+        if copy:
+            return self.__records.clone()
+        return self.__records
 
     @abstractmethod
     def _to_records_core(self) -> RecordsInterface:
@@ -58,19 +70,35 @@ class PathBase(metaclass=ABCMeta):
         """
 
     def clear_cache(self) -> None:
-        self.__records_cache = None
+        RecordsCache.discard(records_cache_owner_id(self))
 
     @property
     def __records(self) -> RecordsInterface:
-        if self.__records_cache is None:
-            try:
-                self.__records_cache = self._to_records_core()
-            except Error as e:
-                logger.warning(e)
-                self.__records_cache = RecordsFactory.create_instance()
+        return RecordsCache.get_or_compose(
+            records_cache_owner_id(self), 'records', self._compose_records)
 
-        assert self.__records_cache is not None
-        return self.__records_cache
+    def _is_records_cached(self) -> bool:
+        return RecordsCache.contains(records_cache_owner_id(self), 'records')
+
+    def _store_records(self, records: RecordsInterface) -> None:
+        RecordsCache.put(records_cache_owner_id(self), 'records', records)
+
+    @property
+    def _prefetch_group(self) -> Hashable:
+        """
+        Group of targets which use the same whole-trace records.
+
+        prefetch_records composes one target of each group before starting workers.
+
+        """
+        return type(self)
+
+    def _compose_records(self) -> RecordsInterface:
+        try:
+            return self._to_records_core()
+        except Error as e:
+            logger.warning(e)
+            return RecordsFactory.create_instance()
 
     @property
     def column_names(self) -> List[str]:
@@ -83,7 +111,7 @@ class PathBase(metaclass=ABCMeta):
             column names
 
         """
-        return deepcopy(self.__records.columns)
+        return list(self.__records.columns)
 
     def to_dataframe(
         self,
@@ -117,10 +145,11 @@ class PathBase(metaclass=ABCMeta):
             Execution time of each operation.
 
         """
-        records = self.to_records()
+        bind_drop_as_delay = remove_dropped is False and treat_drop_as_delay
+        records = self.to_records(copy=bind_drop_as_delay)
         column_names = self.column_names
 
-        if remove_dropped is False and treat_drop_as_delay:
+        if bind_drop_as_delay:
             records.bind_drop_as_delay()
 
         df = records.to_dataframe()
@@ -179,6 +208,99 @@ class PathBase(metaclass=ABCMeta):
             len(time) == len(latency)
 
         """
+        if shaper is not None and not isinstance(shaper, (Clip, Strip)):
+            return self._to_timeseries_from_dataframe(
+                remove_dropped, treat_drop_as_delay, lstrip_s, rstrip_s, shaper)
+
+        column_names = self.column_names
+        if len(column_names) == 0:
+            msg = 'Failed to calculate time series latency.'
+            msg += 'There is a possibility that records are dummy data.'
+            raise InvalidRecordsError(msg)
+
+        # Only the first and last columns are read, instead of building a dataframe.
+        bind_drop_as_delay = remove_dropped is False and treat_drop_as_delay
+        records = self.to_records(copy=bind_drop_as_delay)
+        if bind_drop_as_delay:
+            records.bind_drop_as_delay()
+
+        source_stamps_ns, has_source = self._to_stamps(records, column_names[0])
+        dest_stamps_ns, has_dest = self._to_stamps(records, column_names[-1])
+        selected = np.ones(len(source_stamps_ns), dtype=bool)
+
+        shapers: List[DataFrameShaper] = []
+        if lstrip_s > 0 or rstrip_s > 0:
+            shapers.append(Strip(lstrip_s, rstrip_s))
+        if shaper is not None:
+            shapers.append(shaper)
+        for shaper_ in shapers:
+            selected &= self._to_clip_mask(shaper_, source_stamps_ns, has_source, selected)
+
+        if remove_dropped:
+            column_size = len(column_names)
+            selected &= np.fromiter(
+                (len(record.data) == column_size for record in records.data),
+                dtype=bool, count=len(records))
+
+        if not np.any(selected):
+            msg = 'Failed to find any records that went through the path.'
+            msg += 'There is a possibility that all records are lost.'
+            raise InvalidRecordsError(msg)
+
+        t = source_stamps_ns[selected]
+        if remove_dropped:
+            return t, dest_stamps_ns[selected] - t
+
+        # Missing values are pd.NA as with the values of to_dataframe.
+        t = t.astype(object)
+        t[~has_source[selected]] = pd.NA
+        dest = dest_stamps_ns[selected].astype(object)
+        dest[~has_dest[selected]] = pd.NA
+        return t, dest - t
+
+    @staticmethod
+    def _to_stamps(
+        records: RecordsInterface,
+        column: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        int64_max = 2**63-1
+        series = records.get_column_series(column)
+        has_value = np.fromiter((v is not None for v in series), dtype=bool, count=len(series))
+        # uint64 values are converted to int64 as with Records.to_dataframe.
+        stamps = np.fromiter(
+            (0 if v is None else v if v <= int64_max else ~(v & int64_max) for v in series),
+            dtype=np.int64, count=len(series))
+        return stamps, has_value
+
+    @staticmethod
+    def _to_clip_mask(
+        shaper: DataFrameShaper,
+        stamps: np.ndarray,
+        has_stamp: np.ndarray,
+        selected: np.ndarray,
+    ) -> np.ndarray:
+        if isinstance(shaper, Strip):
+            indices = np.flatnonzero(selected)
+            if len(indices) == 0:
+                return selected
+            if not has_stamp[indices[0]] or not has_stamp[indices[-1]]:
+                return np.zeros(len(stamps), dtype=bool)
+            clip = Clip(
+                stamps[indices[0]] + shaper.lstrip_ns,
+                stamps[indices[-1]] - shaper.rstrip_ns)
+        else:
+            assert isinstance(shaper, Clip)
+            clip = shaper
+        return has_stamp & (stamps >= clip.min_ns) & (stamps <= clip.max_ns)
+
+    def _to_timeseries_from_dataframe(
+        self,
+        remove_dropped: bool,
+        treat_drop_as_delay: bool,
+        lstrip_s: float,
+        rstrip_s: float,
+        shaper: DataFrameShaper,
+    ) -> Tuple[np.ndarray, np.ndarray]:
         df = self.to_dataframe(
             remove_dropped, treat_drop_as_delay, lstrip_s, rstrip_s, shaper=shaper)
 
@@ -243,8 +365,110 @@ class PathBase(metaclass=ABCMeta):
         remove_dropped = not treat_drop_as_delay
         _, latency_ns = self.to_timeseries(
             remove_dropped, treat_drop_as_delay, lstrip_s, rstrip_s, shaper=shaper)
-        latency_ns = latency_ns[[not pd.isnull(_) for _ in latency_ns]]
-        range_min = math.floor(min(latency_ns) / binsize_ns) * binsize_ns
-        range_max = math.ceil(max(latency_ns) / binsize_ns) * binsize_ns
+        latency_ns = latency_ns[~pd.isnull(latency_ns)]
+        range_min = math.floor(latency_ns.min() / binsize_ns) * binsize_ns
+        range_max = math.ceil(latency_ns.max() / binsize_ns) * binsize_ns
         bin_num = math.ceil((range_max - range_min) / binsize_ns)
         return np.histogram(latency_ns, bins=bin_num, range=(range_min, range_max))
+
+
+_prefetch_targets: Sequence[PathBase] = []
+# Workers read the targets from the module global, so only one prefetch forks at a time.
+_prefetch_lock = Lock()
+
+
+def _compose_prefetch_target(index: int) -> RecordsInterface:
+    return _prefetch_targets[index]._compose_records()
+
+
+def prefetch_records(
+    targets: Sequence[PathBase],
+    max_workers: Optional[int] = None
+) -> None:
+    """
+    Build records of the targets concurrently and store them in the cache.
+
+    Threads are used with the C++ records implementation, which releases the GIL.
+    Otherwise, forked processes build the records and send them back.
+    One target of each prefetch group is built in this process first,
+    so that whole-trace records shared by the targets are cached before the workers start
+    and are not composed again by each worker.
+    Records are built serially if max_workers is not given,
+    or if processes would be forked while other threads are running,
+    since forking a threaded process may deadlock.
+    They are also built serially if the workers fail.
+
+    Parameters
+    ----------
+    targets : Sequence[PathBase]
+        Targets whose records are independent of each other.
+    max_workers : Optional[int]
+        The maximum number of workers.
+        Records are built serially if None or 1.
+
+    """
+    unique_targets = {id(target): target for target in targets}.values()
+    pending = [target for target in unique_targets if not target._is_records_cached()]
+    if len(pending) == 0:
+        return
+
+    if len(pending) == 1 or max_workers is None or max_workers <= 1:
+        _compose_serially(pending)
+        return
+
+    warm_targets: Dict[Hashable, PathBase] = {}
+    for target in pending:
+        warm_targets.setdefault(target._prefetch_group, target)
+    _compose_serially(list(warm_targets.values()))
+    warmed_ids = {id(target) for target in warm_targets.values()}
+    pending = [target for target in pending if id(target) not in warmed_ids]
+    if len(pending) == 0:
+        return
+
+    try:
+        records_list = _compose_concurrently(pending, max_workers)
+    except Exception as e:
+        # e.g. BrokenProcessPool or a pickling error.
+        logger.warning(f'Failed to prefetch records. They are built serially. {e!r}')
+        records_list = None
+
+    if records_list is None:
+        _compose_serially(pending)
+        return
+
+    for target, records in zip(pending, records_list):
+        target._store_records(records)
+
+
+def _compose_serially(targets: Sequence[PathBase]) -> None:
+    for target in targets:
+        target._store_records(target._compose_records())
+
+
+def _compose_concurrently(
+    targets: Sequence[PathBase],
+    max_workers: int
+) -> Optional[List[RecordsInterface]]:
+    global _prefetch_targets
+
+    executor: Executor
+    if RecordsFactory.is_cpp_impl_valid() or \
+            'fork' not in multiprocessing.get_all_start_methods():
+        executor = ThreadPoolExecutor(max_workers)
+        with executor:
+            return list(executor.map(lambda x: x._compose_records(), targets))
+
+    if active_count() > 1:
+        logger.info('Other threads are running. Records are built serially.')
+        return None
+
+    # Forked workers inherit the targets, so only the resulting records are pickled.
+    with _prefetch_lock:
+        _prefetch_targets = targets
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers, mp_context=multiprocessing.get_context('fork'))
+            with executor:
+                return list(executor.map(_compose_prefetch_target, range(len(targets))))
+        finally:
+            _prefetch_targets = []
@@ -14,9 +14,10 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from logging import getLogger
 
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from .callback import CallbackBase, SubscriptionCallback, TimerCallback
 from .callback_group import CallbackGroup
@@ -48,41 +49,63 @@ logger = getLogger(__name__)
 
 
 class RuntimeLoaded():
+    """
+    Runtime objects of the architecture.
+
+    Runtime objects are constructed on first access.
+    Looking up a path or a node constructs only the nodes and communications it refers to.
+
+    """
+
     def __init__(
         self,
         architecture: Architecture,
         provider: Union[RecordsProvider, RuntimeDataProvider]
     ) -> None:
-        nodes_loaded = NodesLoaded(architecture.nodes, provider)
-        self._nodes = nodes_loaded.data
+        self._nodes_loaded = NodesLoaded(architecture.nodes, provider)
 
-        execs_loaded = ExecutorsLoaded(
-            architecture.executors, nodes_loaded)
-        self._executors = execs_loaded.data
+        self._execs_loaded = ExecutorsLoaded(
+            architecture.executors, self._nodes_loaded)
 
-        comms_loaded = CommunicationsLoaded(
-            architecture.communications, provider, nodes_loaded)
-        self._comms = comms_loaded.data
+        self._comms_loaded = CommunicationsLoaded(
+            architecture.communications, provider, self._nodes_loaded)
 
-        paths_loaded = PathsLoaded(
-            architecture.paths, nodes_loaded, comms_loaded)
-        self._paths = paths_loaded.data
+        self._paths_loaded = PathsLoaded(
+            architecture.paths, self._nodes_loaded, self._comms_loaded)
 
     @property
     def nodes(self) -> List[Node]:
-        return self._nodes
+        return self._nodes_loaded.data
 
     @property
     def executors(self) -> List[Executor]:
-        return self._executors
+        return self._execs_loaded.data
 
     @property
     def communications(self) -> List[Communication]:
-        return self._comms
+        return self._comms_loaded.data
 
     @property
     def paths(self) -> List[Path]:
-        return self._paths
+        return self._paths_loaded.data
+
+    def get_nodes(self, node_name: str) -> List[Node]:
+        return self._nodes_loaded.get_nodes(node_name)
+
+    def get_callbacks(self, callback_name: str) -> List[CallbackBase]:
+        return self._nodes_loaded.get_callbacks(callback_name)
+
+    def get_communications(
+        self,
+        publish_node_name: str,
+        subscribe_node_name: str,
+        topic_name: str,
+    ) -> List[Communication]:
+        return self._comms_loaded.get_communications(
+            topic_name, publish_node_name, subscribe_node_name)
+
+    def get_paths(self, path_name: str) -> List[Path]:
+        return self._paths_loaded.get_paths(path_name)
 
 
 class ExecutorsLoaded:
@@ -91,12 +114,18 @@ class ExecutorsLoaded:
         executors_values: Tuple[ExecutorStructValue, ...],
         nodes_loaded: NodesLoaded
     ) -> None:
-        self._data = []
-        for exec_val in executors_values:
+        self._executors_values = executors_values
+        self._nodes_loaded = nodes_loaded
+
+    @cached_property
+    def _data(self) -> List[Executor]:
+        data = []
+        for exec_val in self._executors_values:
             try:
-                self._data.append(self._to_runtime(exec_val, nodes_loaded))
+                data.append(self._to_runtime(exec_val, self._nodes_loaded))
             except Error as e:
                 logger.warning(e)
+        return data
 
     @staticmethod
     def _to_runtime(
@@ -125,12 +154,63 @@ class NodesLoaded:
         node_values: Tuple[NodeStructValue, ...],
         provider: Union[RecordsProvider, RuntimeDataProvider]
     ) -> None:
-        self._nodes: List[Node] = []
-        for node_value in node_values:
-            try:
-                self._nodes.append(self._to_runtime(node_value, provider))
-            except Error as e:
-                logger.warning(e)
+        self._node_values = node_values
+        self._provider = provider
+        # Constructed nodes for each index of node_values. None if construction failed.
+        self._loaded: Dict[int, Optional[Node]] = {}
+
+    def _load(self, indices: List[int]) -> List[Node]:
+        nodes = []
+        for i in indices:
+            if i not in self._loaded:
+                self._loaded[i] = None
+                try:
+                    self._loaded[i] = self._to_runtime(self._node_values[i], self._provider)
+                except Error as e:
+                    logger.warning(e)
+            node = self._loaded[i]
+            if node is not None:
+                nodes.append(node)
+        return nodes
+
+    @cached_property
+    def _nodes(self) -> List[Node]:
+        return self._load(list(range(len(self._node_values))))
+
+    @cached_property
+    def _indices(self) -> Dict[str, List[int]]:
+        indices: Dict[str, List[int]] = {}
+        for i, node_value in enumerate(self._node_values):
+            indices.setdefault(node_value.node_name, []).append(i)
+        return indices
+
+    @cached_property
+    def _callback_indices(self) -> Dict[str, List[int]]:
+        indices: Dict[str, List[int]] = {}
+        for i, node_value in enumerate(self._node_values):
+            for callback_name in node_value.callback_names or ():
+                indices.setdefault(callback_name, []).append(i)
+        return indices
+
+    @cached_property
+    def _callback_group_indices(self) -> Dict[str, List[int]]:
+        indices: Dict[str, List[int]] = {}
+        for i, node_value in enumerate(self._node_values):
+            for callback_group_name in node_value.callback_group_names or ():
+                indices.setdefault(callback_group_name, []).append(i)
+        return indices
+
+    def get_nodes(self, node_name: str) -> List[Node]:
+        return self._load(self._indices.get(node_name, []))
+
+    def get_callbacks(self, callback_name: str) -> List[CallbackBase]:
+        nodes = self._load(self._callback_indices.get(callback_name, []))
+        return [
+            callback
+            for node in nodes
+            for callback in node.callbacks or []
+            if callback.callback_name == callback_name
+        ]
 
     @staticmethod
     def _to_runtime(
@@ -206,9 +286,8 @@ class NodesLoaded:
         callback_group_name: str
     ) -> CallbackGroup:
         try:
-            callback_groups = self.callback_groups
-            if callback_groups is None:
-                raise ItemNotFoundError('')
+            nodes = self._load(self._callback_group_indices.get(callback_group_name, []))
+            callback_groups = Util.flatten([n.callback_groups or [] for n in nodes])
 
             return Util.find_one(
                 lambda x: x.callback_group_name == callback_group_name,
@@ -223,13 +302,9 @@ class NodesLoaded:
         callback_name: str
     ) -> CallbackBase:
         try:
-            cbs = self.callbacks
-            if cbs is None:
-                raise ItemNotFoundError('')
-
             return Util.find_one(
                 lambda x: x.callback_name == callback_name,
-                cbs
+                self.get_callbacks(callback_name)
             )
         except ItemNotFoundError:
             raise ItemNotFoundError(
@@ -242,7 +317,7 @@ class NodesLoaded:
         try:
             return Util.find_one(
                 lambda x: x.node_name == node_name,
-                self._nodes
+                self.get_nodes(node_name)
             )
         except ItemNotFoundError:
             raise ItemNotFoundError(
@@ -260,7 +335,7 @@ class NodesLoaded:
                 node_path.node_name == node_name
 
         try:
-            node_paths = Util.flatten([n.paths for n in self._nodes])
+            node_paths = Util.flatten([n.paths for n in self.get_nodes(node_name)])
             return Util.find_one(is_target, node_paths)
         except ItemNotFoundError:
             msg = 'Failed to find node path. '
@@ -596,12 +671,40 @@ class PathsLoaded:
         nodes_loaded: NodesLoaded,
         comms_loaded: CommunicationsLoaded,
     ) -> None:
-        self._data = []
-        for path_info in paths_info:
-            try:
-                self._data.append(self._to_runtime(path_info, nodes_loaded, comms_loaded))
-            except Error as e:
-                logger.warning(e)
+        self._paths_info = paths_info
+        self._nodes_loaded = nodes_loaded
+        self._comms_loaded = comms_loaded
+        # Constructed paths for each index of paths_info. None if construction failed.
+        self._loaded: Dict[int, Optional[Path]] = {}
+
+    def _load(self, indices: List[int]) -> List[Path]:
+        paths = []
+        for i in indices:
+            if i not in self._loaded:
+                self._loaded[i] = None
+                try:
+                    self._loaded[i] = self._to_runtime(
+                        self._paths_info[i], self._nodes_loaded, self._comms_loaded)
+                except Error as e:
+                    logger.warning(e)
+            path = self._loaded[i]
+            if path is not None:
+                paths.append(path)
+        return paths
+
+    @cached_property
+    def _data(self) -> List[Path]:
+        return self._load(list(range(len(self._paths_info))))
+
+    @cached_property
+    def _indices(self) -> Dict[Optional[str], List[int]]:
+        indices: Dict[Optional[str], List[int]] = {}
+        for i, path_info in enumerate(self._paths_info):
+            indices.setdefault(path_info.path_name, []).append(i)
+        return indices
+
+    def get_paths(self, path_name: str) -> List[Path]:
+        return self._load(self._indices.get(path_name, []))
 
     @staticmethod
     def _to_runtime(
@@ -658,18 +761,55 @@ class CommunicationsLoaded:
         provider: RecordsProvider,
         nodes_loaded: NodesLoaded,
     ) -> None:
-        self._data: List[Communication] = []
-        for comm_value in communication_values:
-            try:
-                comm = self._to_runtime(comm_value, provider, nodes_loaded)
-                self._data.append(comm)
-            except (ItemNotFoundError, MultipleItemFoundError):
-                pass
+        self._communication_values = communication_values
+        self._provider = provider
+        self._nodes_loaded = nodes_loaded
+        # Constructed communications for each index of communication_values.
+        # None if construction failed.
+        self._loaded: Dict[int, Optional[Communication]] = {}
+
+    def _load(self, indices: List[int]) -> List[Communication]:
+        comms = []
+        for i in indices:
+            if i not in self._loaded:
+                self._loaded[i] = None
+                try:
+                    self._loaded[i] = self._to_runtime(
+                        self._communication_values[i], self._provider, self._nodes_loaded)
+                except (ItemNotFoundError, MultipleItemFoundError):
+                    pass
+            comm = self._loaded[i]
+            if comm is not None:
+                comms.append(comm)
+        return comms
+
+    @cached_property
+    def _data(self) -> List[Communication]:
+        return self._load(list(range(len(self._communication_values))))
+
+    @cached_property
+    def _indices(self) -> Dict[Tuple[str, str, str], List[int]]:
+        indices: Dict[Tuple[str, str, str], List[int]] = {}
+        for i, comm_value in enumerate(self._communication_values):
+            key = (comm_value.topic_name,
+                   comm_value.publish_node_name,
+                   comm_value.subscribe_node_name)
+            indices.setdefault(key, []).append(i)
+        return indices
 
     @property
     def data(self) -> List[Communication]:
         return self._data
 
+    def get_communications(
+        self,
+        topic_name: str,
+        publish_node_name: str,
+        subscribe_node_name: str,
+    ) -> List[Communication]:
+        return self._load(
+            self._indices.get((topic_name, publish_node_name, subscribe_node_name), []))
+
     @staticmethod
     def _to_runtime(
         communication_value: CommunicationStructValue,
@@ -713,7 +853,8 @@ class CommunicationsLoaded:
                 comm.subscribe_node_name == subscribe_node_name and \
                 comm.topic_name == topic_name
 
-        return Util.find_one(is_target, self._data)
+        comms = self.get_communications(topic_name, publish_node_name, subscribe_node_name)
+        return Util.find_one(is_target, comms)
 
 
 class CallbacksLoaded:
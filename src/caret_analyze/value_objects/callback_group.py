@@ -195,6 +195,8 @@ class CallbackGroupValue(ValueObject):
 class CallbackGroupStructValue(ValueObject, Summarizable):
     """Callback group value object."""
 
+    __slots__ = ('_callback_group_type', '_node_name', '_callback_values', '_callback_group_name')
+
     def __init__(
         self,
         callback_group_type: CallbackGroupType,
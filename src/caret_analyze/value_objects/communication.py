@@ -24,6 +24,11 @@ from ..common import Summarizable, Summary, Util
 
 class CommunicationStructValue(ValueObject, Summarizable):
 
+    __slots__ = (
+        '_publisher_value', '_subscription_value', '_topic_name', '_node_pub', '_node_sub',
+        '_subscription_callback_value', '_publish_callbacks_value',
+    )
+
     def __init__(
         self,
         node_publish: NodeStructValue,
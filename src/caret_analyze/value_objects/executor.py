@@ -56,6 +56,8 @@ ExecutorType.MULTI_THREADED_EXECUTOR = ExecutorType('multi_threaded_executor')
 class ExecutorStructValue(ValueObject, Summarizable):
     """Executor info for architecture."""
 
+    __slots__ = ('_executor_type', '_cbg_values', '_executor_name')
+
     def __init__(
         self,
         executor_type: ExecutorType,
@@ -63,6 +63,8 @@ MessageContextType.TILDE = MessageContextType('tilde')
 class MessageContext(ValueObject, Summarizable):
     """Structured message context value."""
 
+    __slots__ = ('_node_name', '_sub', '_pub', '_callbacks')
+
     def __init__(
         self,
         node_name: str,
@@ -175,6 +177,7 @@ class MessageContext(ValueObject, Summarizable):
 
 class UseLatestMessage(MessageContext):
     TYPE_NAME = 'use_latest_message'
+    __slots__ = ()
 
     """Use message context"""
 
@@ -188,6 +191,7 @@ class UseLatestMessage(MessageContext):
 
 class InheritUniqueStamp(MessageContext):
     TYPE_NAME = 'inherit_unique_stamp'
+    __slots__ = ()
 
     """
     Inherit header timestamp.
@@ -206,6 +210,7 @@ class InheritUniqueStamp(MessageContext):
 
 class CallbackChain(MessageContext):
     TYPE_NAME = 'callback_chain'
+    __slots__ = ()
 
     """
     Callback chain.
@@ -280,6 +285,7 @@ class CallbackChain(MessageContext):
 
 class Tilde(MessageContext):
     TYPE_NAME = 'tilde'
+    __slots__ = ()
 
     """
     tilde.
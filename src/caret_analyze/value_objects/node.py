@@ -108,6 +108,11 @@ class NodeStructValue(ValueObject, Summarizable):
     and used as the return value of Architecture object.
     """
 
+    __slots__ = (
+        '_node_name', '_publishers', '_subscriptions', '_services', '_timers', '_callback_groups',
+        '_node_paths', '_variable_passings_info',
+    )
+
     def __init__(
         self,
         node_name: str,
@@ -48,6 +48,8 @@ class PathValue(ValueObject):
 
 
 class PathStructValue(ValueObject, Summarizable):
+    __slots__ = ('_path_name', '_child')
+
     def __init__(
         self,
         path_name: Optional[str],
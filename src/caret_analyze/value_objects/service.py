@@ -54,6 +54,8 @@ class ServiceValue(ValueObject):
 class ServiceStructValue(ValueObject, Summarizable):
     """Service info."""
 
+    __slots__ = ('_node_name', '_service_name', '_callback_value')
+
     def __init__(
         self,
         node_name: str,
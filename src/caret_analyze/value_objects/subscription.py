@@ -54,6 +54,8 @@ class SubscriptionValue(ValueObject):
 class SubscriptionStructValue(ValueObject, Summarizable):
     """Subscription info."""
 
+    __slots__ = ('_node_name', '_topic_name', '_callback_value')
+
     def __init__(
         self,
         node_name: str,
@@ -54,6 +54,8 @@ class TimerValue(ValueObject):
 class TimerStructValue(ValueObject, Summarizable):
     """Timer info."""
 
+    __slots__ = ('_node_name', '_period_ns', '_callback_value')
+
     def __init__(
         self,
         node_name: str,
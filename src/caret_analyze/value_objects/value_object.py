@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import inspect
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from typing import Any, Dict
+AttrsKey = Tuple[type, Tuple[str, ...]]
 
 
 class ValueObject():
@@ -28,9 +28,16 @@ class ValueObject():
     ----
     Since the hash value is immutable, inherited classes can be used as a dictionary type key.
     It is also suitable for cache use and does not unintentionally change properties.
+    Public attribute names are computed once per class, and the hash value once per instance.
+    Inherited classes may define __slots__ to reduce memory.
 
     """
 
+    __slots__ = ('__hash_value',)
+
+    # Public attribute names for each class and its public instance variables.
+    __public_attrs: Dict[AttrsKey, Tuple[str, ...]] = {}
+
     def __eq__(self, right: Any) -> bool:
         """
         Check whether self object equals to given instance [override].
@@ -47,7 +54,15 @@ class ValueObject():
             returns True only if they all match. False otherwise.
 
         """
-        if type(self) != type(right):
+        if self is right:
+            return True
+
+        if type(self) is not type(right):
+            return False
+
+        hash_value: Optional[int] = getattr(self, '_ValueObject__hash_value', None)
+        if hash_value is not None and \
+                hash_value != getattr(right, '_ValueObject__hash_value', hash_value):
             return False
 
         for attr in self.__generate_public_attrs():
@@ -72,6 +87,10 @@ class ValueObject():
             https://www.baeldung.com/java-hashcode
 
         """
+        hash_value: Optional[int] = getattr(self, '_ValueObject__hash_value', None)
+        if hash_value is not None:
+            return hash_value
+
         hash_value = 17
 
         hash_value += hash_value * 31 + hash(self.__class__)
@@ -80,8 +99,24 @@ class ValueObject():
             v = getattr(self,  attr)
             hash_value += hash_value * 31 + hash(v)
 
+        self.__hash_value = hash_value
         return hash_value
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Hash values of str differ between processes, so the cached value is not pickled.
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name.startswith('__') and not name.endswith('__'):
+                    name = f'_{cls.__name__.lstrip("_")}{name}'
+                if name != '_ValueObject__hash_value' and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __str__(self) -> str:
         """
         Convert to string.
@@ -118,16 +153,26 @@ class ValueObject():
                     d[attr] = value
         return d
 
-    def __generate_public_attrs(self):
-        attrs = inspect.getmembers(self)
-
-        # ignore private variables and Constant variables
-        attrs = list(filter(
-            lambda x: x[0][0] != '_' and x[0][0].islower(), attrs
-        ))
-        for attr in attrs:
-            key, value = attr[0], attr[1]
+    def __generate_public_attrs(self) -> Iterator[str]:
+        for attr in self.__public_attr_candidates():
+            try:
+                value = getattr(self, attr)
+            except AttributeError:
+                continue
             # ignore callable
             if callable(value):
                 continue
-            yield key
+            yield attr
+
+    def __public_attr_candidates(self) -> Tuple[str, ...]:
+        cls = type(self)
+        key = (cls, tuple(k for k in getattr(self, '__dict__', ()) if k[0] != '_'))
+        attrs = ValueObject.__public_attrs.get(key)
+        if attrs is None:
+            # ignore private variables, Constant variables and methods
+            attrs = tuple(
+                name for name in sorted(dir(self))
+                if name[0] != '_' and name[0].islower() and not callable(getattr(cls, name, None))
+            )
+            ValueObject.__public_attrs[key] = attrs
+        return attrs
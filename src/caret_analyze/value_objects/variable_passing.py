@@ -75,6 +75,8 @@ class VariablePassingValue(ValueObject):
 class VariablePassingStructValue(ValueObject, Summarizable):
     """variable passing info."""
 
+    __slots__ = ('_node_name', '_cb_write', '_cb_read')
+
     def __init__(
         self,
         node_name: str,
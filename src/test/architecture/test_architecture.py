@@ -15,7 +15,7 @@
 from collections import defaultdict
 
 from logging import WARNING
-
+import pickle
 from string import Template
 from typing import Callable, List, Optional, Tuple
 
@@ -23,6 +23,7 @@ from caret_analyze.architecture import Architecture
 from caret_analyze.architecture.architecture_loaded import ArchitectureLoaded
 from caret_analyze.architecture.architecture_reader_factory import \
     ArchitectureReaderFactory
+from caret_analyze.architecture.architecture_sidecar import ArchitectureSidecar
 from caret_analyze.architecture.graph_search import NodePathSearcher
 from caret_analyze.architecture.reader_interface import ArchitectureReader
 from caret_analyze.architecture.struct import (CommunicationStruct,
@@ -30,7 +31,10 @@ from caret_analyze.architecture.struct import (CommunicationStruct,
                                                NodeStruct, PathStruct,
                                                TimerCallbackStruct
                                                )
-from caret_analyze.exceptions import InvalidArgumentError, ItemNotFoundError
+from caret_analyze.exceptions import (InvalidArgumentError, ItemNotFoundError,
+                                      MultipleItemFoundError, UnsupportedTypeError)
+from caret_analyze.infra.lttng.lttng import Lttng
+from caret_analyze.infra.lttng.ros2_tracing.data_model import Ros2DataModel
 from caret_analyze.value_objects import (CommunicationStructValue, NodePathStructValue,
                                          NodeStructValue, PathStructValue,
                                          PublisherStructValue, SubscriptionStructValue)
@@ -206,6 +210,11 @@ class TestArchitecture:
         assert len(arch.paths) == 0
         assert len(arch.communications) == 0
 
+    def test_unsupported_reader_file_path(self, mocker):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        with pytest.raises(UnsupportedTypeError):
+            ArchitectureReaderFactory.create_instance('yaml', lttng_mock)
+
     def test_get_node(self, mocker):
         reader_mock = mocker.Mock(spec=ArchitectureReader)
         mocker.patch.object(ArchitectureReaderFactory,
@@ -320,6 +329,50 @@ class TestArchitecture:
         with pytest.raises(InvalidArgumentError):
             arch.update_path('path2', path_)
 
+    def test_cached_values(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
+
+        node_mock = mocker.Mock(spec=NodeStruct)
+        mocker.patch.object(node_mock, 'callbacks', [])
+        mocker.patch.object(node_mock, 'to_value',
+                            side_effect=lambda: NodeStructValue(
+                                'node', (), (), (), (), (), None, None))
+        node_mock_dup = mocker.Mock(spec=NodeStruct)
+        mocker.patch.object(node_mock_dup, 'callbacks', [])
+        mocker.patch.object(node_mock_dup, 'to_value',
+                            return_value=NodeStructValue(
+                                'node_dup', (), (), (), (), (), None, None))
+
+        mocker.patch.object(loaded_mock, 'nodes', [node_mock, node_mock_dup, node_mock_dup])
+        mocker.patch.object(loaded_mock, 'paths', [PathStruct('path0', ())])
+        mocker.patch.object(loaded_mock, 'communications', [])
+        mocker.patch.object(loaded_mock, 'executors', [])
+
+        mocker.patch('caret_analyze.architecture.architecture_loaded.ArchitectureLoaded',
+                     return_value=loaded_mock)
+        mocker.patch.object(ArchitectureReaderFactory,
+                            'create_instance', return_value=reader_mock)
+
+        arch = Architecture('file_type', 'file_path')
+
+        assert arch.nodes is arch.nodes
+        assert arch.get_node('node') is arch.nodes[0]
+        assert node_mock.to_value.call_count == 1
+        with pytest.raises(MultipleItemFoundError):
+            arch.get_node('node_dup')
+
+        paths = arch.paths
+        arch.rename_path('path0', 'path1')
+        assert arch.paths is not paths
+        assert arch.get_path('path1').path_name == 'path1'
+        with pytest.raises(InvalidArgumentError):
+            arch.get_path('path0')
+
+        arch.rename_node('node', 'node_renamed')
+        arch.get_node('node')
+        assert node_mock.to_value.call_count == 2
+
     def test_search_paths(self, mocker):
         reader_mock = mocker.Mock(spec=ArchitectureReader)
         loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
@@ -348,7 +401,7 @@ class TestArchitecture:
         path_mock = mocker.Mock(spec=PathStruct)
         path_struct_mock = mocker.Mock(spec=PathStructValue)
         mocker.patch.object(path_mock, 'to_value', return_value=path_struct_mock)
-        mocker.patch.object(searcher_mock, 'search', return_value=[path_mock])
+        mocker.patch.object(searcher_mock, 'iter_search', return_value=iter([path_mock]))
 
         arch = Architecture('file_type', 'file_path')
 
@@ -474,6 +527,58 @@ class TestArchitecture:
         with pytest.raises(InvalidArgumentError):
             arch.combine_path(path_left, path_right)
 
+    def test_combine_path_chain_and_pairs(
+        self,
+        create_node_path,
+        create_comm,
+        create_arch,
+    ):
+        node_0 = create_node_path('node_0', None, 'topic_0')
+        node_1 = create_node_path('node_1', 'topic_0', 'topic_1')
+        node_2 = create_node_path('node_2', 'topic_1', 'topic_2')
+        node_3 = create_node_path('node_3', 'topic_2', None)
+        node_1_left = create_node_path('node_1', 'topic_0', None)
+        node_1_right = create_node_path('node_1', None, 'topic_1')
+        node_2_left = create_node_path('node_2', 'topic_1', None)
+        node_2_right = create_node_path('node_2', None, 'topic_2')
+
+        comm_0 = create_comm('topic_0', 'node_0', 'node_1')
+        comm_1 = create_comm('topic_1', 'node_1', 'node_2')
+        comm_2 = create_comm('topic_2', 'node_2', 'node_3')
+
+        arch: Architecture = create_arch(
+            [node_0, node_1, node_2, node_3, node_1_left, node_1_right,
+             node_2_left, node_2_right],
+            [comm_0, comm_1, comm_2]
+        )
+
+        path_0 = PathStructValue(None, (node_0, comm_0, node_1_left))
+        path_1 = PathStructValue(None, (node_1_right, comm_1, node_2_left))
+        path_2 = PathStructValue(None, (node_2_right, comm_2, node_3))
+
+        path = arch.combine_path(path_0, path_1, path_2)
+        assert path == PathStructValue(
+            None, (node_0, comm_0, node_1, comm_1, node_2, comm_2, node_3))
+
+        paths = arch.combine_path_pairs([(path_0, path_1), (path_1, path_2)])
+        assert paths == [
+            arch.combine_path(path_0, path_1),
+            arch.combine_path(path_1, path_2),
+        ]
+
+        with pytest.raises(InvalidArgumentError):
+            arch.combine_path_pairs([(path_0, path_2)])
+
+        with pytest.raises(UnsupportedTypeError) as e:
+            arch.combine_path(path_0, path_1, path_2, 'path_3')
+        assert "'paths'[1] must be 'PathStructValue'. " \
+            "The given argument type is 'str'" in str(e.value)
+
+        with pytest.raises(UnsupportedTypeError) as e:
+            arch.combine_path_pairs([(path_0, path_1), (path_1, 'path_2')])
+        assert "'path_pairs'[1][1] must be 'PathStructValue'. " \
+            "The given argument type is 'str'" in str(e.value)
+
     def test_verify_callback_uniqueness(self, mocker, caplog):
         node_mock = mocker.Mock(spec=NodeStruct)
         callback_mock = mocker.Mock(spec=TimerCallbackStruct)
@@ -835,6 +940,67 @@ nodes:
   - topic_name: /topic_0
     callback_name: /callback_3""")
 
+    def test_export_from_trace(self, mocker, tmpdir):
+        data = Ros2DataModel()
+        data.add_node(0, 1, 0, 0, 'node', '/')
+        data.add_timer(0, 10, 0, 100)
+        data.add_timer_node_link(10, 0, 1)
+        data.add_callback_object(10, 0, 11)
+        data.add_callback_symbol(11, 0, 'timer_cb')
+        data.add_executor(40, 0, 'single_threaded_executor')
+        data.add_callback_group(40, 0, 41, 'mutually_exclusive')
+        data.callback_group_add_timer(41, 0, 10)
+        data.finalize()
+        mocker.patch.object(Lttng, '_parse_lttng_data', return_value=(data, None, 0, 1))
+
+        arch = Architecture('lttng', Lttng('', validate=False))
+        f = tmpdir.join('arch.yaml')
+        arch.export(str(f))
+
+        arch_exported = Architecture('yaml', str(f))
+        assert arch_exported.callbacks[0].period_ns == 100
+
+    def test_sidecar(self, mocker, tmpdir):
+        architecture_text = \
+            self.template_architecture_assign.substitute(passings=self.passings_text,
+                                                         publisher_callback='timer_callback_1',
+                                                         contexts=self.contexts_text)
+        f = tmpdir.join('arch.yaml')
+        f.write(architecture_text)
+
+        arch = Architecture('yaml', str(f), sidecar=True)
+        assert tmpdir.join('arch.yaml.pickle').check()
+
+        create_spy = mocker.spy(ArchitectureReaderFactory, 'create_instance')
+        arch_restored = Architecture('yaml', str(f), sidecar=True)
+        assert create_spy.call_count == 0
+        assert arch_restored.nodes == arch.nodes
+        assert arch_restored.communications == arch.communications
+        assert arch_restored.executors == arch.executors
+        assert arch_restored.paths == arch.paths
+
+        # sidecar created from another content is not used.
+        f.write(architecture_text.replace('timer_callback_1', 'timer_callback_0', 1))
+        Architecture('yaml', str(f), sidecar=True)
+        assert create_spy.call_count == 1
+
+        # sidecar created by another version of the structures is not used.
+        mocker.patch.object(ArchitectureSidecar, '_source_digest', return_value='changed')
+        Architecture('yaml', str(f), sidecar=True)
+        assert create_spy.call_count == 2
+
+    def test_sidecar_header_checked_before_unpickling(self, mocker, tmpdir):
+        f = tmpdir.join('arch.yaml')
+        f.write('')
+        sidecar = ArchitectureSidecar(str(f))
+        with open(sidecar.sidecar_path, 'wb') as sidecar_file:
+            sidecar_file.write(b'another header\n')
+            pickle.dump(None, sidecar_file)
+
+        load_spy = mocker.spy(pickle, 'load')
+        assert sidecar.load() is None
+        assert load_spy.call_count == 0
+
     def test_rename_node(self, mocker):
         architecture_text = \
             self.template_architecture_rename.substitute(node='/node_1',
@@ -114,6 +114,16 @@ nodes: []
 """
         assert str(exporter) == expected
 
+    def test_str_non_builtin_value(self, mocker):
+        class Period(int):
+            pass
+
+        exporter = ArchitectureExporter((), (), ())
+        mocker.patch.object(exporter, 'to_dict',
+                            return_value={'nodes': [{'period_ns': Period(100)}]})
+
+        assert 'period_ns' in str(exporter)
+
     def test_force_option(self, mocker, tmpdir):
         exporter = ArchitectureExporter((), (), ())
         exporter_force = ArchitectureExporter((), (), (), force=True)
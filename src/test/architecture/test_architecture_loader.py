@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures.process import BrokenProcessPool
+from threading import Event, Thread
+
 from caret_analyze.architecture.architecture_loaded import (ArchitectureLoaded,
                                                             CallbackGroupsLoaded,
                                                             CallbackPathSearched,
@@ -19,6 +22,7 @@ from caret_analyze.architecture.architecture_loaded import (ArchitectureLoaded,
                                                             CommValuesLoaded,
                                                             ExecutorValuesLoaded,
                                                             NodePathCreated,
+                                                            NodePathsCache,
                                                             NodeValuesLoaded,
                                                             PathValuesLoaded,
                                                             PublishersLoaded,
@@ -57,6 +61,13 @@ from caret_analyze.value_objects.node import NodeValueWithId
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_node_paths_cache():
+    NodePathsCache.clear()
+    yield
+    NodePathsCache.clear()
+
+
 class TestArchitectureLoaded:
 
     def test_empty_reader(self, mocker):
@@ -181,8 +192,10 @@ class TestNodesInfoLoaded():
         node_mock = mocker.Mock(spec=NodeStruct)
         cb_loaded_mock = mocker.Mock(spec=CallbacksLoaded)
         cbg_loaded_mock = mocker.Mock(spec=CallbackGroupsLoaded)
-        mocker.patch.object(NodeValuesLoaded, '_create_node',
+        mocker.patch.object(NodeValuesLoaded, '_create_node_struct',
                             return_value=(node_mock, cb_loaded_mock, cbg_loaded_mock))
+        mocker.patch.object(NodeValuesLoaded, '_node_paths_added',
+                            side_effect=lambda node, _: node)
 
         node = NodeValue('node', 'node')
         mocker.patch.object(reader_mock, 'get_nodes',
@@ -198,8 +211,10 @@ class TestNodesInfoLoaded():
         node_mock = mocker.Mock(spec=NodeStruct)
         cb_loaded_mock = mocker.Mock(spec=CallbacksLoaded)
         cbg_loaded_mock = mocker.Mock(spec=CallbackGroupsLoaded)
-        mocker.patch.object(NodeValuesLoaded, '_create_node',
+        mocker.patch.object(NodeValuesLoaded, '_create_node_struct',
                             return_value=(node_mock, cb_loaded_mock, cbg_loaded_mock))
+        mocker.patch.object(NodeValuesLoaded, '_node_paths_added',
+                            side_effect=lambda node, _: node)
 
         # duplicate check for node name
         node_a = NodeValue('nodeA', 'nodeAid')
@@ -244,8 +259,10 @@ class TestNodesInfoLoaded():
             mocker.patch.object(node_mock, 'node_name', node.node_name)
             return node_mock, cb_loaded_mock, cbg_loaded_mock
 
-        mocker.patch.object(NodeValuesLoaded, '_create_node',
+        mocker.patch.object(NodeValuesLoaded, '_create_node_struct',
                             side_effect=create_node)
+        mocker.patch.object(NodeValuesLoaded, '_node_paths_added',
+                            side_effect=lambda node, _: node)
 
         loader = NodeValuesLoaded(reader_mock)
         nodes = loader.data
@@ -413,8 +430,10 @@ class TestNodesInfoLoaded():
         cb_mock = mocker.Mock(spec=CallbackStruct)
 
         mocker.patch.object(cb_loaded_mock, 'find_callback', return_value=cb_mock)
-        mocker.patch.object(NodeValuesLoaded, '_create_node',
+        mocker.patch.object(NodeValuesLoaded, '_create_node_struct',
                             return_value=(node_mock, cb_loaded_mock, cbg_loaded_mock))
+        mocker.patch.object(NodeValuesLoaded, '_node_paths_added',
+                            side_effect=lambda node, _: node)
         node = NodeValue('node', None)
         mocker.patch.object(reader_mock, 'get_nodes',
                             return_value=[node])
@@ -434,8 +453,10 @@ class TestNodesInfoLoaded():
         node_mock = mocker.Mock(spec=NodeStruct)
         cb_loaded_mock = mocker.Mock(spec=CallbacksLoaded)
         cbg_loaded_mock = mocker.Mock(spec=CallbackGroupsLoaded)
-        mocker.patch.object(NodeValuesLoaded, '_create_node',
+        mocker.patch.object(NodeValuesLoaded, '_create_node_struct',
                             return_value=(node_mock, cb_loaded_mock, cbg_loaded_mock))
+        mocker.patch.object(NodeValuesLoaded, '_node_paths_added',
+                            side_effect=lambda node, _: node)
 
         nodes_loaded = NodeValuesLoaded(reader_mock)
 
@@ -457,8 +478,10 @@ class TestNodesInfoLoaded():
         node_mock = mocker.Mock(spec=NodeStruct)
         cb_loaded_mock = mocker.Mock(spec=CallbacksLoaded)
         cbg_loaded_mock = mocker.Mock(spec=CallbackGroupsLoaded)
-        mocker.patch.object(NodeValuesLoaded, '_create_node',
+        mocker.patch.object(NodeValuesLoaded, '_create_node_struct',
                             return_value=(node_mock, cb_loaded_mock, cbg_loaded_mock))
+        mocker.patch.object(NodeValuesLoaded, '_node_paths_added',
+                            side_effect=lambda node, _: node)
 
         nodes_loaded = NodeValuesLoaded(reader_mock)
 
@@ -498,8 +521,10 @@ class TestNodesInfoLoaded():
 
         mocker.patch.object(cb_loaded_mock, 'search_callbacks',
                             return_value=[cb_mock])
-        mocker.patch.object(NodeValuesLoaded, '_create_node',
+        mocker.patch.object(NodeValuesLoaded, '_create_node_struct',
                             return_value=(node_mock, cb_loaded_mock, cbg_loaded_mock))
+        mocker.patch.object(NodeValuesLoaded, '_node_paths_added',
+                            side_effect=lambda node, _: node)
 
         node = NodeValue('node', None)
         mocker.patch.object(reader_mock, 'get_nodes', return_value=[node])
@@ -546,6 +571,88 @@ class TestNodesInfoLoaded():
             loaded.get_callbacks('node_not_exit')
 
 
+class TestNodePathsCache:
+
+    @staticmethod
+    def create_node(sub_topic: str, pub_topic: str) -> NodeStruct:
+        sub = SubscriptionStruct('/node', sub_topic, None)
+        pub = PublisherStruct('/node', pub_topic, None)
+        return NodeStruct('/node', [pub], [sub], [], [], [], None, None)
+
+    def test_search_node_paths(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        mocker.patch.object(reader_mock, 'get_message_contexts', return_value=[])
+        find_spy = mocker.spy(NodeValuesLoaded, '_find_node_paths')
+
+        node = self.create_node('/sub', '/pub')
+        paths = NodeValuesLoaded._search_node_paths(node, reader_mock)
+        assert find_spy.call_count == 1
+
+        node_ = self.create_node('/sub', '/pub')
+        paths_ = NodeValuesLoaded._search_node_paths(node_, reader_mock)
+        assert find_spy.call_count == 1
+        assert [_.to_value() for _ in paths_] == [_.to_value() for _ in paths]
+        assert all(path.publisher is node_.publishers[0] for path in paths_
+                   if path.publisher is not None)
+
+        node_changed = self.create_node('/sub', '/pub_')
+        paths_changed = NodeValuesLoaded._search_node_paths(node_changed, reader_mock)
+        assert find_spy.call_count == 2
+        assert '/pub_' in [_.publish_topic_name for _ in paths_changed]
+
+        NodeValuesLoaded._search_node_paths(node, reader_mock, use_cache=False)
+        assert find_spy.call_count == 3
+
+    def test_prefetch(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        mocker.patch.object(reader_mock, 'get_message_contexts', return_value=[])
+        mocker.patch.object(NodePathsCache, 'min_prefetch_nodes', 2)
+
+        nodes = [self.create_node('/sub', f'/pub_{i}') for i in range(3)]
+        NodePathsCache.prefetch(nodes, 2)
+        assert len(NodePathsCache._entries) == len(nodes)
+
+        find_spy = mocker.spy(NodeValuesLoaded, '_find_node_paths')
+        for node in nodes:
+            paths = NodeValuesLoaded._search_node_paths(node, reader_mock)
+            expected = NodeValuesLoaded._search_node_paths(node, reader_mock, use_cache=False)
+            assert [_.to_value() for _ in paths] == [_.to_value() for _ in expected]
+        assert find_spy.call_count == len(nodes)
+
+    def test_prefetch_serial(self, mocker):
+        mocker.patch.object(NodePathsCache, 'min_prefetch_nodes', 2)
+        executor_mock = mocker.patch(
+            'caret_analyze.architecture.architecture_loaded.ProcessPoolExecutor')
+
+        nodes = [self.create_node('/sub', f'/pub_{i}') for i in range(3)]
+        NodePathsCache.prefetch(nodes)
+        NodePathsCache.prefetch(nodes, 1)
+        assert executor_mock.call_count == 0
+
+        thread_stopped = Event()
+        thread = Thread(target=thread_stopped.wait)
+        thread.start()
+        try:
+            NodePathsCache.prefetch(nodes, 2)
+        finally:
+            thread_stopped.set()
+            thread.join()
+        assert executor_mock.call_count == 0
+        assert len(NodePathsCache._entries) == 0
+
+    def test_prefetch_failed(self, mocker):
+        mocker.patch.object(NodePathsCache, 'min_prefetch_nodes', 2)
+        executor_mock = mocker.MagicMock()
+        mocker.patch.object(executor_mock, 'map', side_effect=BrokenProcessPool(''))
+        mocker.patch('caret_analyze.architecture.architecture_loaded.ProcessPoolExecutor',
+                     return_value=executor_mock)
+
+        nodes = [self.create_node('/sub', f'/pub_{i}') for i in range(3)]
+        NodePathsCache.prefetch(nodes, 2)
+        assert executor_mock.map.call_count == 1
+        assert len(NodePathsCache._entries) == 0
+
+
 class TestTopicIgnoreReader:
 
     def test_get_publishers(self, mocker):
@@ -18,14 +18,15 @@ from caret_analyze.architecture.graph_search import (CallbackPathSearcher,
                                                      GraphNode, GraphPath,
                                                      GraphPathCore,
                                                      NodePathSearcher)
-from caret_analyze.architecture.struct import (CallbackStruct,
+from caret_analyze.architecture.struct import (CallbackGroupStruct, CallbackStruct,
                                                CommunicationStruct,
                                                NodePathStruct, NodeStruct,
                                                PathStruct,
-                                               PublisherStruct, SubscriptionStruct,
+                                               PublisherStruct, SubscriptionCallbackStruct,
+                                               SubscriptionStruct,
                                                VariablePassingStruct)
-from caret_analyze.exceptions import ItemNotFoundError
-from caret_analyze.value_objects import (CommunicationStructValue,
+from caret_analyze.exceptions import ItemNotFoundError, MultipleItemFoundError
+from caret_analyze.value_objects import (CallbackGroupType, CommunicationStructValue,
                                          NodePathStructValue)
 
 
@@ -187,6 +188,66 @@ class TestGraphCore:
             ] in r
         assert [GraphEdgeCore(0, 1), GraphEdgeCore(1, 3)] in r
 
+    def test_iter_paths_lazy(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(1, 3)
+        g.add_edge(1, 2)
+        g.add_edge(2, 1)
+
+        paths = g.iter_paths(0, 3)
+        assert next(paths) == [
+            GraphEdgeCore(0, 1), GraphEdgeCore(1, 2), GraphEdgeCore(2, 1), GraphEdgeCore(1, 3)
+        ]
+        assert list(paths) == [[GraphEdgeCore(0, 1), GraphEdgeCore(1, 3)]]
+        assert list(g.iter_paths(0, 3)) == g.search_paths(0, 3)
+
+    def test_distances(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(0, 2)
+        g.add_edge(3, 0)
+
+        assert g.distances_to(2) == {2: 0, 1: 1, 0: 1, 3: 2}
+        assert g.distances_from(0) == {0: 0, 1: 1, 2: 1}
+
+        g.add_edge(2, 4)
+        assert g.distances_from(0) == {0: 0, 1: 1, 2: 1, 4: 2}
+
+    def test_search_depth_limit(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(2, 3)
+        g.add_edge(0, 3)
+        g.add_edge(0, 4)
+
+        assert g.search_paths(0, 3, 1) == [[GraphEdgeCore(0, 3)]]
+        assert len(g.search_paths(0, 3, 2)) == 2
+
+    def test_search_bidirectional(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(0, 2)
+        g.add_edge(1, 3)
+        g.add_edge(3, 4)
+        g.add_edge(3, 2)
+        g.add_edge(2, 1)
+        g.add_edge(2, 4)
+        g.add_edge(4, 0)
+
+        for start, goal in [(0, 4), (0, 0), (2, 3)]:
+            for max_depth in range(5):
+                r = g.search_paths(start, goal, max_depth)
+                r_bidirectional = list(g.iter_paths_bidirectional(start, goal, max_depth))
+                assert len(r_bidirectional) == len(r)
+                assert all(path in r for path in r_bidirectional)
+
     # def test_measure_performance(self):
     #     num = 5000
     #     g = GraphCore()
@@ -408,8 +469,6 @@ class TestCallbackPathSearcher:
         mocker.patch.object(node_mock, 'callbacks', [pub_cb_mock, sub_cb_mock])
         mocker.patch.object(node_mock, 'variable_passings', [var_pas_mock])
 
-        searcher = CallbackPathSearcher(node_mock)
-
         sub_info_mock = mocker.Mock(spec=SubscriptionStruct)
         pub_info_mock = mocker.Mock(spec=PublisherStruct)
 
@@ -421,6 +480,8 @@ class TestCallbackPathSearcher:
         mocker.patch.object(var_pas_mock, 'callback_name_read', 'cb1')
         mocker.patch.object(var_pas_mock, 'callback_name_write', 'cb0')
 
+        searcher = CallbackPathSearcher(node_mock)
+
         graph_node_mock_0 = GraphNode(
             CallbackPathSearcher._to_node_point_name(sub_cb_mock.callback_name, 'read')
         )
@@ -460,6 +521,31 @@ class TestCallbackPathSearcher:
             '/node', sub_info_mock, None, tuple(chain), None)
         assert node_path.to_value() == expected.to_value()
 
+    def test_search_structs(self, mocker):
+        cb_0 = SubscriptionCallbackStruct('/node', 'symbol', '/sub', None, 0, 'cb0')
+        cb_1 = SubscriptionCallbackStruct('/node', 'symbol', '/sub_', ['/pub'], 1, 'cb1')
+        var_pass = VariablePassingStruct('/node', cb_0, cb_1)
+        sub = SubscriptionStruct('/node', '/sub', cb_0)
+        pub = PublisherStruct('/node', '/pub', [cb_1])
+        cbg = CallbackGroupStruct(
+            CallbackGroupType.MUTUALLY_EXCLUSIVE, '/node', [cb_0, cb_1], 'cbg')
+        node = NodeStruct('/node', [pub], [sub], [], [], [], [cbg], [var_pass])
+
+        searcher = CallbackPathSearcher(node)
+        get_publisher_spy = mocker.spy(NodeStruct, 'get_publisher')
+
+        for _ in range(2):
+            paths = searcher.search(cb_0, cb_1)
+            assert len(paths) == 1
+            assert paths[0].subscription is sub
+            assert paths[0].publisher is pub
+            assert [id(_) for _ in paths[0].child] == [id(cb_0), id(var_pass), id(cb_1)]
+        assert get_publisher_spy.call_count == 1
+
+        node_dup = NodeStruct('/node', [pub], [sub], [], [], [], [cbg], [var_pass, var_pass])
+        with pytest.raises(MultipleItemFoundError):
+            CallbackPathSearcher(node_dup).search(cb_0, cb_1)
+
 
 class TestNodePathSearcher:
 
@@ -489,16 +575,16 @@ class TestNodePathSearcher:
         dst_node = GraphNode('end_node_name')
 
         graph_path_mock = mocker.Mock(spec=GraphPathCore)
-        mocker.patch.object(graph_mock, 'search_paths',
-                            return_value=[graph_path_mock])
+        mocker.patch.object(graph_mock, 'iter_paths',
+                            return_value=iter([graph_path_mock]))
 
         path_mock = mocker.Mock(spec=PathStruct)
         mocker.patch.object(searcher, '_to_path', return_value=path_mock)
         paths = searcher.search('start_node_name', 'end_node_name')
 
         assert paths == [path_mock]
-        assert graph_mock.search_paths.call_args == (
-            (src_node, dst_node), {'max_depth': 0})
+        assert graph_mock.iter_paths.call_args == (
+            (src_node, dst_node), {'max_depth': 0, 'bidirectional': False})
 
     def test_to_path(self, mocker):
         node_name = '/node'
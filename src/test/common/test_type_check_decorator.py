@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from caret_analyze.common.type_check_decorator import type_check_decorator
 from caret_analyze.exceptions import UnsupportedTypeError
@@ -63,6 +63,24 @@ class TestTypeCheckDecorator:
             iterable_arg([True, 10])
         assert "'i'[1] must be 'bool'. The given argument type is 'int'" in str(e.value)
 
+    def test_type_check_decorator_nested_iterable(self):
+        @type_check_decorator
+        def nested_iterable_arg(i: List[Tuple[bool, bool]]):
+            pass
+
+        with pytest.raises(UnsupportedTypeError) as e:
+            nested_iterable_arg([(True, True), (True, 10)])
+        assert "'i'[1][1] must be 'bool'. The given argument type is 'int'" in str(e.value)
+
+    def test_type_check_decorator_var_positional(self):
+        @type_check_decorator
+        def var_positional_arg(b: bool, *v: bool):
+            pass
+
+        with pytest.raises(UnsupportedTypeError) as e:
+            var_positional_arg(True, True, 10)
+        assert "'v'[1] must be 'bool'. The given argument type is 'int'" in str(e.value)
+
     def test_type_check_decorator_dict(self):
         @type_check_decorator
         def dict_arg(d: Dict[str, bool]):
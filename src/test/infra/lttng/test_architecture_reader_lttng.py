@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+from caret_analyze.exceptions import UnsupportedTypeError
 from caret_analyze.infra.lttng import Lttng
 from caret_analyze.infra.lttng.architecture_reader_lttng import \
     ArchitectureReaderLttng
@@ -22,41 +23,63 @@ from caret_analyze.value_objects import (CallbackGroupValue, ExecutorValue,
                                          SubscriptionCallbackValue,
                                          TimerCallbackValue)
 
+import pytest
+
 
 class TestArchitectureReaderLttng:
 
+    def test_share_lttng(self, mocker):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        node = NodeValueWithId('node_name', 'node_id')
+        mocker.patch.object(lttng_mock, 'get_nodes', return_value=[node])
+
+        reader = ArchitectureReaderLttng(lttng_mock)
+        assert reader.get_nodes() == [node]
+
+        lttng_init_mock = mocker.patch(
+            'caret_analyze.infra.lttng.architecture_reader_lttng.Lttng')
+        ArchitectureReaderLttng('trace_dir')
+        assert lttng_init_mock.call_count == 1
+
+    def test_unsupported_type(self):
+        with pytest.raises(UnsupportedTypeError):
+            ArchitectureReaderLttng(None)  # type: ignore
+
     def test_get_nodes(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
 
         mocker.patch.object(lttng_mock, 'get_nodes', return_value=[])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_nodes() == []
 
         node = NodeValueWithId('node_name', 'node_id')
         mocker.patch.object(lttng_mock, 'get_nodes', return_value=[node])
-        reader = ArchitectureReaderLttng(lttng_mock)
+        reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_nodes() == [node]
 
     def test_get_publishers(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
 
         mocker.patch.object(lttng_mock, 'get_publishers', return_value=[])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         node = NodeValueWithId('node_name', 'node_id')
         assert reader.get_publishers(node) == []
 
         pub_mock = mocker.Mock(spec=PublisherValue)
         mocker.patch.object(lttng_mock, 'get_publishers', return_value=[pub_mock])
-        reader = ArchitectureReaderLttng(lttng_mock)
+        reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_publishers(node) == [pub_mock]
 
     def test_get_timer_callbacks(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
 
         mocker.patch.object(lttng_mock, 'get_timer_callbacks', return_value=[])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
 
         node = NodeValueWithId('node_name', 'node_id')
@@ -64,14 +87,15 @@ class TestArchitectureReaderLttng:
 
         timer_cb_mock = mocker.Mock(spec=TimerCallbackValue)
         mocker.patch.object(lttng_mock, 'get_timer_callbacks', return_value=[timer_cb_mock])
-        reader = ArchitectureReaderLttng(lttng_mock)
+        reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_timer_callbacks(node) == [timer_cb_mock]
 
     def test_get_subscription_callbacks(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
 
         mocker.patch.object(lttng_mock, 'get_subscription_callbacks', return_value=[])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         node = NodeValueWithId('node_name', 'node_id')
         assert reader.get_subscription_callbacks(node) == []
@@ -79,7 +103,8 @@ class TestArchitectureReaderLttng:
         subscription_cb_mock = mocker.Mock(spec=SubscriptionCallbackValue)
         mocker.patch.object(
             lttng_mock, 'get_subscription_callbacks', return_value=[subscription_cb_mock])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_subscription_callbacks(node) == [subscription_cb_mock]
 
@@ -87,7 +112,8 @@ class TestArchitectureReaderLttng:
         lttng_mock = mocker.Mock(spec=Lttng)
 
         mocker.patch.object(lttng_mock, 'get_service_callbacks', return_value=[])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         node = NodeValueWithId('node_name', 'node_id')
         assert reader.get_service_callbacks(node) == []
@@ -95,7 +121,8 @@ class TestArchitectureReaderLttng:
         service_cb_mock = mocker.Mock(spec=ServiceCallbackValue)
         mocker.patch.object(
             lttng_mock, 'get_service_callbacks', return_value=[service_cb_mock])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_service_callbacks(node) == [service_cb_mock]
 
@@ -103,32 +130,37 @@ class TestArchitectureReaderLttng:
         lttng_mock = mocker.Mock(spec=Lttng)
 
         mocker.patch.object(lttng_mock, 'get_executors', return_value=[])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_executors() == []
 
         exec_mock = mocker.Mock(spec=ExecutorValue)
         mocker.patch.object(lttng_mock, 'get_executors', return_value=[exec_mock])
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_executors() == [exec_mock]
 
     def test_get_variable_passings(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         node = NodeValueWithId('node_name', 'node_id')
         assert reader.get_variable_passings(node) == []
 
     def test_get_named_paths(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         assert reader.get_paths() == []
 
     def test_get_subscriptions(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
 
         mocker.patch.object(
@@ -163,7 +195,8 @@ class TestArchitectureReaderLttng:
 
     def test_get_callback_groups(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
-        mocker.patch('caret_analyze.infra.lttng.lttng.Lttng', return_value=lttng_mock)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
         reader = ArchitectureReaderLttng('trace_dir')
         mocker.patch.object(lttng_mock, 'get_callback_groups', return_value=[])
         node_ = NodeValueWithId('node_name', 'node_id')
@@ -0,0 +1,107 @@
+# Copyright 2021 Research Institute of Systems Planning, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from caret_analyze.exceptions import ItemNotFoundError, MultipleItemFoundError
+from caret_analyze.infra.lttng import Lttng
+from caret_analyze.infra.lttng.bridge import LttngBridge
+from caret_analyze.infra.lttng.value_objects import (NodeValueLttng,
+                                                     PublisherValueLttng,
+                                                     SubscriptionCallbackValueLttng,
+                                                     TimerCallbackValueLttng)
+from caret_analyze.value_objects import (PublisherStructValue,
+                                         SubscriptionCallbackStructValue,
+                                         TimerCallbackStructValue)
+
+import pytest
+
+
+def create_timer_callback(node_name: str, node_id: str, period_ns: int):
+    return TimerCallbackValueLttng(
+        f'timer_{node_id}_{period_ns}', node_id, node_name, 'symbol', period_ns,
+        0, None, 0, 0)
+
+
+def create_subscription_callback(node_name: str, node_id: str, topic_name: str):
+    return SubscriptionCallbackValueLttng(
+        f'sub_{node_id}_{topic_name}', node_id, node_name, 'symbol', topic_name,
+        None, 0, 0, None, None, 0)
+
+
+def create_publisher(node_name: str, node_id: str, topic_name: str):
+    return PublisherValueLttng(node_name, topic_name, node_id, None, 0, None)
+
+
+@pytest.fixture
+def create_bridge(mocker):
+    def _create_bridge(timer_callbacks, subscription_callbacks, publishers):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        node_ids = {
+            (_.node_name, _.node_id)
+            for _ in timer_callbacks + subscription_callbacks + publishers
+        }
+        nodes = [NodeValueLttng(node_name, node_id) for node_name, node_id in sorted(node_ids)]
+        mocker.patch.object(lttng_mock, 'get_nodes', return_value=nodes)
+
+        def filter_node(values):
+            return lambda node: [_ for _ in values if _.node_id == node.node_id]
+
+        mocker.patch.object(lttng_mock, 'get_timer_callbacks',
+                            side_effect=filter_node(timer_callbacks))
+        mocker.patch.object(lttng_mock, 'get_subscription_callbacks',
+                            side_effect=filter_node(subscription_callbacks))
+        mocker.patch.object(lttng_mock, 'get_publishers',
+                            side_effect=filter_node(publishers))
+        return LttngBridge(lttng_mock), lttng_mock
+    return _create_bridge
+
+
+class TestLttngBridge:
+
+    def test_get_timer_callback(self, create_bridge):
+        timer_cb = create_timer_callback('/node', 'node_0', 100)
+        timer_cb_dup = create_timer_callback('/node_dup', 'node_1', 100)
+        timer_cb_dup_ = create_timer_callback('/node_dup', 'node_2', 100)
+        bridge, lttng_mock = create_bridge([timer_cb, timer_cb_dup, timer_cb_dup_], [], [])
+
+        struct = TimerCallbackStructValue('/node', 'symbol', 100, None, 0, 'cb')
+        assert bridge.get_timer_callback(struct) == timer_cb
+        assert bridge.get_timer_callback(struct) == timer_cb
+        assert lttng_mock.get_timer_callbacks.call_count == 3
+
+        with pytest.raises(ItemNotFoundError):
+            bridge.get_timer_callback(
+                TimerCallbackStructValue('/node', 'symbol', 200, None, 0, 'cb'))
+        with pytest.raises(MultipleItemFoundError):
+            bridge.get_timer_callback(
+                TimerCallbackStructValue('/node_dup', 'symbol', 100, None, 0, 'cb'))
+
+    def test_get_subscription_callback(self, create_bridge):
+        sub_cb = create_subscription_callback('/node', 'node_0', '/topic')
+        bridge, _ = create_bridge([], [sub_cb], [])
+
+        struct = SubscriptionCallbackStructValue('/node', 'symbol', '/topic', None, 0, 'cb')
+        assert bridge.get_subscription_callback(struct) == sub_cb
+
+        with pytest.raises(ItemNotFoundError):
+            bridge.get_subscription_callback(
+                SubscriptionCallbackStructValue('/node', 'symbol', '/topic_', None, 0, 'cb'))
+
+    def test_get_publishers(self, create_bridge):
+        pub = create_publisher('/node', 'node_0', '/topic')
+        pub_ = create_publisher('/node', 'node_1', '/topic')
+        pub_other = create_publisher('/node', 'node_0', '/topic_')
+        bridge, _ = create_bridge([], [], [pub, pub_, pub_other])
+
+        assert bridge.get_publishers(PublisherStructValue('/node', '/topic', None)) == [pub, pub_]
+        assert bridge.get_publishers(PublisherStructValue('/node_', '/topic', None)) == []
@@ -127,3 +127,40 @@ class TestEventCounter:
         logger.propagate = True
 
         EventCounter(data)
+
+    def test_build_count_df_names(self):
+        data = Ros2DataModel()
+        data.add_node(0, 1, 0, 0, 'node', '/ns')
+        data.add_publisher(2, 0, 1, 0, '/pub_topic', 0)
+        data.add_rcl_subscription(3, 0, 1, 0, '/sub_topic', 0)
+        data.add_rclcpp_subscription(4, 0, 3)
+        data.add_timer_node_link(5, 0, 1)
+        data.add_callback_object(4, 0, 6)
+        data.add_callback_object(5, 0, 7)
+        for _ in range(3):
+            data.add_callback_start_instance(0, 6, False)
+        data.add_callback_start_instance(0, 7, False)
+        data.add_callback_start_instance(0, 8, False)
+        data.add_rclcpp_publish_instance(0, 0, 2, 0, 0)
+        data.finalize()
+
+        df = EventCounter._build_count_df(data)
+        df = df[df['trace_point'].isin(['ros2:callback_start', 'ros2:rclcpp_publish'])]
+        assert sorted(map(tuple, df.values.tolist())) == [
+            ('-', '-', 1, 'ros2:callback_start'),
+            ('/ns/node', '-', 1, 'ros2:callback_start'),
+            ('/ns/node', '/pub_topic', 1, 'ros2:rclcpp_publish'),
+            ('/ns/node', '/sub_topic', 3, 'ros2:callback_start'),
+        ]
+
+    def test_count_lazily(self, mocker):
+        data = Ros2DataModel()
+        data.finalize()
+        build_mock = mocker.spy(EventCounter, '_build_count_df')
+
+        counter = EventCounter(data, validate=False)
+        assert build_mock.call_count == 0
+
+        counter.get_count(['trace_point'])
+        counter.get_count(['node_name'])
+        assert build_mock.call_count == 1
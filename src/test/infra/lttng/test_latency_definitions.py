@@ -23,7 +23,7 @@ from caret_analyze.infra.lttng.value_objects import (
     SubscriptionCallbackValueLttng,
     TimerCallbackValueLttng,
 )
-from caret_analyze.record import RecordsFactory, RecordsInterface
+from caret_analyze.record import merge_sequential, RecordsFactory, RecordsInterface
 from caret_analyze.record.column import ColumnValue
 from caret_analyze.value_objects import (
     CallbackChain,
@@ -58,15 +58,16 @@ def bridge_mock(
     return bridge_mock
 
 
-@pytest.fixture
+@pytest.fixture(params=[False, True], ids=['whole_trace', 'on_demand'])
 def create_lttng(
     mocker,
     bridge_mock,
+    request,
 ):
     def _lttng(data: Ros2DataModel):
         mocker.patch.object(Lttng, '_parse_lttng_data',
                             return_value=(data, None, 0, 1))
-        lttng = Lttng('', validate=False)
+        lttng = Lttng('', validate=False, on_demand_records=request.param)
         # mocker.patch.object(lttng, '_bridge',  bridge_mock)
         return lttng
     return _lttng
@@ -448,6 +449,53 @@ class TestCallbackRecords:
 
         assert df.equals(df_expect)
 
+    def test_pairing_equals_merge_sequential(
+        self,
+        create_lttng,
+    ):
+        data = Ros2DataModel()
+        # callback 1: the second start has no end and the last end has no start.
+        data.add_callback_start_instance(1, 1, False)
+        data.add_callback_end_instance(2, 1)
+        data.add_callback_start_instance(3, 1, False)
+        data.add_callback_start_instance(5, 1, False)
+        data.add_callback_end_instance(6, 1)
+        data.add_callback_end_instance(7, 1)
+        # callback 2: interleaved with callback 1, and an end equals the next start.
+        data.add_callback_start_instance(2, 2, True)
+        data.add_callback_end_instance(4, 2)
+        data.add_callback_start_instance(4, 2, True)
+        data.add_callback_end_instance(8, 2)
+        # callback 3: end only.
+        data.add_callback_end_instance(9, 3)
+        data.finalize()
+
+        expect = merge_sequential(
+            left_records=data.callback_start_instances.clone(),
+            right_records=data.callback_end_instances.clone(),
+            left_stamp_key='callback_start_timestamp',
+            right_stamp_key='callback_end_timestamp',
+            join_left_key='callback_object',
+            join_right_key='callback_object',
+            columns=[
+                'callback_start_timestamp',
+                'callback_end_timestamp',
+                'callback_object',
+                'is_intra_process',
+            ],
+            how='inner',
+        )
+        expect.drop_columns(['is_intra_process'])
+
+        lttng = create_lttng(data)
+        assert lttng.compose_callback_records().equals(expect)
+
+        for callback_object in [1, 2, 3, 4]:
+            expect_ = expect.clone()
+            expect_.filter_if(lambda x: x.get('callback_object') == callback_object)
+            records = lttng.compose_callback_records_by_object(callback_object)
+            assert records.equals(expect_)
+
 
 class TestPublisherRecords:
 
@@ -488,6 +536,29 @@ class TestPublisherRecords:
 
         assert df.equals(df_expect)
 
+    def test_publishers_sharing_thread(
+        self,
+        create_lttng,
+    ):
+        data = Ros2DataModel()
+        tid = 11
+        # rcl_publish of the first publisher is lost.
+        data.add_rclcpp_publish_instance(tid, 1, 3, 6, 4)
+        data.add_dds_bind_addr_to_stamp(tid, 2, 6, 5)
+        data.add_rclcpp_publish_instance(tid, 3, 7, 8, 9)
+        data.add_rcl_publish_instance(tid, 4, 7, 8)
+        data.add_dds_bind_addr_to_stamp(tid, 5, 8, 10)
+        data.finalize()
+
+        lttng = create_lttng(data)
+        whole = lttng.compose_publish_records()
+
+        for publisher_handle in [3, 7]:
+            expect = whole.clone()
+            expect.filter_if(lambda x: x.get('publisher_handle') == publisher_handle)
+            records = lttng.compose_publish_records_by_handles([publisher_handle])
+            assert records.equals(expect)
+
     def test_single_publisher_without_tilde(
         self,
         create_lttng,
@@ -1591,6 +1662,53 @@ class TestTimerRecords:
 
         assert df.equals(df_expect)
 
+    def test_timer_period_changed(
+        self,
+        mocker,
+        create_lttng,
+        create_timer_struct,
+        create_timer_cb_lttng,
+        bridge_setup_get_callback,
+    ):
+        handle = 5
+        callback_obj = 12
+        tid = 16
+
+        data = Ros2DataModel()
+        data.add_timer(tid, handle, 3, 2)
+        data.add_timer(tid, handle, 8, 5)
+        data.add_callback_start_instance(14, callback_obj, False)
+        data.add_callback_end_instance(15, callback_obj)
+        data.finalize()
+
+        lttng = create_lttng(data)
+        provider = RecordsProviderLttng(lttng)
+        mocker.patch.object(
+            provider, 'is_intra_process_communication', return_value=False)
+
+        timer = create_timer_struct('callback_name', 5)
+        timer_callback_lttng = create_timer_cb_lttng(callback_obj, handle)
+        bridge_setup_get_callback(timer.callback,  timer_callback_lttng)
+
+        records = provider.timer_records(timer)
+        df = records.to_dataframe()
+
+        df_expect = pd.DataFrame(
+            {
+                'callback_name/timer_event_timestamp': [3, 5, 7, 8, 13],
+                'callback_name/callback_start_timestamp': [None, None, None, None, 14],
+                'callback_name/callback_end_timestamp': [None, None, None, None, 15],
+            },
+            columns=[
+                'callback_name/timer_event_timestamp',
+                'callback_name/callback_start_timestamp',
+                'callback_name/callback_end_timestamp',
+            ],
+            dtype='Int64'
+        )
+
+        assert df.equals(df_expect)
+
 
 class TestVarPassRecords:
 
@@ -222,6 +222,8 @@ class TestLttngInfo:
         )
 
         assert timer_cbs_info == [timer_cb_info_expect]
+        assert type(timer_cbs_info[0].callback_object) is int
+        assert type(timer_cbs_info[0].period_ns) is int
 
         assert info.get_timer_callbacks(NodeValue('/', 'id')) == []
 
@@ -962,6 +964,22 @@ class TestDataFrameFormatted:
         ).convert_dtypes()
         assert pub.df.equals(expect)
 
+    def test_add_construction_order(self):
+        data = TracePointData(pd.DataFrame.from_dict([
+            {'timestamp': 3, 'node_handle': 1, 'period': 10, 'symbol': 'a'},
+            {'timestamp': 1, 'node_handle': 1, 'period': 10, 'symbol': 'a'},
+            {'timestamp': 2, 'node_handle': 1, 'period': 20, 'symbol': 'a'},
+            {'timestamp': 4, 'node_handle': 2, 'period': 10, 'symbol': 'a'},
+            {'timestamp': 5, 'node_handle': 1, 'period': 10, 'symbol': 'a'},
+        ]))
+
+        DataFrameFormatted._add_construction_order(
+            data, 'construction_order', 'timestamp', 'node_handle', 'period', 'symbol')
+
+        df = data.df
+        assert list(df['timestamp']) == [1, 2, 3, 4, 5]
+        assert list(df['construction_order']) == [0, 0, 1, 0, 2]
+
     def test_init(self, mocker, create_trace_point_data):
         exec_mock = create_trace_point_data()
         node_mock = create_trace_point_data()
@@ -0,0 +1,154 @@
+# Copyright 2021 Research Institute of Systems Planning, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import gc
+from threading import Barrier
+import time
+
+from caret_analyze.record import ColumnValue, RecordsCache, RecordsFactory
+from caret_analyze.record.records_cache import cached_records_property
+
+import pytest
+
+
+def create_records(size: int):
+    return RecordsFactory.create_instance(
+        [{'value': i} for i in range(size)],
+        [ColumnValue('value')]
+    )
+
+
+class Owner:
+
+    def __init__(self) -> None:
+        self.composed = 0
+
+    @cached_records_property
+    def records(self):
+        self.composed += 1
+        return create_records(10)
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    RecordsCache.clear()
+    RecordsCache.set_max_bytes(None)
+    yield
+    RecordsCache.clear()
+    RecordsCache.set_max_bytes(RecordsCache.DEFAULT_MAX_BYTES)
+
+
+class TestRecordsCache:
+
+    def test_get_or_compose(self):
+        owner_id = RecordsCache.register(Owner())
+        records = create_records(3)
+
+        assert RecordsCache.get_or_compose(owner_id, 'name', lambda: records) is records
+        assert RecordsCache.get_or_compose(owner_id, 'name', create_records) is records
+
+        statistics = RecordsCache.statistics()
+        assert statistics.hits == 1
+        assert statistics.misses == 1
+        assert statistics.entries == 1
+        assert statistics.hit_ratio == 0.5
+        assert statistics.size_bytes == RecordsCache.estimate_size(records)
+
+    def test_evict_least_recently_used(self):
+        owner_id = RecordsCache.register(Owner())
+        size = RecordsCache.estimate_size(create_records(10))
+        RecordsCache.set_max_bytes(size * 2)
+
+        RecordsCache.put(owner_id, 'a', create_records(10))
+        RecordsCache.put(owner_id, 'b', create_records(10))
+        RecordsCache.get(owner_id, 'a')
+        RecordsCache.put(owner_id, 'c', create_records(10))
+
+        assert RecordsCache.get(owner_id, 'b') is None
+        assert RecordsCache.get(owner_id, 'a') is not None
+        assert RecordsCache.get(owner_id, 'c') is not None
+        assert RecordsCache.statistics().evictions == 1
+        assert RecordsCache.statistics().size_bytes == size * 2
+
+    def test_set_max_bytes_evicts(self):
+        owner_id = RecordsCache.register(Owner())
+        RecordsCache.put(owner_id, 'a', create_records(10))
+
+        RecordsCache.set_max_bytes(0)
+        assert RecordsCache.statistics().entries == 0
+        assert RecordsCache.statistics().size_bytes == 0
+
+    def test_discard(self):
+        owner_id = RecordsCache.register(Owner())
+        RecordsCache.put(owner_id, 'a', create_records(10))
+        RecordsCache.put(owner_id, 'b', create_records(10))
+
+        RecordsCache.discard(owner_id, 'a')
+        assert RecordsCache.statistics().entries == 1
+
+        RecordsCache.discard(owner_id)
+        assert RecordsCache.statistics().entries == 0
+        assert RecordsCache.statistics().size_bytes == 0
+
+    def test_compose_once_concurrently(self):
+        owner_id = RecordsCache.register(Owner())
+        barrier = Barrier(4)
+        composed = []
+
+        def compose():
+            composed.append(1)
+            time.sleep(0.05)
+            return create_records(3)
+
+        def get(_):
+            barrier.wait()
+            return RecordsCache.get_or_compose(owner_id, 'name', compose)
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(get, range(4)))
+
+        assert len(composed) == 1
+        assert all(records is results[0] for records in results)
+        assert RecordsCache.statistics().misses == 1
+        assert RecordsCache.statistics().hits == 3
+
+    def test_default_max_bytes(self):
+        assert RecordsCache.DEFAULT_MAX_BYTES is None or RecordsCache.DEFAULT_MAX_BYTES > 0
+
+    def test_discard_on_garbage_collected(self):
+        owner = Owner()
+        owner.records
+        assert RecordsCache.statistics().entries == 1
+
+        del owner
+        gc.collect()
+        assert RecordsCache.statistics().entries == 0
+
+
+class TestCachedRecordsProperty:
+
+    def test_cached(self):
+        owner = Owner()
+
+        assert owner.records is owner.records
+        assert owner.composed == 1
+
+    def test_compose_again_after_eviction(self):
+        owner = Owner()
+        records = owner.records
+        RecordsCache.set_max_bytes(0)
+
+        assert owner.records.equals(records)
+        assert owner.composed == 2
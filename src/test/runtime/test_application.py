@@ -16,6 +16,7 @@
 from caret_analyze.architecture.architecture import Architecture
 from caret_analyze.exceptions import ItemNotFoundError
 from caret_analyze.infra.lttng import Lttng
+from caret_analyze.infra.lttng.ros2_tracing.data_model import Ros2DataModel
 from caret_analyze.runtime.application import Application
 from caret_analyze.runtime.callback import CallbackBase
 from caret_analyze.runtime.communication import Communication
@@ -27,6 +28,61 @@ from caret_analyze.runtime.runtime_loaded import RuntimeLoaded
 import pytest
 
 
+def patch_lookups(mocker, runtime_loaded_mock):
+    def get_nodes(node_name):
+        return [_ for _ in runtime_loaded_mock.nodes if _.node_name == node_name]
+
+    def get_callbacks(callback_name):
+        return [cb for node in runtime_loaded_mock.nodes for cb in node.callbacks
+                if cb.callback_name == callback_name]
+
+    def get_communications(publish_node_name, subscribe_node_name, topic_name):
+        return [_ for _ in runtime_loaded_mock.communications
+                if (_.publish_node_name, _.subscribe_node_name, _.topic_name) ==
+                (publish_node_name, subscribe_node_name, topic_name)]
+
+    def get_paths(path_name):
+        return [_ for _ in runtime_loaded_mock.paths if _.path_name == path_name]
+
+    mocker.patch.object(runtime_loaded_mock, 'get_nodes', side_effect=get_nodes)
+    mocker.patch.object(runtime_loaded_mock, 'get_callbacks', side_effect=get_callbacks)
+    mocker.patch.object(runtime_loaded_mock, 'get_communications', side_effect=get_communications)
+    mocker.patch.object(runtime_loaded_mock, 'get_paths', side_effect=get_paths)
+
+
+def create_pub_sub_data(message_count: int) -> Ros2DataModel:
+    data = Ros2DataModel()
+    data.add_node(0, 1, 0, 0, 'pub_node', '/')
+    data.add_node(0, 2, 0, 0, 'sub_node', '/')
+    data.add_timer(0, 10, 0, 100)
+    data.add_timer_node_link(10, 0, 1)
+    data.add_callback_object(10, 0, 11)
+    data.add_callback_symbol(11, 0, 'timer_cb')
+    data.add_publisher(20, 0, 1, 0, '/topic', 1)
+    data.add_rcl_subscription(30, 0, 2, 0, '/topic', 1)
+    data.add_rclcpp_subscription(31, 0, 30)
+    data.add_callback_object(31, 0, 32)
+    data.add_callback_symbol(32, 0, 'sub_cb')
+    data.add_executor(40, 0, 'single_threaded_executor')
+    data.add_callback_group(40, 0, 41, 'mutually_exclusive')
+    data.add_callback_group(40, 0, 42, 'mutually_exclusive')
+    data.callback_group_add_timer(41, 0, 10)
+    data.callback_group_add_subscription(42, 0, 30)
+    for i in range(message_count):
+        t = 1000 * (i + 1)
+        data.add_callback_start_instance(t, 11, False)
+        data.add_rclcpp_publish_instance(0, t + 1, 20, 500 + i, t)
+        data.add_rcl_publish_instance(0, t + 2, 20, 500 + i)
+        data.add_dds_write_instance(0, t + 3, 500 + i)
+        data.add_dds_bind_addr_to_stamp(0, t + 4, 500 + i, 700 + i)
+        data.add_callback_end_instance(t + 5, 11)
+        data.add_dispatch_subscription_callback_instance(t + 6, 32, 600 + i, 700 + i, t)
+        data.add_callback_start_instance(t + 7, 32, False)
+        data.add_callback_end_instance(t + 8, 32)
+    data.finalize()
+    return data
+
+
 class TestApplication:
 
     def test_empty_architecture(self, mocker):
@@ -37,6 +93,7 @@ class TestApplication:
         mocker.patch.object(assigned_mock, 'executors', [])
         mocker.patch.object(assigned_mock, 'paths', [])
         mocker.patch.object(assigned_mock, 'communications', [])
+        patch_lookups(mocker, assigned_mock)
         mocker.patch(
             'caret_analyze.runtime.runtime_loaded.RuntimeLoaded', return_value=assigned_mock)
         records_provider_mock = mocker.Mock(spec=Lttng)
@@ -94,6 +151,7 @@ class TestApplication:
         mocker.patch.object(records_assigned_mock, 'paths', [path_mock])
         mocker.patch.object(records_assigned_mock,
                             'communications', [comm_mock])
+        patch_lookups(mocker, records_assigned_mock)
 
         # test scenario
         app = Application(arch_mock, records_provider_mock)
@@ -149,6 +207,7 @@ class TestApplication:
         mocker.patch.object(records_assigned_mock, 'paths', [path_mock])
         mocker.patch.object(records_assigned_mock,
                             'communications', [comm_mock])
+        patch_lookups(mocker, records_assigned_mock)
 
         app = Application(arch_mock, records_provider_mock)
 
@@ -156,3 +215,69 @@ class TestApplication:
         assert app.get_callbacks('*') == [callback_mock0, callback_mock1]
         assert app.get_callbacks('cbb*') == []
         assert app.get_callbacks('cb_?') == [callback_mock1]
+        assert app.get_callbacks('cb_?', 'cb_abcdefg', 'cb*') == \
+            [callback_mock1, callback_mock0, callback_mock0, callback_mock1]
+
+        find_similar_one_mock = mocker.patch(
+            'caret_analyze.common.Util.find_similar_one', side_effect=ItemNotFoundError(''))
+        assert app.get_callback('cb_b') == callback_mock1
+        assert app.get_callbacks('cb_x') == []
+        assert find_similar_one_mock.call_count == 1
+
+    def test_prefetch_path_records(self, mocker):
+        arch_mock = mocker.Mock(spec=Architecture)
+        records_provider_mock = mocker.Mock(spec=Lttng)
+
+        node_path_mock = mocker.Mock()
+        comm_mock = mocker.Mock(spec=Communication)
+        path_mock = mocker.Mock(spec=Path)
+        path_mock_ = mocker.Mock(spec=Path)
+        mocker.patch.object(path_mock, 'path_name', 'path_name_')
+        mocker.patch.object(path_mock, 'child', [node_path_mock, comm_mock])
+        mocker.patch.object(path_mock_, 'path_name', 'path_name__')
+        mocker.patch.object(path_mock_, 'child', [node_path_mock])
+
+        assigned_mock = mocker.Mock(spec=RuntimeLoaded)
+        mocker.patch.object(assigned_mock, 'nodes', [])
+        mocker.patch.object(assigned_mock, 'executors', [])
+        mocker.patch.object(assigned_mock, 'paths', [path_mock, path_mock_])
+        mocker.patch.object(assigned_mock, 'communications', [])
+        patch_lookups(mocker, assigned_mock)
+        mocker.patch(
+            'caret_analyze.runtime.runtime_loaded.RuntimeLoaded', return_value=assigned_mock)
+        prefetch_mock = mocker.patch(
+            'caret_analyze.runtime.application.prefetch_records')
+
+        app = Application(arch_mock, records_provider_mock)
+        app.prefetch_path_records(['path_name_'], 4)
+
+        assert prefetch_mock.call_args_list == [
+            mocker.call([node_path_mock, comm_mock], 4),
+            mocker.call([path_mock], 1),
+        ]
+
+        prefetch_mock.reset_mock()
+        app.prefetch_path_records()
+        assert prefetch_mock.call_args_list == [
+            mocker.call([node_path_mock, comm_mock], None),
+            mocker.call([path_mock, path_mock_], 1),
+        ]
+
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_prefetch_path_records_equals_serial(self, mocker, max_workers):
+        def create_app() -> Application:
+            mocker.patch.object(
+                Lttng, '_parse_lttng_data', return_value=(create_pub_sub_data(3), None, 0, 1))
+            lttng = Lttng('', validate=False)
+            arch = Architecture('lttng', lttng)
+            arch.add_path('path', arch.search_paths('/pub_node', '/sub_node')[0])
+            return Application(arch, lttng)
+
+        expect = create_app().get_path('path').to_dataframe()
+        assert len(expect) == 3
+
+        app = create_app()
+        app.prefetch_path_records(['path'], max_workers)
+        path = app.get_path('path')
+        assert path._is_records_cached()
+        assert path.to_dataframe().equals(expect)
@@ -35,7 +35,7 @@ class TestPath:
         mocker.patch('caret_analyze.runtime.path.RecordsMerged',
                      return_value=records_merged_mock)
 
-        records_mock = mocker.Mock(spec=RecordsInterface)
+        records_mock = mocker.MagicMock(spec=RecordsInterface)
         mocker.patch.object(records_mock, 'clone', return_value=records_mock)
         mocker.patch.object(records_mock, 'columns', [])
 
@@ -329,3 +329,94 @@ class TestRecordsMerged:
             ]
         )
         assert records.equals(expected)
+
+    def test_shared_prefix(self, mocker):
+        cb_records = Records(
+            [
+                Record({'callback_start': 0, 'pub': 2}),
+                Record({'callback_start': 6, 'pub': 8}),
+            ],
+            [
+                ColumnValue('callback_start'),
+                ColumnValue('pub'),
+            ]
+        )
+        comm_records = Records(
+            [
+                Record({'pub': 2, 'callback_start': 6}),
+                Record({'pub': 8, 'callback_start': 12}),
+            ],
+            [
+                ColumnValue('pub'),
+                ColumnValue('callback_start'),
+            ]
+        )
+
+        def create_element(spec, records):
+            element = mocker.Mock(spec=spec)
+            mocker.patch.object(element, 'to_records', side_effect=lambda: records.clone())
+            return element
+
+        node_path_0 = create_element(NodePath, cb_records)
+        comm_path = create_element(Communication, comm_records)
+        node_path_1 = create_element(NodePath, cb_records)
+        node_path_2 = create_element(NodePath, cb_records)
+
+        path_info_mock = mocker.Mock(spec=PathStructValue)
+        path_1 = Path(path_info_mock, [node_path_0, comm_path, node_path_1], None)
+        path_2 = Path(path_info_mock, [node_path_0, comm_path, node_path_2], None)
+
+        records_1 = RecordsMerged(path_1.child).data
+        records_2 = RecordsMerged(path_2.child).data
+
+        assert node_path_0.to_records.call_count == 1
+        assert comm_path.to_records.call_count == 1
+        assert records_1.equals(records_2)
+        assert records_1.columns == [
+            'callback_start/0', 'pub/0', 'callback_start/1', 'pub/1'
+        ]
+        assert len(records_1) == 2
+
+    def test_merge_long_path(self, mocker):
+        def create_element(spec, columns, rows):
+            element = mocker.Mock(spec=spec)
+            records = Records(
+                [Record(dict(zip(columns, row))) for row in rows],
+                [ColumnValue(column) for column in columns]
+            )
+            mocker.patch.object(element, 'to_records', side_effect=lambda: records.clone())
+            return element
+
+        node_columns = ['callback_start', 'pub']
+        comm_columns = ['pub', 'callback_start']
+        targets = [
+            create_element(NodePath, node_columns, [(0, 1), (10, 11)]),
+            create_element(Communication, comm_columns, [(1, 2), (11, 12)]),
+            create_element(NodePath, node_columns, [(2, 3), (12, 13)]),
+            create_element(Communication, comm_columns, [(3, 4)]),
+            create_element(NodePath, node_columns, [(4, 5)]),
+        ]
+
+        records = RecordsMerged(targets).data
+
+        expected = Records(
+            [
+                Record({
+                    'callback_start/0': 0, 'pub/0': 1, 'callback_start/1': 2,
+                    'pub/1': 3, 'callback_start/2': 4, 'pub/2': 5
+                }),
+                Record({
+                    'callback_start/0': 10, 'pub/0': 11, 'callback_start/1': 12,
+                    'pub/1': 13
+                }),
+            ],
+            [
+                ColumnValue('callback_start/0'),
+                ColumnValue('pub/0'),
+                ColumnValue('callback_start/1'),
+                ColumnValue('pub/1'),
+                ColumnValue('callback_start/2'),
+                ColumnValue('pub/2'),
+            ]
+        )
+        assert records.equals(expected)
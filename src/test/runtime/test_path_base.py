@@ -13,10 +13,18 @@
 # limitations under the License.
 
 
+from concurrent.futures.process import BrokenProcessPool
+from threading import Event, Thread
 from typing import List
 
-from caret_analyze.record import Records, RecordsInterface
-from caret_analyze.runtime.path_base import PathBase
+from caret_analyze.record import ColumnValue, Records, RecordsFactory, RecordsInterface
+from caret_analyze.record.data_frame_shaper import Clip
+from caret_analyze.record.records_cache import RecordsCache, records_cache_owner_id
+from caret_analyze.runtime.path_base import PathBase, prefetch_records
+
+import numpy as np
+import pandas as pd
+import pytest
 
 
 class PathSample(PathBase):
@@ -37,7 +45,7 @@ class TestPathBase:
     def test_cache(self, mocker):
         path = PathSample()
 
-        records_mock = mocker.Mock(spec=Records)
+        records_mock = mocker.MagicMock(spec=Records)
         mocker.patch.object(path, '_to_records_core', return_value=records_mock)
 
         path.to_records()
@@ -49,3 +57,158 @@ class TestPathBase:
         path.clear_cache()
         path.to_records()
         assert path._to_records_core.call_count == 2  # type: ignore
+
+    def test_to_records_without_copy(self):
+        path = StampPath(0)
+
+        assert path.to_records(copy=False) is path.to_records(copy=False)
+        assert path.to_records() is not path.to_records(copy=False)
+        assert path.to_records().equals(path.to_records(copy=False))
+        assert path.column_names == ['stamp']
+        assert path.composed == 1
+
+    def test_to_timeseries(self, mocker):
+        path = PathSample()
+        records = RecordsFactory.create_instance(
+            [
+                {'start': 0, 'middle': 1, 'end': 3},
+                {'start': 10, 'end': 15},
+                {'start': 20, 'middle': 22},
+            ],
+            [ColumnValue('start'), ColumnValue('middle'), ColumnValue('end')]
+        )
+        mocker.patch.object(path, '_to_records_core', return_value=records)
+        mocker.patch.object(PathSample, 'column_names', ['start', 'middle', 'end'])
+
+        t, latency = path.to_timeseries()
+        assert list(t) == [0, 10, 20]
+        assert list(latency[:2]) == [3, 5]
+        assert pd.isnull(latency[2])
+
+        t, latency = path.to_timeseries(remove_dropped=True)
+        assert t.dtype == np.int64
+        assert list(t) == [0]
+        assert list(latency) == [3]
+
+        t, latency = path.to_timeseries(shaper=Clip(5, 30))
+        assert list(t) == [10, 20]
+
+    def test_to_histogram(self, mocker):
+        path = PathSample()
+        records = RecordsFactory.create_instance(
+            [
+                {'start': 0, 'end': 3},
+                {'start': 10, 'end': 15},
+                {'start': 20},
+            ],
+            [ColumnValue('start'), ColumnValue('end')]
+        )
+        mocker.patch.object(path, '_to_records_core', return_value=records)
+        mocker.patch.object(PathSample, 'column_names', ['start', 'end'])
+
+        frequency, latency = path.to_histogram(binsize_ns=1)
+        assert list(frequency) == [1, 1]
+        assert list(latency) == [3, 4, 5]
+        assert latency.dtype == np.float64
+
+        # Bin edges are computed from the object array of latencies with drops.
+        frequency, latency = path.to_histogram(binsize_ns=1, treat_drop_as_delay=True)
+        assert list(frequency) == [1, 1]
+        assert latency.dtype == object
+
+
+class StampPath(PathBase):
+
+    def __init__(self, stamp: int) -> None:
+        super().__init__()
+        self._stamp = stamp
+        self.composed = 0
+
+    def _to_records_core(self) -> RecordsInterface:
+        self.composed += 1
+        return RecordsFactory.create_instance(
+            [{'stamp': self._stamp}], [ColumnValue('stamp')])
+
+
+class TestPrefetchRecords:
+
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_prefetch(self, max_workers):
+        paths = [StampPath(i) for i in range(3)]
+
+        prefetch_records(paths + paths[:1], max_workers)
+
+        for i, path in enumerate(paths):
+            assert path._is_records_cached()
+            assert path.to_records().equals(
+                RecordsFactory.create_instance([{'stamp': i}], [ColumnValue('stamp')]))
+
+    def test_skip_cached(self):
+        path = StampPath(0)
+        path.to_records()
+
+        prefetch_records([path, StampPath(1)], 2)
+        assert path.composed == 1
+
+    def test_serial(self, mocker):
+        mocker.patch.object(RecordsFactory, 'is_cpp_impl_valid', return_value=False)
+        executor_mock = mocker.patch('caret_analyze.runtime.path_base.ProcessPoolExecutor')
+
+        paths = [StampPath(i) for i in range(3)]
+        prefetch_records(paths)
+        assert executor_mock.call_count == 0
+        assert all(path._is_records_cached() for path in paths)
+
+        paths = [StampPath(i) for i in range(3)]
+        thread_stopped = Event()
+        thread = Thread(target=thread_stopped.wait)
+        thread.start()
+        try:
+            prefetch_records(paths, 2)
+        finally:
+            thread_stopped.set()
+            thread.join()
+        assert executor_mock.call_count == 0
+        assert all(path._is_records_cached() for path in paths)
+
+    def test_workers_failed(self, mocker):
+        mocker.patch.object(RecordsFactory, 'is_cpp_impl_valid', return_value=False)
+        executor_mock = mocker.MagicMock()
+        mocker.patch.object(executor_mock, 'map', side_effect=BrokenProcessPool(''))
+        mocker.patch('caret_analyze.runtime.path_base.ProcessPoolExecutor',
+                     return_value=executor_mock)
+
+        paths = [StampPath(i) for i in range(3)]
+        prefetch_records(paths, 2)
+
+        assert executor_mock.map.call_count == 1
+        for i, path in enumerate(paths):
+            assert path.composed == 1
+            assert path.to_records().equals(
+                RecordsFactory.create_instance([{'stamp': i}], [ColumnValue('stamp')]))
+
+    @pytest.mark.parametrize('max_workers', [2, 4])
+    def test_compose_shared_records_once(self, max_workers):
+        shared_owner = PathSample()
+        shared_composed = []
+
+        def compose_shared():
+            shared_composed.append(1)
+            return RecordsFactory.create_instance([{'stamp': 10}], [ColumnValue('stamp')])
+
+        class SharedPath(StampPath):
+
+            def _to_records_core(self) -> RecordsInterface:
+                shared = RecordsCache.get_or_compose(
+                    records_cache_owner_id(shared_owner), 'shared', compose_shared)
+                records = super()._to_records_core()
+                records.concat(shared.clone())
+                return records
+
+        paths = [SharedPath(i) for i in range(4)]
+        prefetch_records(paths, max_workers)
+
+        assert len(shared_composed) == 1
+        for i, path in enumerate(paths):
+            assert path.to_records().equals(RecordsFactory.create_instance(
+                [{'stamp': i}, {'stamp': 10}], [ColumnValue('stamp')]))
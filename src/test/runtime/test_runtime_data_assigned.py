@@ -14,7 +14,7 @@
 
 # from threading import Timer
 from caret_analyze.architecture import Architecture
-from caret_analyze.exceptions import UnsupportedTypeError
+from caret_analyze.exceptions import ItemNotFoundError, UnsupportedTypeError
 from caret_analyze.infra.interface import RecordsProvider
 from caret_analyze.runtime.callback import (CallbackBase, SubscriptionCallback,
                                             TimerCallback)
@@ -128,6 +128,35 @@ class TestNodesLoaded:
         nodes = loaded.data
         assert nodes == [node_mock]
 
+    def test_lazy_construction(self, mocker):
+        node_info_mock_a = mocker.Mock(spec=NodeStructValue)
+        node_info_mock_b = mocker.Mock(spec=NodeStructValue)
+        mocker.patch.object(node_info_mock_a, 'node_name', 'a')
+        mocker.patch.object(node_info_mock_b, 'node_name', 'b')
+
+        provider_mock = mocker.Mock(spec=RecordsProvider)
+
+        def to_runtime(node_info, provider):
+            node_mock = mocker.Mock(spec=Node)
+            mocker.patch.object(node_mock, 'node_name', node_info.node_name)
+            return node_mock
+
+        to_runtime_mock = mocker.patch.object(
+            NodesLoaded, '_to_runtime', side_effect=to_runtime)
+        loaded = NodesLoaded((node_info_mock_a, node_info_mock_b), provider_mock)
+        assert to_runtime_mock.call_count == 0
+
+        node_a = loaded.find_node('a')
+        assert node_a.node_name == 'a'
+        assert to_runtime_mock.call_count == 1
+
+        assert loaded.data[0] is node_a
+        assert loaded.data[1].node_name == 'b'
+        assert to_runtime_mock.call_count == 2
+
+        with pytest.raises(ItemNotFoundError):
+            loaded.find_node('c')
+
     def test_to_runtime_optional_none(self, mocker):
         node_info_mock = mocker.Mock(spec=NodeStructValue)
         mocker.patch.object(node_info_mock, 'node_name', 'node')
@@ -70,6 +70,22 @@ class SampleClassC(ValueObject):
         return self._v
 
 
+class SampleClassD(ValueObject):
+    __slots__ = ('_i', '_v')
+
+    def __init__(self, i: int, v: SampleClassA) -> None:
+        self._i = i
+        self._v = v
+
+    @property
+    def i(self) -> int:
+        return self._i
+
+    @property
+    def v(self) -> SampleClassA:
+        return self._v
+
+
 class TestValueObject:
 
     def test_immutable(self):
@@ -92,6 +108,33 @@ class TestValueObject:
         assert hash(SampleClassA(1, '1', 1)) != hash(SampleClassA(2, '1', 1))
         assert hash(SampleClassA(1, '1', 1)) != hash(SampleClassB(1, '1', 1))
 
+    def test_hash_cached(self, mocker):
+        a = SampleClassA(1, '1', 1)
+        hash_value = hash(a)
+
+        getattr_mock = mocker.patch.object(
+            SampleClassA, 'i', new_callable=mocker.PropertyMock, return_value=2)
+        assert hash(a) == hash_value
+        assert getattr_mock.call_count == 0
+
+    def test_eq_short_circuit(self, mocker):
+        a = SampleClassA(1, '1', 1)
+        b = SampleClassA(1, '2', 1)
+        hash(a)
+        hash(b)
+
+        getattr_mock = mocker.patch.object(
+            SampleClassA, 'i', new_callable=mocker.PropertyMock, return_value=1)
+        assert a == a
+        assert a != b
+        assert getattr_mock.call_count == 0
+
+    def test_pickle(self):
+        import pickle
+        a = SampleClassC(1, '2', 3)
+        hash(a)
+        assert pickle.loads(pickle.dumps(a)) == a
+
     def test_str(self):
         from yaml import dump
         a = SampleClassA(1, '2', 3)
@@ -99,3 +142,15 @@ class TestValueObject:
 
         a = SampleClassC(1, '2', 3)
         assert str(a) == dump({'p': 3, 'v': {'i': 1, 's': '2'}})
+
+    def test_slots(self):
+        import pickle
+        from yaml import dump
+
+        d = SampleClassD(1, SampleClassA(2, '3', 4))
+        assert not hasattr(d, '__dict__')
+        assert d == SampleClassD(1, SampleClassA(2, '3', 4))
+        assert d != SampleClassD(2, SampleClassA(2, '3', 4))
+        assert hash(d) == hash(SampleClassD(1, SampleClassA(2, '3', 4)))
+        assert str(d) == dump({'i': 1, 'v': {'i': 2, 's': '3'}})
+        assert pickle.loads(pickle.dumps(d)) == d